@@ -0,0 +1,122 @@
+"""
+File       : profile_switch_benchmark.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Times switching the settings panel between random profiles, selecting each setting in turn with the
+             comboboxes and their enabled states updated on every change, against the batched
+             SettingsPanel.apply_option_indices.
+             Run from the repository root: python Benchmarks/profile_switch_benchmark.py [profiles]
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import os, sys, random, statistics, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtWidgets import QApplication
+from Window.Settings import SettingsRegistry
+from Window.settings_panel import SettingsPanel
+
+
+# ---------------------------------------------------------------------- #
+#                                                                        #
+# ████                            ██                              ██     #
+# ██  ██    ████  ██████    ████  ██      ██  ██    ████    ████  ██  ██ #
+# ████    ██  ██  ██  ██  ██      ████    ██████  ██  ██  ██      ████   #
+# ██  ██  ████    ██  ██  ██      ██  ██  ██████  ██  ██  ██      ██  ██ #
+# ██████    ████  ██  ██    ████  ██  ██  ██  ██  ██████  ██      ██  ██ #
+#                                                                        #
+# ---------------------------------------------------------------------- #
+
+
+def random_profiles(count: int) -> list:
+    """
+    Generates random profiles as one option index per combobox.
+
+    Args:
+        count (int): Number of profiles.
+
+    Returns:
+        (list): Tuples of option indices, in combobox ID order.
+    """
+    rng = random.Random(0)
+    return [tuple(rng.randrange(len(entry.get_options())) for entry in SettingsRegistry.ENTRIES) for _ in range(count)]
+
+
+def apply_one_by_one(panel: SettingsPanel, indices: tuple) -> None:
+    """
+    Applies a profile as load_settings used to, one setting at a time with its combobox and dependents updated live.
+
+    Args:
+        panel (SettingsPanel): Panel to apply to.
+        indices (tuple): Option index of every combobox.
+
+    Returns:
+        None.
+    """
+    for combobox_id, index in enumerate(indices):
+        panel.settings_model.set_option_index(combobox_id, index)
+
+
+def time_switches(panel: SettingsPanel, profiles: list, apply) -> list:
+    """
+    Times applying every profile in turn.
+
+    Args:
+        panel (SettingsPanel): Panel to apply to.
+        profiles (list): Profiles from random_profiles.
+        apply: Function taking the panel and a profile.
+
+    Returns:
+        (list): Milliseconds per switch.
+    """
+    timings: list = []
+    for indices in profiles:
+        start: float = time.perf_counter()
+        apply(panel, indices)
+        QApplication.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    """
+    Runs both strategies on the same profiles and prints mean and p95 switch latency.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    app = QApplication(sys.argv[:1])
+    panel = SettingsPanel(None)
+    panel.show()
+    profiles: list = random_profiles(count)
+
+    for name, apply in (("one by one", apply_one_by_one),
+                        ("batched", lambda target, indices: target.apply_option_indices(indices))):
+        # Both strategies end in the same enabled states, so they are timed on the same work.
+        time_switches(panel, profiles[:20], apply)
+        timings: list = sorted(time_switches(panel, profiles, apply))
+        p95: float = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"{name:>10}: mean {statistics.mean(timings):.3f} ms, p95 {p95:.3f} ms over {count} switches")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
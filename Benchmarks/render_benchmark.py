@@ -0,0 +1,122 @@
+"""
+File       : render_benchmark.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Times rendering vkBasalt.conf and dxvk.conf for random settings profiles, then writing the rendered files
+             "per line" (one write() per line into a "w+" text file, as the config writer used to) against "single"
+             (one unbuffered write of the whole file). Run from the repository root:
+             python Benchmarks/render_benchmark.py [profiles]
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import os, sys, random, statistics, tempfile, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Window.conf_handler import AppConfHandler
+from Window.settings_code import SettingsCode
+
+
+# ---------------------------------------------------------------------- #
+#                                                                        #
+# ████                            ██                              ██     #
+# ██  ██    ████  ██████    ████  ██      ██  ██    ████    ████  ██  ██ #
+# ████    ██  ██  ██  ██  ██      ████    ██████  ██  ██  ██      ████   #
+# ██  ██  ████    ██  ██  ██      ██  ██  ██████  ██  ██  ██      ██  ██ #
+# ██████    ████  ██  ██    ████  ██  ██  ██  ██  ██████  ██      ██  ██ #
+#                                                                        #
+# ---------------------------------------------------------------------- #
+
+
+def random_records(count: int) -> list:
+    """
+    Builds random settings profiles.
+
+    Args:
+        count (int): Number of profiles.
+
+    Returns:
+        (list): SettingsRecord per profile.
+    """
+    rng = random.Random(41)
+    return [SettingsCode.decode(SettingsCode.from_indices(tuple(rng.randrange(len(options)) for options in SettingsCode.OPTIONS))) for _ in range(count)]
+
+
+def write_per_line(path: str, text: str) -> None:
+    """
+    Writes a config one line per write() call.
+
+    Args:
+        path (str): File to write.
+        text (str): Config text.
+
+    Returns:
+        None.
+    """
+    with open(path, "w+") as conf_file:
+        for line in text.splitlines(keepends=True):
+            conf_file.write(line)
+
+
+def write_single(path: str, text: str) -> None:
+    """
+    Writes a config in one unbuffered write.
+
+    Args:
+        path (str): File to write.
+        text (str): Config text.
+
+    Returns:
+        None.
+    """
+    with open(path, "wb", buffering=0) as conf_file:
+        conf_file.write(text.encode("utf-8"))
+
+
+def main() -> None:
+    """
+    Times rendering and both ways of writing, printing mean and median microseconds per config.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    profiles: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    records: list = random_records(profiles)
+
+    start: float = time.perf_counter()
+    texts: list = []
+    for record in records:
+        texts.append(AppConfHandler.render_vkbasalt(record))
+        texts.append(AppConfHandler.render_dxvk(record))
+    render_us: float = (time.perf_counter() - start) * 1e6 / len(texts)
+    print(f"render: {render_us:.2f} us per config over {len(texts)} configs")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "dxvk.conf")
+        timings: dict = {"per line": [], "single": []}
+        for text in texts:
+            for name, write in (("per line", write_per_line), ("single", write_single)):
+                start = time.perf_counter()
+                write(path, text)
+                timings[name].append((time.perf_counter() - start) * 1e6)
+
+    for name, values in timings.items():
+        print(f"{name:>8}: mean {statistics.mean(values):.2f} us, median {statistics.median(values):.2f} us per config")
+
+
+if __name__ == "__main__":
+    main()
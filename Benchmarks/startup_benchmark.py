@@ -0,0 +1,111 @@
+"""
+File       : startup_benchmark.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Times constructing and showing the settings panel, from SettingsPanel() to the first paint. "eager"
+             builds every tab and tooltip before showing, as the panel did before tabs were built lazily; "lazy" is
+             the panel as it is. Run from the repository root: python Benchmarks/startup_benchmark.py [runs]
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import os, sys, statistics, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt6.QtCore import QEvent
+from PyQt6.QtWidgets import QApplication
+from Window.settings_panel import SettingsPanel
+
+
+# ---------------------------------------------------------------------- #
+#                                                                        #
+# ████                            ██                              ██     #
+# ██  ██    ████  ██████    ████  ██      ██  ██    ████    ████  ██  ██ #
+# ████    ██  ██  ██  ██  ██      ████    ██████  ██  ██  ██      ████   #
+# ██  ██  ████    ██  ██  ██      ██  ██  ██████  ██  ██  ██      ██  ██ #
+# ██████    ████  ██  ██    ████  ██  ██  ██  ██  ██████  ██      ██  ██ #
+#                                                                        #
+# ---------------------------------------------------------------------- #
+
+
+def build_eagerly(panel: SettingsPanel) -> None:
+    """
+    Builds every tab and sets every tooltip, as the panel's constructor used to.
+
+    Args:
+        panel (SettingsPanel): Panel to build.
+
+    Returns:
+        None.
+    """
+    for index in range(panel.tab_widget.count()):
+        panel.build_settings_tab(index)
+    for label in list(panel._pending_tooltips):
+        panel.eventFilter(label, QEvent(QEvent.Type.ToolTip))
+
+
+def time_to_shown(eager: bool) -> float:
+    """
+    Times one settings panel from construction until it has been shown and painted.
+
+    Args:
+        eager (bool): Build every tab and tooltip before showing.
+
+    Returns:
+        (float): Milliseconds.
+    """
+    start: float = time.perf_counter()
+    panel = SettingsPanel(None)
+    if eager:
+        build_eagerly(panel)
+    panel.show()
+    QApplication.processEvents()
+    elapsed: float = (time.perf_counter() - start) * 1000
+
+    panel.close()
+    panel.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+def main() -> None:
+    """
+    Times both startups, alternating them, and prints mean and median time to window shown.
+
+    Args:
+        None.
+
+    Returns:
+        None.
+    """
+    runs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    app = QApplication(sys.argv[:1])
+
+    # Warm up fonts, styles and imports before timing.
+    time_to_shown(True)
+
+    timings: dict = {"eager": [], "lazy": []}
+    for _ in range(runs):
+        timings["eager"].append(time_to_shown(True))
+        timings["lazy"].append(time_to_shown(False))
+
+    for name, values in timings.items():
+        print(f"{name:>5}: mean {statistics.mean(values):.2f} ms, median {statistics.median(values):.2f} ms over {runs} runs")
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
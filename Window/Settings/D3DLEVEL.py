@@ -7,93 +7,20 @@ Contact    :
     Discord - fluffy_flower
 Date       : 23/01/2025
 Version    : 1.0.0
-Description: Contains classes representing various settings related to DirectX feature level, along with a base class for all graphics settings.
+Description: Contains classes representing various settings related to DirectX feature level. Each setting class derives from the shared BaseSetting.
 Each setting class includes attributes for title, options, tooltip header, and tooltip body, along with methods for retrieving these attributes.
 Additionally, global style variables are defined for consistent styling of HTML elements within the settings.
 These settings specifically pertain to the DXVK's DirectX feature level settings.
 """
 
+from Window.Settings.base_setting import BaseSetting
+
 # Global style variables
 header = 'style="font-weight: bold; text-decoration: underline;"'
 bodyTop = 'style="font-weight: bold;"'
 bodyBot = 'style="font-style: italic;"'
 
 
-class BaseSetting:
-    """
-    Base class for all graphics settings.
-
-    Attributes:
-        title (str): Title of the setting.
-        options (list): List of options for the setting.
-        tooltip_header (str): Header text for the tooltip.
-        tooltip_body (str): Body text for the tooltip.
-        rule (bool): Horizontal rule (optional).
-    """
-
-    def __init__(self, title, options, tooltip_header, tooltip_body, rule):
-        """
-        Initializes a graphics setting.
-
-        Args:
-            title (str): Title of the setting.
-            options (list): List of options for the setting.
-            tooltip_header (str): Header text for the tooltip.
-            tooltip_body (str): Body text for the tooltip.
-            rule (bool): Horizontal rule (optional).
-        """
-        self.title = title
-        self.options = options
-        self.tooltip_header = tooltip_header
-        self.tooltip_body = tooltip_body
-        self.rule = rule
-
-    def get_title(self):
-        """
-        Gets the title of the setting.
-
-        Returns:
-            str: Title of the setting.
-        """
-        return self.title
-
-    def get_options(self):
-        """
-        Gets the options of the setting.
-
-        Returns:
-            list: List of options for the setting.
-        """
-        return self.options
-
-    def get_tooltip_header(self):
-        """
-        Gets the header text for the tooltip.
-
-        Returns:
-            str: Header text for the tooltip.
-        """
-        return self.tooltip_header
-
-    def get_tooltip_body(self):
-        """
-        Gets the body text for the tooltip.
-
-        Returns:
-            str: Body text for the tooltip.
-        """
-        return self.tooltip_body
-
-    def get_rule(self):
-        """
-        Gets the boolean value for whether to draw a horizontal rule.
-
-        Returns:
-            bool: True / False
-        """
-        return self.rule
-
-
 class D3D_Level(BaseSetting):
     # Class representing the D3D_Level setting.
 
@@ -18,6 +18,7 @@ This package provides a collection of classes representing various graphics sett
     Subpixel Morphological Anti-Aliasing (SMAA), and
     Vertical Synchronization (VSYNC).
 Each setting class is contained in its respective module and is imported here to provide a convenient interface for users of the package.
+The settings registry lists every setting with its tab, dependencies and config file mapping, and is imported here as well.
 """
 
 from Window.Settings.AF import (
@@ -56,3 +57,10 @@ from Window.Settings.VSYNC import (
     VSync_Level_D3D9,
     Frame_Limit_Enable,
     Frame_Limit, Frame_Limit_D3D9)
+from Window.Settings.base_setting import (
+    BaseSetting)
+from Window.Settings.registry import (
+    DXVK,
+    VKBASALT,
+    SettingEntry,
+    SettingsRegistry)
@@ -0,0 +1,87 @@
+"""
+File       : base_setting.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 1.0.0
+Description: Contains the base class shared by every graphics setting class in this package.
+Each setting class includes attributes for title, options, tooltip header, and tooltip body, along with methods for retrieving these attributes.
+"""
+
+
+class BaseSetting:
+    """
+    Base class for all graphics settings.
+
+    Attributes:
+        title (str): Title of the setting.
+        options (list): List of options for the setting.
+        tooltip_header (str): Header text for the tooltip.
+        tooltip_body (str): Body text for the tooltip.
+        rule (bool): Horizontal rule (optional).
+    """
+
+    def __init__(self, title, options, tooltip_header, tooltip_body, rule):
+        """
+        Initializes a graphics setting.
+
+        Args:
+            title (str): Title of the setting.
+            options (list): List of options for the setting.
+            tooltip_header (str): Header text for the tooltip.
+            tooltip_body (str): Body text for the tooltip.
+            rule (bool): Horizontal rule (optional).
+        """
+        self.title = title
+        self.options = options
+        self.tooltip_header = tooltip_header
+        self.tooltip_body = tooltip_body
+        self.rule = rule
+
+    def get_title(self):
+        """
+        Gets the title of the setting.
+
+        Returns:
+            str: Title of the setting.
+        """
+        return self.title
+
+    def get_options(self):
+        """
+        Gets the options of the setting.
+
+        Returns:
+            list: List of options for the setting.
+        """
+        return self.options
+
+    def get_tooltip_header(self):
+        """
+        Gets the header text for the tooltip.
+
+        Returns:
+            str: Header text for the tooltip.
+        """
+        return self.tooltip_header
+
+    def get_tooltip_body(self):
+        """
+        Gets the body text for the tooltip.
+
+        Returns:
+            str: Body text for the tooltip.
+        """
+        return self.tooltip_body
+
+    def get_rule(self):
+        """
+        Gets the boolean value for whether to draw a horizontal rule.
+
+        Returns:
+            bool: True / False
+        """
+        return self.rule
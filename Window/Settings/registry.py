@@ -0,0 +1,324 @@
+"""
+File       : registry.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 1.0.0
+Description: Declarative registry of every graphics setting managed by the application, in settings panel order.
+Each entry names the setting's user_apps.json key, its setting class (title, options and tooltip), the tab it is shown on, its default option,
+the enable option it depends on, its D3D9 variant and the config file key it is written to.
+The settings panel, the JSON store and the profile codes are built from this registry, so adding a setting is one entry here plus its setting
+class. The config mapping records the key and value each option is written to its config file as.
+"""
+
+from Window.Settings.AF import (
+    Anisotropic_Filtering_Enable,
+    Anisotropic_Filtering_Level,
+    Anisotropic_Filtering_Level_D3D9,
+    LOD_Enable, LOD_Bias, LOD_Bias_D3D9,
+    Clamp_Negative_LOD,
+    Clamp_Negative_LOD_D3D9)
+from Window.Settings.CAS import (
+    CAS_Enable,
+    CAS_Sharpness)
+from Window.Settings.D3DLEVEL import (
+    D3D_Level)
+from Window.Settings.DLS import (
+    DLS_Enable,
+    DLS_Sharpness,
+    DLS_Denoise)
+from Window.Settings.FXAA import (
+    FXAA_Enable,
+    FXAA_Quality_Subpixel,
+    FXAA_Quality_Edge_Threshold,
+    FXAA_Edge_Threshold_Bias)
+from Window.Settings.HDR import (
+    HighDynamicRange)
+from Window.Settings.SMAA import (
+    SMAA_Enable,
+    SMAA_Edge_Detection,
+    SMAA_Threshold,
+    SMAA_Search_Steps,
+    SMAA_Search_Steps_Diagonal,
+    SMAA_Corner_Rounding)
+from Window.Settings.VSYNC import (
+    VSync_Enable,
+    VSync_Level,
+    VSync_Level_D3D9,
+    Frame_Limit_Enable,
+    Frame_Limit, Frame_Limit_D3D9)
+
+# Settings panel tabs
+AA_TAB = "Anti-Aliasing"
+AF_TAB = "Anisotropic Filtering"
+SHARPENING_TAB = "Sharpening"
+VSYNC_TAB = "VSync && Frame Limits"
+MISC_TAB = "Misc Settings"
+
+# Config files
+VKBASALT = "vkBasalt"
+DXVK = "dxvk"
+
+# How a setting's value is stored in user_apps.json
+BOOL = "bool" # True / False / None, for Enabled / Disabled / no selection
+TEXT = "text" # The selected option's text, None for no selection
+
+
+class SettingEntry:
+    """
+    Registry entry of one graphics setting.
+
+    Attributes:
+        key (str): Settings key in user_apps.json.
+        setting (BaseSetting): Setting class instance holding the title, options and tooltip.
+        tab (str): Settings panel tab the setting is shown on.
+        default (int): Option index selected by default.
+        stored (str): BOOL or TEXT, how the selected option is stored.
+        shown_by (tuple): (enable setting key, option index) under which the setting is active, None if always active.
+        d3d9_variant (str): Key of the setting's D3D9 counterpart, None if it has none.
+        tool (str): VKBASALT or DXVK, the config file the setting belongs to.
+        config_key (str): Key written to the config file, None for settings that only select other settings.
+        config_values (dict): Option text -> value written to the config file, None if the option text is written as is.
+            An option mapped to None is written commented out.
+    """
+
+    __slots__ = ("key", "setting", "tab", "default", "stored", "shown_by", "d3d9_variant", "tool", "config_key", "config_values")
+
+    def __init__(self, key, setting, tab, tool, stored=TEXT, default=0, shown_by=None, d3d9_variant=None, config_key=None, config_values=None):
+        """
+        Initializes a registry entry.
+
+        Args:
+            See the class attributes.
+        """
+        self.key = key
+        self.setting = setting
+        self.tab = tab
+        self.tool = tool
+        self.stored = stored
+        self.default = default
+        self.shown_by = shown_by
+        self.d3d9_variant = d3d9_variant
+        self.config_key = config_key
+        self.config_values = config_values
+
+    def get_options(self):
+        """
+        Gets the combobox options of the setting.
+
+        Returns:
+            tuple: Options of the setting.
+        """
+        return tuple(self.setting.get_options())
+
+    def config_value(self, option):
+        """
+        Gets the value written to the config file for an option.
+
+        Args:
+            option (str): Option text.
+
+        Returns:
+            str: Config file value, None if the key is written commented out.
+        """
+        if self.config_values is None:
+            return option
+        return self.config_values.get(option)
+
+
+class SettingsRegistry:
+    """
+    Registry of all graphics settings, in settings panel (and combobox ID) order. The lookup tables below are derived
+    from ENTRIES once, at import.
+    """
+
+    ENTRIES = (
+        # Anti-Aliasing
+        SettingEntry("fxaa_enable", FXAA_Enable(), AA_TAB, VKBASALT, stored=BOOL, config_key="effects", config_values={"Enabled": "fxaa"}),
+        SettingEntry("fxaa_quality_subpixel", FXAA_Quality_Subpixel(), AA_TAB, VKBASALT, shown_by=("fxaa_enable", 1), config_key="fxaaQualitySubpix"),
+        SettingEntry("fxaa_quality_edge", FXAA_Quality_Edge_Threshold(), AA_TAB, VKBASALT, shown_by=("fxaa_enable", 1), config_key="fxaaQualityEdgeThreshold",
+                     config_values={"Highest Quality": "0.063", "High Quality": "0.115", "Default": "0.166", "Low Quality": "0.250", "Lowest Quality": "0.333"}),
+        SettingEntry("fxaa_edge_threshold", FXAA_Edge_Threshold_Bias(), AA_TAB, VKBASALT, shown_by=("fxaa_enable", 1), config_key="fxaaEdgeThreshold",
+                     config_values={"Upper Limit": "0.0833", "High Quality": "0.0625", "Visible Limit": "0.0312", "Zero": "0.0000"}),
+        SettingEntry("smaa_enable", SMAA_Enable(), AA_TAB, VKBASALT, stored=BOOL, config_key="effects", config_values={"Enabled": "smaa"}),
+        SettingEntry("smaa_edge_detection", SMAA_Edge_Detection(), AA_TAB, VKBASALT, shown_by=("smaa_enable", 1), config_key="smaaEdgeDetection",
+                     config_values={"Luma": "luma", "Color": "color"}),
+        SettingEntry("smaa_threshold", SMAA_Threshold(), AA_TAB, VKBASALT, shown_by=("smaa_enable", 1), config_key="smaaThreshold",
+                     config_values={"Highest Quality": "0.05", "Quality": "0.10", "Balanced": "0.25", "Low Quality": "0.40", "Lowest Quality": "0.50"}),
+        SettingEntry("smaa_search_steps", SMAA_Search_Steps(), AA_TAB, VKBASALT, shown_by=("smaa_enable", 1), config_key="smaaMaxSearchSteps",
+                     config_values={"x32": "32", "x16": "16", "x8": "8", "x4": "4", "x2": "2"}),
+        SettingEntry("smaa_search_steps_diagonal", SMAA_Search_Steps_Diagonal(), AA_TAB, VKBASALT, shown_by=("smaa_enable", 1), config_key="smaaMaxSearchStepsDiag",
+                     config_values={"x16": "16", "x8": "8", "x4": "4", "x2": "2", "x0": "0"}),
+        SettingEntry("smaa_corner_rounding", SMAA_Corner_Rounding(), AA_TAB, VKBASALT, shown_by=("smaa_enable", 1), config_key="smaaCornerRounding"),
+
+        # Anisotropic Filtering / LOD
+        SettingEntry("af_enable", Anisotropic_Filtering_Enable(), AF_TAB, DXVK),
+        SettingEntry("af_level", Anisotropic_Filtering_Level(), AF_TAB, DXVK, shown_by=("af_enable", 1), d3d9_variant="af_level_d3d9", config_key="d3d11.samplerAnisotropy",
+                     config_values={"x16": "16", "x8": "8", "x4": "4", "x2": "2", "x1": "1"}),
+        SettingEntry("af_level_d3d9", Anisotropic_Filtering_Level_D3D9(), AF_TAB, DXVK, shown_by=("af_enable", 2), config_key="d3d9.samplerAnisotropy",
+                     config_values={"x16": "16", "x8": "8", "x4": "4", "x2": "2", "x1": "1"}),
+        SettingEntry("lod_enable", LOD_Enable(), AF_TAB, DXVK),
+        SettingEntry("lod_bias", LOD_Bias(), AF_TAB, DXVK, shown_by=("lod_enable", 1), d3d9_variant="lod_bias_d3d9", config_key="d3d11.samplerLodBias"),
+        SettingEntry("lod_bias_d3d9", LOD_Bias_D3D9(), AF_TAB, DXVK, shown_by=("lod_enable", 2), config_key="d3d9.samplerLodBias"),
+        SettingEntry("clamp_negative_lod", Clamp_Negative_LOD(), AF_TAB, DXVK, shown_by=("lod_enable", 1), d3d9_variant="clamp_negative_lod_d3d9", config_key="d3d11.clampNegativeLodBias",
+                     config_values={"Enabled": "True", "Disabled": "False"}),
+        SettingEntry("clamp_negative_lod_d3d9", Clamp_Negative_LOD_D3D9(), AF_TAB, DXVK, shown_by=("lod_enable", 2), config_key="d3d9.clampNegativeLodBias",
+                     config_values={"Enabled": "True", "Disabled": "False"}),
+
+        # Sharpening
+        SettingEntry("cas_enable", CAS_Enable(), SHARPENING_TAB, VKBASALT, stored=BOOL, config_key="effects", config_values={"Enable": "cas"}),
+        SettingEntry("cas_level", CAS_Sharpness(), SHARPENING_TAB, VKBASALT, shown_by=("cas_enable", 1), config_key="casSharpness",
+                     config_values={"1.00": "1.00", "0.75": "0.75", "0.50": "0.50", "0.25": "0.25", "0.00": "0.00", "Off": None}),
+        SettingEntry("dls_enable", DLS_Enable(), SHARPENING_TAB, VKBASALT, stored=BOOL, config_key="effects", config_values={"Enable": "dls"}),
+        SettingEntry("dls_sharpness", DLS_Sharpness(), SHARPENING_TAB, VKBASALT, shown_by=("dls_enable", 1), config_key="dlsSharpness"),
+        SettingEntry("dls_denoise", DLS_Denoise(), SHARPENING_TAB, VKBASALT, shown_by=("dls_enable", 1), config_key="dlsDenoise"),
+
+        # VSync / Frame Limiting
+        SettingEntry("vsync_enable", VSync_Enable(), VSYNC_TAB, DXVK),
+        SettingEntry("vsync_level", VSync_Level(), VSYNC_TAB, DXVK, shown_by=("vsync_enable", 1), d3d9_variant="vsync_level_d3d9", config_key="dxgi.syncInterval",
+                     config_values={"1 Frame": "1", "2 Frames": "2", "Off": "0"}),
+        SettingEntry("vsync_level_d3d9", VSync_Level_D3D9(), VSYNC_TAB, DXVK, shown_by=("vsync_enable", 2), config_key="d3d9.presentInterval",
+                     config_values={"1 Frame": "1", "2 Frames": "2", "Off": "0"}),
+        SettingEntry("frame_limit_enable", Frame_Limit_Enable(), VSYNC_TAB, DXVK),
+        SettingEntry("frame_limit_level", Frame_Limit(), VSYNC_TAB, DXVK, shown_by=("frame_limit_enable", 1), d3d9_variant="frame_limit_level_d3d9", config_key="dxgi.maxFrameRate"),
+        SettingEntry("frame_limit_level_d3d9", Frame_Limit_D3D9(), VSYNC_TAB, DXVK, shown_by=("frame_limit_enable", 2), config_key="d3d9.maxFrameRate"),
+
+        # Misc
+        SettingEntry("hdr_enable", HighDynamicRange(), MISC_TAB, DXVK, stored=BOOL, config_key="dxgi.enableHDR", config_values={"Enabled": "True", "Disabled": "False"}),
+        SettingEntry("d3d_level", D3D_Level(), MISC_TAB, DXVK, config_key="d3d11.maxFeatureLevel",
+                     config_values={"Direct X 9.1": "9_1", "Direct X 9.2": "9_2", "Direct X 9.3": "9_3", "Direct X 10.0": "10_0", "Direct X 10.1": "10_1",
+                                    "Direct X 11.0": "11_0", "Direct X 11.1": "11_1", "Direct X 12.0": "12_0", "Direct X 12.1": "12_1"}),
+    )
+
+    # Settings keys, in combobox ID order.
+    KEYS = tuple(entry.key for entry in ENTRIES)
+
+    # Key -> entry, and key -> combobox ID.
+    BY_KEY = {entry.key: entry for entry in ENTRIES}
+    ID_OF = {key: combobox_id for combobox_id, key in enumerate(KEYS)}
+
+    # Tabs, in the order of their first setting.
+    TABS = tuple(dict.fromkeys(entry.tab for entry in ENTRIES))
+
+    # Keys stored as True / False.
+    BOOL_KEYS = frozenset(entry.key for entry in ENTRIES if entry.stored == BOOL)
+
+    # Key -> VKBASALT or DXVK, the config file written from it.
+    TOOL_OF = {entry.key: entry.tool for entry in ENTRIES}
+
+    # Combobox ID -> tuple of (dependent combobox ID, option index of this setting activating it).
+    DEPENDENTS = ()
+
+    # Combobox ID -> (enable combobox ID, option index activating it), None for settings that are always active.
+    SHOWN_BY_ID = ()
+
+    # Combobox ID -> dict of stored value -> option index, None (no selection) included.
+    INDEX_OF = ()
+
+    # Combobox ID -> dict of config file value -> option index, for the options written to the config file.
+    CONFIG_INDEX_OF = ()
+
+    # Config file keys written from a setting, and the effect names of the effects list.
+    CONFIG_KEYS = frozenset(entry.config_key for entry in ENTRIES if entry.config_key is not None)
+    EFFECT_NAMES = frozenset()
+
+    @classmethod
+    def _compile(cls):
+        dependents = [[] for _ in cls.ENTRIES]
+        for combobox_id, entry in enumerate(cls.ENTRIES):
+            if entry.shown_by is not None:
+                parent_key, enabling_index = entry.shown_by
+                dependents[cls.ID_OF[parent_key]].append((combobox_id, enabling_index))
+        cls.DEPENDENTS = tuple(tuple(children) for children in dependents)
+        cls.SHOWN_BY_ID = tuple((cls.ID_OF[entry.shown_by[0]], entry.shown_by[1]) if entry.shown_by is not None else None for entry in cls.ENTRIES)
+        cls.INDEX_OF = tuple({None: 0, True: 1, False: 2} if entry.stored == BOOL else dict({None: 0}, **{option: index for index, option in enumerate(entry.get_options())})
+                             for entry in cls.ENTRIES)
+        cls.CONFIG_INDEX_OF = tuple({entry.config_value(option): index for index, option in enumerate(entry.get_options()) if index and entry.config_value(option) is not None}
+                                    for entry in cls.ENTRIES)
+        cls.EFFECT_NAMES = frozenset(name for entry, config_index_of in zip(cls.ENTRIES, cls.CONFIG_INDEX_OF) if entry.config_key == "effects" for name in config_index_of)
+
+    @classmethod
+    def option_indices(cls, values):
+        """
+        Maps stored settings values to combobox option indices. Settings whose enable option is not selected get option
+        0, as the settings panel shows them.
+
+        Args:
+            values (tuple): Stored value of every setting, in combobox ID order.
+
+        Returns:
+            tuple: (option indices, ((key, value), ...) of the values which are not options of their setting).
+                Unknown values get option 0.
+        """
+        indices = []
+        unknown = []
+        for entry, value, index_of, shown_by in zip(cls.ENTRIES, values, cls.INDEX_OF, cls.SHOWN_BY_ID):
+            if shown_by is not None and indices[shown_by[0]] != shown_by[1]:
+                indices.append(0)
+                continue
+            index = index_of.get(value)
+            if index is None:
+                unknown.append((entry.key, value))
+                index = 0
+            indices.append(index)
+        return tuple(indices), tuple(unknown)
+
+    @classmethod
+    def option_indices_from_config(cls, values):
+        """
+        Maps the values of existing config files back to combobox option indices. Effects in the effects list are
+        enabled and the others disabled; enable settings without a config key select the option activating the
+        settings found for them. Settings found under an enable option other than the one selected get option 0.
+        Whatever the settings cannot represent is reported: values which are not options of their setting, keys no
+        setting is written to, and effects no setting enables.
+
+        Args:
+            values (dict): Config key -> value, of vkBasalt.conf and dxvk.conf together.
+
+        Returns:
+            tuple: (option indices, ((config key, value), ...) of what could not be represented, an
+                unknown effect reported as ("effects", name)). Keys which are not in the files, and unknown values, get
+                option 0.
+        """
+        indices = [0] * len(cls.ENTRIES)
+        unknown = []
+        effects = values.get("effects")
+        names = {name.strip() for name in effects.split(":")} if effects is not None else None
+        for key, value in values.items():
+            if key == "effects":
+                unknown.extend((key, name) for name in dict.fromkeys(name.strip() for name in value.split(":")) if name and name not in cls.EFFECT_NAMES)
+            elif key not in cls.CONFIG_KEYS:
+                unknown.append((key, value))
+        for combobox_id, entry in enumerate(cls.ENTRIES):
+            if entry.config_key is None:
+                continue
+            if entry.config_key == "effects":
+                if names is not None:
+                    indices[combobox_id] = 1 if not names.isdisjoint(cls.CONFIG_INDEX_OF[combobox_id]) else cls.INDEX_OF[combobox_id][False]
+                continue
+            value = values.get(entry.config_key)
+            if value is None:
+                continue
+            index = cls.CONFIG_INDEX_OF[combobox_id].get(value)
+            if index is None:
+                unknown.append((entry.config_key, value))
+            else:
+                indices[combobox_id] = index
+
+        # Enable settings select what most of their found settings need, the first such option on a tie.
+        for combobox_id, entry in enumerate(cls.ENTRIES):
+            if entry.config_key is None:
+                needed = [enabling_index for child_id, enabling_index in cls.DEPENDENTS[combobox_id] if indices[child_id]]
+                if needed:
+                    indices[combobox_id] = min(set(needed), key=lambda enabling_index: (-needed.count(enabling_index), enabling_index))
+
+        for combobox_id, shown_by in enumerate(cls.SHOWN_BY_ID):
+            if shown_by is not None and indices[shown_by[0]] != shown_by[1]:
+                indices[combobox_id] = 0
+        return tuple(indices), tuple(unknown)
+
+
+SettingsRegistry._compile()
@@ -0,0 +1,150 @@
+"""
+File       : app_filter_model.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Filter proxy between the application store and the table view, showing only the applications that match
+             the search box. Free text is matched by the Qt-free AppSearchIndex and field terms (e.g. "gapi:dx9 af:on")
+             by the AppQueryEngine column store, both kept in step with the store by this model.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+from PyQt6.QtCore import QSortFilterProxyModel, QModelIndex
+from Window.app_table_model import AppTableModel
+from Window.search_index import AppSearchIndex
+from Window.query_engine import AppQueryEngine
+
+
+# ---------------------------------------------------------------------------------------------------------------------------- #
+#                                                                                                                              #
+# ██████                          ██████  ██                                            ██  ██              ██                 #
+# ██  ██  ████    ████            ██            ██        ██      ████    ████          ██████  ██████      ██    ████  ██     #
+# ██████  ██  ██  ██  ██          ████    ██    ██      ██████  ██  ██  ██              ██  ██  ██  ██    ████  ██  ██  ██     #
+# ██  ██  ██████  ██████          ██      ██    ██        ██    ████    ██              ██  ██  ██  ██  ██  ██  ████    ██     #
+# ██  ██  ██      ██              ██      ████  ██████    ████    ████  ██              ██  ██  ██████  ██████    ████  ██████ #
+#                                                                                                                              #
+# ---------------------------------------------------------------------------------------------------------------------------- #
+
+
+class AppFilterModel(QSortFilterProxyModel):
+    """
+    Proxy showing the applications of an AppTableModel that match the current filter text.
+    """
+
+    # ------------------------------------------------------------------------------ #
+    # Model initialisation.                                                          #
+    # ------------------------------------------------------------------------------ #
+    def __init__(self, app_model: AppTableModel, parent=None) -> None:
+        """
+        Initializes the AppFilterModel over an application store, with no filter applied.
+
+        Args:
+            app_model (AppTableModel): Application store to filter.
+            parent (QObject): Optional Qt parent.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> filter_model = AppFilterModel(app_model)
+        """
+        super().__init__(parent)
+
+        self._app_model: AppTableModel = app_model
+        self.search_index = AppSearchIndex()
+        self.query_engine = AppQueryEngine()
+
+        # Current filter text and the paths it matches (None when everything is shown).
+        self._filter_text: str = ""
+        self._matches: set = None
+
+        # Index the applications already in the store.
+        for row in range(app_model.rowCount()):
+            self._index_row(row)
+
+        # Connected before the source model is set, so the index and matches are up to date by the time the proxy
+        # filters inserted or changed rows.
+        app_model.rowsInserted.connect(self._store_rows_inserted)
+        app_model.rowsAboutToBeRemoved.connect(self._store_rows_about_to_be_removed)
+        app_model.dataChanged.connect(self._store_data_changed)
+        self.setSourceModel(app_model)
+
+    # ------------------------------------------------------------------------------ #
+    # Filtering.                                                                     #
+    # ------------------------------------------------------------------------------ #
+    def set_filter_text(self,
+                        filter_text_input: str) -> None:
+        """
+        Shows only the applications matching the filter text: every free word must appear in their name, file, path or
+        graphics API, and every field term (see AppQueryEngine) must hold.
+
+        Args:
+            filter_text(str): Text typed in the search box, empty to show every application.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .set_filter_text("witcher gapi:dx11 -cas:on")
+        """
+        # Get method input arguments and store in method for use.
+        self._filter_text = filter_text_input
+
+        self._refresh_matches()
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return self._matches is None or self._app_model.app_at(source_row)["app_path"] in self._matches
+
+    def _refresh_matches(self) -> None:
+        terms, free_text = self.query_engine.split_query(self._filter_text)
+        matches: set = self.search_index.search(free_text)
+        if terms:
+            term_matches: set = self.query_engine.paths_of(self.query_engine.query_mask(terms))
+            matches = term_matches if matches is None else matches & term_matches
+        self._matches = matches
+
+    # ------------------------------------------------------------------------------ #
+    # Store change handling.                                                         #
+    # ------------------------------------------------------------------------------ #
+    def _index_row(self, row: int) -> None:
+        app: dict = self._app_model.app_at(row)
+        self.search_index.add(app["app_path"], app["app_name"], app["app_gapi"])
+        self.query_engine.add(app)
+
+    def _store_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        for row in range(first, last + 1):
+            self._index_row(row)
+        if self._filter_text:
+            self._refresh_matches()
+
+    def _store_rows_about_to_be_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        for row in range(first, last + 1):
+            app_path: str = self._app_model.app_at(row)["app_path"]
+            self.search_index.remove(app_path)
+            self.query_engine.remove(app_path)
+        if self._filter_text:
+            self._refresh_matches()
+
+    def _store_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: list = None) -> None:
+        # A rename or settings save may move an application in or out of the filter.
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._index_row(row)
+        if self._filter_text:
+            self._refresh_matches()
@@ -22,10 +22,21 @@ Description: Application list panel with a table for displaying app details, all
 # ------------------------------------------------------ #
 import os
 import re
+import itertools
 import pefile
-from PyQt6.QtWidgets import QLabel, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QFileDialog, QMessageBox, QRadioButton
-from PyQt6.QtCore import Qt
+from contextlib import contextmanager
+from PyQt6.QtWidgets import QLabel, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLineEdit, QTableView, QTreeView, QStackedWidget, QAbstractItemView, QHeaderView, QFileDialog, QMessageBox, QProgressDialog, QApplication, QComboBox
+from PyQt6.QtCore import Qt, QTimer
 from Window.json_handler import AppJSONHandler
+from Window.conf_handler import AppConfHandler
+from Window.profile_layers import ProfileLayers
+from Window.redeploy_engine import RedeployEngine
+from Window.bulk_importer import BulkImporter
+from Window.drift_scanner import DriftScanner
+from Window.orphan_collector import OrphanCollector
+from Window.app_table_model import AppTableModel
+from Window.app_filter_model import AppFilterModel
+from Window.app_tree_model import AppTreeModel
 
 
 # ------------------------------------------------------------------------------------------------------------ #
@@ -42,15 +53,23 @@ from Window.json_handler import AppJSONHandler
 class AppListPanel(QWidget):
 
     # Global constants creation
-    _RADIO_BUTTON_COL: int = 0
-    _APP_EXE_COL: int = 1
-    _APP_NAME_COL: int = 2
-    _APP_GAPI_COL: int = 3
-    _APP_PATH_COL: int = 4
+    _APP_EXE_COL: int = AppTableModel.APP_EXE_COL
+    _APP_NAME_COL: int = AppTableModel.APP_NAME_COL
+    _APP_GAPI_COL: int = AppTableModel.APP_GAPI_COL
+    _APP_PATH_COL: int = AppTableModel.APP_PATH_COL
+
+    # Number of applications added to the table per event loop pass during startup.
+    _LOAD_CHUNK_SIZE: int = 64
+
+    # Quiet period after the last name edit before the edit burst is written to user_apps.json.
+    _NAME_WRITE_DELAY_MS: int = 750
 
     # Create class variable for linking to the JSON handling class.
     _json_handler = AppJSONHandler()
 
+    # Create class variable for linking to the configuration file handling class.
+    _conf_handler = AppConfHandler()
+
     # ------------------------------------------------------------------------------ #
     # Panel initialisation & table creation.                                         #
     # ------------------------------------------------------------------------------ #
@@ -80,16 +99,32 @@ class AppListPanel(QWidget):
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.layout().addWidget(self.label)
 
-        # Add application list table.
-        self.app_table = QTableWidget()
-        self.app_table.setColumnCount(5)
-        self.app_table.setHorizontalHeaderLabels(["Selected", "File", "App Name", "Graphics API", "Path"])
-        self.app_table.setColumnWidth(self._RADIO_BUTTON_COL, 75)   # Radio buttons column for selecting entries
+        # Add search box filtering the application table as the user types.
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search by name, file, path or graphics API, or filter e.g. gapi:dx9 af:on ...")
+        self.search_box.setClearButtonEnabled(True)
+        self.layout().addWidget(self.search_box)
+
+        # Add application list table, a filtered view over the application store model.
+        self.app_model = AppTableModel(self)
+        self.app_filter_model = AppFilterModel(self.app_model, self)
+        self.app_table = QTableView()
+        self.app_table.setModel(self.app_filter_model)
+        self.app_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)  # Rows are selected, replacing per-row radio buttons
+        self.app_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)  # Ctrl / Shift click for bulk actions
+        self.app_table.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked | QAbstractItemView.EditTrigger.EditKeyPressed)
+        self.app_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)  # Uniform row heights, no per-row size hints
         self.app_table.setColumnWidth(self._APP_EXE_COL, 150)  # File name column
         self.app_table.setColumnWidth(self._APP_NAME_COL, 200)  # Editable application name column
         self.app_table.setColumnWidth(self._APP_GAPI_COL, 150)  # GAPI Version column
         self.app_table.setColumnWidth(self._APP_PATH_COL, 300)  # Full path column
-        self.layout().addWidget(self.app_table)
+
+        # Stack the flat table with the grouped tree view, which is only built when first shown.
+        self.app_tree = None
+        self.app_tree_model = None
+        self.app_view_stack = QStackedWidget()
+        self.app_view_stack.addWidget(self.app_table)
+        self.layout().addWidget(self.app_view_stack)
 
         # Create button layout.
         button_layout = QHBoxLayout()
@@ -98,9 +133,39 @@ class AppListPanel(QWidget):
         self.add_app_button = QPushButton("Add Application")
         self.del_app_button = QPushButton("Delete Application")
 
+        # Add button to rewrite the config files of the selected applications from their saved settings.
+        self.redeploy_button = QPushButton("Redeploy Configs")
+
+        # Add button to rewrite the config files of every application in the library.
+        self.redeploy_all_button = QPushButton("Redeploy All")
+
+        # Add button to import the existing config files of every application in the library.
+        self.import_all_button = QPushButton("Import Configs")
+
+        # Add button to find applications whose config files no longer match their saved settings.
+        self.check_drift_button = QPushButton("Check Drift")
+
+        # Add toggle between the flat table and the view grouped by library & prefix.
+        self.grouped_view_button = QPushButton("Grouped View")
+        self.grouped_view_button.setCheckable(True)
+
+        # Add choice of copying config files into game directories or linking them to the shared config store.
+        self.deploy_mode_combobox = QComboBox()
+        self.deploy_mode_combobox.addItems(["Copy Configs", "Symlink Configs", "Hardlink Configs"])
+        self.deploy_mode_combobox.setToolTip('<html><body><p>Link modes write each distinct config once into a shared store and link it into every game directory using it.</p></body></html>')
+        deploy_mode: str = self._json_handler.get_deploy_mode()
+        AppConfHandler.set_deploy_mode(deploy_mode)
+        self.deploy_mode_combobox.setCurrentIndex(AppConfHandler.DEPLOY_MODES.index(deploy_mode))
+
         # Add buttons to button layout.
         button_layout.addWidget(self.add_app_button)
         button_layout.addWidget(self.del_app_button)
+        button_layout.addWidget(self.redeploy_button)
+        button_layout.addWidget(self.redeploy_all_button)
+        button_layout.addWidget(self.import_all_button)
+        button_layout.addWidget(self.check_drift_button)
+        button_layout.addWidget(self.grouped_view_button)
+        button_layout.addWidget(self.deploy_mode_combobox)
 
         # Add button layout to main layout.
         self.layout().addLayout(button_layout)
@@ -108,13 +173,101 @@ class AppListPanel(QWidget):
         # Connect button click signal to handler.
         self.add_app_button.clicked.connect(self.add_application)
         self.del_app_button.clicked.connect(self.delete_application)
+        self.redeploy_button.clicked.connect(self.redeploy_applications)
+        self.redeploy_all_button.clicked.connect(self.redeploy_all_applications)
+        self.import_all_button.clicked.connect(self.import_all_configs)
+        self.check_drift_button.clicked.connect(self.check_drift)
+        self.grouped_view_button.toggled.connect(self.set_grouped_view)
+        self.deploy_mode_combobox.currentIndexChanged.connect(self.set_deploy_mode)
+        self.search_box.textChanged.connect(self.app_filter_model.set_filter_text)
 
         # Check for changes to 'App Name' field.
-        self.app_table.cellChanged.connect(self.update_application_name)
+        self.app_model.app_renamed.connect(self.update_application_name)
+
+        # Create write queue used to coalesce 'App Name' edits into a single save.
+        self._pending_name_writes: dict = {}
+        self._name_write_timer = QTimer(self)
+        self._name_write_timer.setSingleShot(True)
+        self._name_write_timer.setInterval(self._NAME_WRITE_DELAY_MS)
+        self._name_write_timer.timeout.connect(self.flush_name_writes)
+
+        # Create timer used to fill the table in chunks from the event loop.
+        self._app_loader = None
+        self._load_timer = QTimer(self)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self.load_application_chunk)
 
         # Load applications from file on startup.
         self.load_applications()
 
+    # ------------------------------------------------------------------------------ #
+    # Choose how config files are deployed.                                          #
+    # ------------------------------------------------------------------------------ #
+    def set_deploy_mode(self,
+                        index_input: int) -> None:
+        """
+        Switches between copying config files into game directories and linking them to the config store, saves the
+        choice and redeploys the library so every game uses the new mode.
+
+        Args:
+            index(int): Index of the deploy mode combobox, in AppConfHandler.DEPLOY_MODES order.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .set_deploy_mode(1)
+        """
+        # Get method input arguments and store in method for use.
+        deploy_mode: str = AppConfHandler.DEPLOY_MODES[index_input]
+
+        AppConfHandler.set_deploy_mode(deploy_mode)
+        self._json_handler.set_deploy_mode(deploy_mode)
+        self.redeploy_all_applications()
+
+    # ------------------------------------------------------------------------------ #
+    # Switch between flat table and grouped tree view.                               #
+    # ------------------------------------------------------------------------------ #
+    def set_grouped_view(self,
+                         grouped_input: bool) -> None:
+        """
+        Shows either the flat application table or the tree grouped as library root -> prefix -> application. The
+        search box is disabled while the tree is shown, as it does not filter the tree.
+
+        Args:
+            grouped(bool): 'True' to show the grouped tree view, 'False' for the flat table.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .set_grouped_view(True)
+        """
+        # Get method input arguments and store in method for use.
+        grouped: bool = grouped_input
+
+        # Build the tree view the first time it is requested.
+        if grouped and self.app_tree is None:
+            self.app_tree_model = AppTreeModel(self.app_model, self)
+            self.app_tree = QTreeView()
+            self.app_tree.setModel(self.app_tree_model)
+            self.app_tree.setUniformRowHeights(True)
+            self.app_tree.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+            self.app_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+            self.app_tree.setColumnWidth(AppTreeModel.NAME_COL, 300)
+            self.app_view_stack.addWidget(self.app_tree)
+
+        self.app_view_stack.setCurrentWidget(self.app_tree if grouped else self.app_table)
+
+        # The search only filters the flat table, so it is disabled while the tree is shown. Its text is kept and
+        # applies again once the table is back.
+        self.search_box.setEnabled(not grouped)
+        self.search_box.setToolTip("Search is only available in the flat view." if grouped else "")
+
     # ------------------------------------------------------------------------------ #
     # Application selection & duplicate selection check.                             #
     # ------------------------------------------------------------------------------ #
@@ -144,11 +297,45 @@ class AppListPanel(QWidget):
         # Check selected file is not already added (file path check), if not then add to table.
         if file_path:
             if not self.is_app_already_added(file_path):
-                self.add_application_to_table(file_path)
+                with self.batch_population():
+                    self.add_application_to_table(file_path)
                 self.save_application(file_path)
             else:
                 QMessageBox.warning(self, "Duplicate Entry", "This application is already in the list.")
 
+    # ------------------------------------------------------------------------------ #
+    # Batch population mode for bulk table inserts.                                  #
+    # ------------------------------------------------------------------------------ #
+    @contextmanager
+    def batch_population(self):
+        """
+        Context manager suspending table repaints while rows are inserted in bulk.
+
+        Rows are inserted through the model, so bulk inserts never reach update_application_name(); only user
+        edits of the 'App Name' column are queued for saving.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> with .batch_population():
+                ...     .add_application_to_table("/path/to/application", "application name", "Graphics API")
+        """
+        # Suspend repaints, remembering the previous state for nested use.
+        updates_enabled: bool = self.app_table.updatesEnabled()
+        self.app_table.setUpdatesEnabled(False)
+
+        try:
+            yield
+        finally:
+            # Repaint once for the whole batch.
+            self.app_table.setUpdatesEnabled(updates_enabled)
+
     # ------------------------------------------------------------------------------ #
     # Add applications to table.                                                     #
     # ------------------------------------------------------------------------------ #
@@ -190,29 +377,8 @@ class AppListPanel(QWidget):
         if not gapi:
             gapi = self.detect_gapi_version(file_path)
 
-        # Get physical row count to insert new row at end of table.
-        row_position: int = self.app_table.rowCount()
-        self.app_table.insertRow(row_position)
-
-        # Populate row cells with provided data.
-        entry_selection = QRadioButton()
-        self.app_table.setCellWidget(row_position, self._RADIO_BUTTON_COL, entry_selection)
-
-        file_item = QTableWidgetItem(file_name)
-        file_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-        self.app_table.setItem(row_position, self._APP_EXE_COL, file_item)
-
-        name_item = QTableWidgetItem(app_name)
-        name_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsEnabled)
-        self.app_table.setItem(row_position, self._APP_NAME_COL, name_item)
-
-        gapi_item = QTableWidgetItem(gapi)
-        gapi_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-        self.app_table.setItem(row_position, self._APP_GAPI_COL, gapi_item)
-
-        path_item = QTableWidgetItem(file_path)
-        path_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-        self.app_table.setItem(row_position, self._APP_PATH_COL, path_item)
+        # Append the application to the store, the view renders it when visible.
+        self.app_model.append_apps([{"app_name": app_name, "app_path": file_path, "app_gapi": gapi}])
 
         if new_add == True:
             QMessageBox.information(self, "Operation Complete", '<p>Application name and graphics API detection complete!</p>')
@@ -412,7 +578,10 @@ class AppListPanel(QWidget):
     # ------------------------------------------------------------------------------ #
     def load_applications(self) -> None:
         """
-        Load applications from user_apps.json, using json_handler.py.
+        Start loading applications from user_apps.json, using json_handler.py.
+
+        Entries are streamed from the file and added to the table in chunks by load_application_chunk(),
+        so the window is shown and painted before the whole file has been parsed.
 
         Args:
             None.
@@ -425,12 +594,41 @@ class AppListPanel(QWidget):
                 .. code-block:: python
                 >>> .load_applications()
         """
-        # Create a dictionary variable alled data and load JSON data into it.
-        data: dict = self._json_handler.load_app_details()
+        # Create a generator yielding app entries as they are decoded from user_apps.json.
+        self._app_loader = self._json_handler.iter_app_details()
+
+        # Fill the table from the event loop, one chunk per pass.
+        self._load_timer.start()
+
+    # ------------------------------------------------------------------------------ #
+    # Add the next chunk of streamed applications to the table                       #
+    # ------------------------------------------------------------------------------ #
+    def load_application_chunk(self) -> None:
+        """
+        Add the next chunk of applications streamed from user_apps.json to the table.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .load_application_chunk()
+        """
+        # Pull the next chunk of app entries from the loader.
+        chunk: list = list(itertools.islice(self._app_loader, self._LOAD_CHUNK_SIZE))
+
+        # Add the whole chunk to the store with a single row insertion.
+        with self.batch_population():
+            self.app_model.append_apps(chunk)
 
-        # Iterate through app entries in dictionary and add each in turn to table.
-        for app in data.get("applications", []):
-            self.add_application_to_table(app["app_path"], app["app_name"], app["app_gapi"])
+        # Stop once the loader has been exhausted.
+        if len(chunk) < self._LOAD_CHUNK_SIZE:
+            self._load_timer.stop()
+            self._app_loader = None
 
     # ------------------------------------------------------------------------------ #
     # Check if application is already in the table                                   #
@@ -457,25 +655,21 @@ class AppListPanel(QWidget):
         # Get method input arguments and store in method.
         file_path: str = file_path_input
 
-        # Check each rows fifth (path) column to check for potential duplicate entry insertion
-        for row in range(self.app_table.rowCount()):
-            if self.app_table.item(row, 4).text() == file_path:
-                return True
-
-        return False  # If no duplicate found return 'False'
+        # Look the path up in the store's path index.
+        return self.app_model.contains_path(file_path)
 
     # ------------------------------------------------------------------------------ #
     # Allow user inputted application name & save to JSON file                       #
     # ------------------------------------------------------------------------------ #
     def update_application_name(self, 
-                                row_input: int, 
-                                column_input: int) -> None:
+                                app_path_input: str, 
+                                new_name_input: str) -> None:
         """
-        Update JSON when an app name is edited in the table.
+        Queue a JSON update when an app name is edited in the table; see flush_name_writes().
 
         Args:
-            row(int): Row number of selected application to update application name.
-            column(int): Column number to make sure only 'App Name' is being updated.
+            app_path(str): Application path of the edited application.
+            new_name(str): New application name entered by the user.
 
         Returns:
             None.
@@ -483,53 +677,57 @@ class AppListPanel(QWidget):
         Examples:
             Default Usage:
                 .. code-block:: python
-                >>> .update_application_name(n, 0)  # row input 'n' can be any int in range, 0 is an impossible column selection
-                >>> .update_application_name(n, 1)  # row input 'n' can be any int in range, 1 is an impossible column selection
-                >>> .update_application_name(n, 2)  # row input 'n' can be any int in range, 2 means execution continues as normal
-                >>> .update_application_name(n, 3)  # row input 'n' can be any int in range, 3 is an impossible column selection
-                >>> .update_application_name(n, 4)  # row input 'n' can be any int in range, 4 is an impossible column selection
+                >>> .update_application_name("/path/to/application", "New Application Name")
         """
         # Get method input arguments and store in method
-        row: int = row_input
-        column: int = column_input
+        app_path: str = app_path_input
+        new_name: str = new_name_input
 
-        # Check selected column is second (App Name) column; it should always be the second column.
-        if column != self._APP_NAME_COL:  # We only care about the 'App Name' column.
-            return
+        # If either name or path variables are empty, return.
+        if not new_name or not app_path:
+            return  # Avoid empty names or missing data.
 
-        # Assign path to widget.
-        app_path_item = self.app_table.item(row, self._APP_PATH_COL)
+        # Queue the new name and restart the quiet period, so an edit burst is saved once.
+        self._pending_name_writes[app_path] = new_name
+        self._name_write_timer.start()
 
-        # If path empty / None, return.
-        if app_path_item is None:
-            return
+    # ------------------------------------------------------------------------------ #
+    # Write queued application name edits to JSON file                               #
+    # ------------------------------------------------------------------------------ #
+    def flush_name_writes(self) -> None:
+        """
+        Write all queued 'App Name' edits to user_apps.json in a single save.
 
-        # Set new variables name to new_name string, and path to app_path from tables current values.
-        new_name: str = self.app_table.item(row, column).text()
-        app_path: str = app_path_item.text()  # Get the app's path.
+        Args:
+            None.
 
-        # If either name or path variables are empty, return.
-        if not new_name or not app_path:
-            return  # Avoid empty names or missing data.
+        Returns:
+            None.
 
-        # Load current JSON data.
-        data: dict = self._json_handler.load_app_details()
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .flush_name_writes()
+        """
+        # Stop any pending timed flush, this call covers it.
+        self._name_write_timer.stop()
 
-        # Find and update the correct app entry.
-        for app in data["applications"]:
-            if app["app_path"] == app_path:
-                app["app_name"] = new_name
-                break
+        # Nothing queued, nothing to write.
+        if not self._pending_name_writes:
+            return
 
-        # Save back to JSON.
-        self._json_handler.save_app_details(data)
+        # Take the queue and write every edit with a single load and save.
+        pending_name_writes: dict = self._pending_name_writes
+        self._pending_name_writes = {}
+        self._json_handler.rename_apps(pending_name_writes)
 
     # ------------------------------------------------------------------------------ #
     # Delete selected application from the list and JSON                             #
     # ------------------------------------------------------------------------------ #
     def delete_application(self) -> None:
         """
-        Deletes the selected application from the table and user_apps.json using json_handler.py.
+        Deletes the selected applications from the table and user_apps.json using json_handler.py, with one
+        confirmation and a single save however many are selected.
 
         Args:
             None.
@@ -542,43 +740,395 @@ class AppListPanel(QWidget):
                 .. code-block:: python
                 >>> .delete_application()
         """
-        # Set selected_row to impossible arbitrary value.
-        selected_row = -1
-
-        # Find the selected radio button.
-        for row in range(self.app_table.rowCount()):
-            radio_button = self.app_table.cellWidget(row, self._RADIO_BUTTON_COL)
-            if radio_button is not None and radio_button.isChecked():
-                selected_row = row
-                break
-
-        # If selected row equals default value, no value has obviously been selected.
-        if selected_row == -1:
-            QMessageBox.warning(self, "No Selection", "Please select an application to delete!")
+        # Get the selected applications, warning the user if there are none.
+        selected_apps: list = self.get_selected_applications()
+        if not selected_apps:
             return
 
-        # Get file path of the selected application.
-        file_path: str = self.app_table.item(selected_row, self._APP_PATH_COL).text()
-        app_name: str = self.app_table.item(selected_row, self._APP_NAME_COL).text()
-
-        # Create a warning dialog to confirm user wishes to delete entry.
+        # Create a warning dialog to confirm user wishes to delete the entries.
+        if len(selected_apps) == 1:
+            confirm_text: str = f'Are you sure you want to delete application:\n\n{selected_apps[0]["app_name"]}?'
+        else:
+            confirm_text: str = f'Are you sure you want to delete {len(selected_apps)} applications?'
         del_confirm = QMessageBox()
         del_confirm.setIcon(QMessageBox.Icon.Warning)
         del_confirm.setWindowTitle("Removal Confirmation")
-        del_confirm.setText(f'Are you sure you want to delete application:\n\n{app_name}?')
+        del_confirm.setText(confirm_text)
         del_confirm.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         del_confirm.setDefaultButton(QMessageBox.StandardButton.No)
         confirmation = del_confirm.exec()
 
-        # If user selected 'Yes' to confirm deletion then remove entry from table and user_apps.json, else return.
-        if confirmation == QMessageBox.StandardButton.Yes:
-            # Remove row from table
-            self.app_table.removeRow(selected_row)
-            # Remove from JSON
-            self._json_handler.remove_app(file_path)
+        # If user selected 'Yes' to confirm deletion then remove entries from table and user_apps.json, else return.
+        if confirmation != QMessageBox.StandardButton.Yes:
+            return
+
+        file_paths: list = [app["app_path"] for app in selected_apps]
+
+        # Remove from JSON in one transaction.
+        with self._json_handler.transaction():
+            self._json_handler.remove_apps(file_paths)
+
+        # Remove rows from table
+        with self.batch_population():
+            self.app_model.remove_apps(file_paths)
+
+        # Offer to remove the config files generated for them, which would otherwise keep affecting the games.
+        self.remove_orphaned_configs([os.path.dirname(file_path) for file_path in file_paths])
+
+    def remove_orphaned_configs(self,
+                                directories_input: list = ()) -> None:
+        """
+        Lists the generated config files no application in user_apps.json uses any more, then removes them if the
+        user confirms. Hand written config files, and generated ones edited since, are never removed.
+
+        Args:
+            directories(list): Directories to look in besides those config files were deployed to, e.g. those of
+                applications just deleted.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .remove_orphaned_configs(["/path/to/deleted/application"])
+        """
+        collector = OrphanCollector(self._json_handler, self._conf_handler)
+
+        # Dry run first, so the user sees exactly what would be removed.
+        orphans, _ = collector.remove(collector.find_orphans(directories_input), dry_run_input=True)
+        if not orphans:
+            return
+
+        remove_confirm = QMessageBox()
+        remove_confirm.setIcon(QMessageBox.Icon.Question)
+        remove_confirm.setWindowTitle("Remove Generated Configs")
+        remove_confirm.setText("These configuration files were generated for applications which are no longer in the list:\n\n" + "\n".join(orphans) + "\n\nRemove them?")
+        remove_confirm.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        remove_confirm.setDefaultButton(QMessageBox.StandardButton.No)
+        if remove_confirm.exec() != QMessageBox.StandardButton.Yes:
+            return
+
+        removed, failures = collector.remove(orphans)
+        self._conf_handler.collect_garbage([app["app_path"] for app in self._json_handler.iter_app_details()])
+        if failures:
+            QMessageBox.warning(self, "Configs Removed With Errors", f"<p>Removed {len(removed)} configuration files.</p><p style=\"color: red;\">Failed:<br>" + "<br>".join(f"{path}: {error}" for path, error in failures.items()) + "</p>")
+
+    # ------------------------------------------------------------------------------ #
+    # Redeploy configuration files                                                   #
+    # ------------------------------------------------------------------------------ #
+    def redeploy_applications(self) -> None:
+        """
+        Rewrites dxvk.conf and vkBasalt.conf for the selected applications from their saved settings, in parallel,
+        then shows a single summary.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .redeploy_applications()
+        """
+        # Get the selected applications, warning the user if there are none.
+        selected_apps: list = self.get_selected_applications()
+        if not selected_apps:
+            return
+
+        # Applications never saved from the settings panel have nothing to deploy. The others get their effective
+        # settings, their own over their profile layers.
+        layers: ProfileLayers = self._json_handler.get_profile_layers()
+        app_settings: list = []
+        skipped: list = []
+        for app in selected_apps:
+            settings: dict = app["settings"]
+            if settings.get("settings_set"):
+                app_settings.append((app["app_path"], layers.resolve_settings(settings, app["app_gapi"])))
+            else:
+                skipped.append(app["app_name"])
+
+        report: dict = {}
+        failures: dict = self._conf_handler.save_conf_many(app_settings, report)
+
+        # Single summary of the whole batch.
+        summary: str = f"<p>Configuration files deployed for {len(app_settings) - len(failures)} of {len(selected_apps)} selected applications ({AppConfHandler.summarise_report(report)}).</p>"
+        if skipped:
+            summary += f"<p>Skipped {len(skipped)} without saved settings:<br>{'<br>'.join(skipped)}</p>"
+        if failures:
+            summary += "<p style=\"color: red;\">Failed:<br>" + "<br>".join(f"{path}: {error}" for path, error in failures.items()) + "</p>"
+            QMessageBox.warning(self, "Redeploy Finished With Errors", summary)
+        else:
+            QMessageBox.information(self, "Redeploy Finished", summary)
+
+    def redeploy_all_applications(self) -> None:
+        """
+        Rewrites dxvk.conf and vkBasalt.conf for every application in the library, e.g. after a profile layer
+        changed, showing progress and then a single summary with any failures.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .redeploy_all_applications()
+        """
+        # The whole library from user_apps.json, as the table may still be loading.
+        engine = RedeployEngine(self._json_handler, self._conf_handler)
+        apps: list = engine.load_apps()
+        if not apps:
+            return
+
+        progress_dialog = QProgressDialog("Redeploying configuration files...", "Cancel", 0, len(apps), self)
+        progress_dialog.setWindowTitle("Redeploy All")
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(500)
+
+        def show_progress(done: int, total: int, app_path: str) -> bool:
+            progress_dialog.setMaximum(total)
+            progress_dialog.setValue(done)
+            progress_dialog.setLabelText(f"Redeploying configuration files...\n{os.path.basename(os.path.dirname(app_path))}")
+            QApplication.processEvents()
+            return not progress_dialog.wasCanceled()
+
+        report, failures, unsaved = engine.run(apps, show_progress)
+        cancelled: bool = progress_dialog.wasCanceled()
+        progress_dialog.close()
+
+        # Every application has been deployed, so store blobs no game links to can go.
+        removed: list = self._conf_handler.collect_garbage([app["app_path"] for app in apps]) if not cancelled else []
+
+        # Single summary of the whole library.
+        summary: str = f"<p>Configuration files: {AppConfHandler.summarise_report(report)}.</p>"
+        if removed:
+            summary += f"<p>Removed {len(removed)} unused configs from the config store.</p>"
+        if cancelled:
+            summary += "<p>Cancelled before every application was redeployed.</p>"
+        if unsaved:
+            summary += f"<p>Skipped {len(unsaved)} applications without saved settings.</p>"
+        if failures:
+            summary += "<p style=\"color: red;\">Failed:<br>" + "<br>".join(f"{path}: {error}" for path, error in failures.items()) + "</p>"
+            QMessageBox.warning(self, "Redeploy Finished With Errors", summary)
+        else:
+            QMessageBox.information(self, "Redeploy Finished", summary)
+
+    # ------------------------------------------------------------------------------ #
+    # Import existing configuration files                                            #
+    # ------------------------------------------------------------------------------ #
+    def import_all_configs(self) -> None:
+        """
+        Imports the existing dxvk.conf and vkBasalt.conf of every application in the library into user_apps.json,
+        asking first whether settings already saved from the settings panel should be replaced, then shows a single
+        summary with the values which could not be imported.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .import_all_configs()
+        """
+        apps: list = [self.app_model.app_at(row) for row in range(self.app_model.rowCount())]
+        if not apps:
+            return
+
+        # Ask whether to replace saved settings, keeping them by default.
+        replace_confirm = QMessageBox()
+        replace_confirm.setIcon(QMessageBox.Icon.Question)
+        replace_confirm.setWindowTitle("Import Configs")
+        replace_confirm.setText("Import the existing configuration files of every application.\n\nAlso replace settings already saved from the settings panel?")
+        replace_confirm.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel)
+        replace_confirm.setDefaultButton(QMessageBox.StandardButton.No)
+        confirmation = replace_confirm.exec()
+        if confirmation == QMessageBox.StandardButton.Cancel:
+            return
+
+        importer = BulkImporter(self._json_handler, self._conf_handler)
+        try:
+            report: dict = importer.run(apps, replace_saved_input=confirmation == QMessageBox.StandardButton.Yes)
+        except OSError as exception:
+            QMessageBox.warning(self, "Import Failed", f"<p>user_apps.json could not be written, nothing was imported:</p><p style=\"color: red;\">{exception}</p>")
+            return
+
+        # Keep the model's copy of the settings in step with user_apps.json.
+        for app_path, settings in report["imported"].items():
+            self.app_model.set_app_settings(app_path, settings)
+
+        # Single summary of the whole library.
+        summary: str = f"<p>Configuration files: {BulkImporter.summarise_report(report)}.</p>"
+        if report["unknown"]:
+            summary += "<p>These values cannot be represented by the settings and were not imported:<br>" + "<br>".join(
+                f"{os.path.basename(os.path.dirname(app_path))}: " + ", ".join(f"{key} = {value}" for key, value in unknown) for app_path, unknown in report["unknown"].items()) + "</p>"
+        if report["failures"]:
+            summary += "<p style=\"color: red;\">Failed:<br>" + "<br>".join(f"{path}: {error}" for path, error in report["failures"].items()) + "</p>"
+            QMessageBox.warning(self, "Import Finished With Errors", summary)
         else:
+            QMessageBox.information(self, "Import Finished", summary)
+
+    # ------------------------------------------------------------------------------ #
+    # Find configuration files which drifted from the saved settings                 #
+    # ------------------------------------------------------------------------------ #
+    def check_drift(self) -> None:
+        """
+        Lists the applications whose deployed config files were edited, deleted or overwritten since they were
+        deployed, offering to redeploy them from their saved settings or to import their files back.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .check_drift()
+        """
+        apps: list = [self.app_model.app_at(row) for row in range(self.app_model.rowCount())]
+        if not apps:
+            return
+
+        scanner = DriftScanner(self._json_handler, self._conf_handler)
+        drifted, failures = scanner.scan(apps)
+
+        failed: str = ""
+        if failures:
+            failed = "<p style=\"color: red;\">Could not be checked:<br>" + "<br>".join(f"{path}: {error}" for path, error in failures.items()) + "</p>"
+        if not drifted:
+            QMessageBox.information(self, "No Drift Found", f"<p>Every deployed configuration file matches its saved settings.</p>{failed}")
             return
 
+        # One line per drifted application, naming its files and what happened to them.
+        drifted_apps: list = [app for app in apps if app["app_path"] in drifted]
+        listing: str = "<br>".join(f'{app["app_name"]}: ' + ", ".join(f"{os.path.basename(conf_path)} {status}" for conf_path, status in drifted[app["app_path"]].items())
+                                   for app in drifted_apps)
+
+        drift_dialog = QMessageBox(self)
+        drift_dialog.setIcon(QMessageBox.Icon.Warning)
+        drift_dialog.setWindowTitle("Configuration Drift Found")
+        drift_dialog.setText(f"<p>The configuration files of {len(drifted_apps)} applications no longer match their saved settings;</p><p>{listing}</p>{failed}")
+        redeploy_button = drift_dialog.addButton("Redeploy", QMessageBox.ButtonRole.AcceptRole)
+        import_button = drift_dialog.addButton("Import Back", QMessageBox.ButtonRole.ActionRole)
+        drift_dialog.addButton(QMessageBox.StandardButton.Close)
+        drift_dialog.exec()
+
+        if drift_dialog.clickedButton() is redeploy_button:
+            # Rewrite the drifted files from the saved settings.
+            report, failures, _ = RedeployEngine(self._json_handler, self._conf_handler).run(drifted_apps)
+            summary: str = f"<p>Configuration files: {AppConfHandler.summarise_report(report)}.</p>"
+            if failures:
+                summary += "<p style=\"color: red;\">Failed:<br>" + "<br>".join(f"{path}: {error}" for path, error in failures.items()) + "</p>"
+                QMessageBox.warning(self, "Redeploy Finished With Errors", summary)
+            else:
+                QMessageBox.information(self, "Redeploy Finished", summary)
+        elif drift_dialog.clickedButton() is import_button:
+            # Make the files on disk the saved settings. Applications with a deleted file are left out, as importing
+            # only the other file would clear the settings of the deleted one.
+            importable: list = [app for app in drifted_apps if AppConfHandler.MISSING not in drifted[app["app_path"]].values()]
+            try:
+                report: dict = BulkImporter(self._json_handler, self._conf_handler).run(importable, replace_saved_input=True)
+            except OSError as exception:
+                QMessageBox.warning(self, "Import Failed", f"<p>user_apps.json could not be written, nothing was imported:</p><p style=\"color: red;\">{exception}</p>")
+                return
+            for app_path, settings in report["imported"].items():
+                self.app_model.set_app_settings(app_path, settings)
+            summary: str = f"<p>Configuration files: {BulkImporter.summarise_report(report)}.</p>"
+            if len(importable) < len(drifted_apps):
+                summary += f"<p>Left out {len(drifted_apps) - len(importable)} applications with deleted files; redeploy them instead.</p>"
+
+            # Check the imported applications again, files with values the settings cannot hold still drift.
+            imported_apps: list = [dict(app, settings=report["imported"][app["app_path"]]) for app in importable if app["app_path"] in report["imported"]]
+            still_drifted, _ = scanner.scan(imported_apps)
+            if still_drifted:
+                listing = "<br>".join(f'{app["app_name"]}: ' + ", ".join(f"{os.path.basename(conf_path)} {status}" for conf_path, status in still_drifted[app["app_path"]].items())
+                                      for app in imported_apps if app["app_path"] in still_drifted)
+                summary += f"<p style=\"color: red;\">Still differ from their saved settings; redeploy them to overwrite the files:<br>{listing}</p>"
+                QMessageBox.warning(self, "Import Finished With Drift", summary)
+            else:
+                QMessageBox.information(self, "Import Finished", summary)
+
+    # ------------------------------------------------------------------------------ #
+    # Get selected table rows                                                        #
+    # ------------------------------------------------------------------------------ #
+    def get_selected_rows(self) -> list:
+        """
+        Gets the selected store rows from the current view's selection model.
+
+        Args:
+            None.
+
+        Returns:
+            (list): Selected row numbers in ascending order, empty if no application is selected.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .get_selected_rows()
+        """
+        # Grouped view, map the selected application nodes back to their store rows; group rows are ignored.
+        if self.app_view_stack.currentWidget() is self.app_tree:
+            app_paths: list = [self.app_tree_model.app_path_of(index) for index in self.app_tree.selectionModel().selectedRows()]
+            return sorted(self.app_model.row_of(app_path) for app_path in app_paths if app_path)
+
+        # Flat table, map the selected filtered rows back to their store rows.
+        return sorted(self.app_filter_model.mapToSource(index).row() for index in self.app_table.selectionModel().selectedRows())
+
+    def get_selected_row(self) -> int:
+        """
+        Gets the first selected table row from the view's selection model.
+
+        Args:
+            None.
+
+        Returns:
+            (int): Selected row number, or -1 if no application is selected.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .get_selected_row()
+        """
+        selected_rows: list = self.get_selected_rows()
+        return selected_rows[0] if selected_rows else -1
+
+    # ------------------------------------------------------------------------------ #
+    # Get selected applications for bulk actions                                     #
+    # ------------------------------------------------------------------------------ #
+    def get_selected_applications(self) -> list:
+        """
+        Retrieves every selected application, warning the user if nothing is selected.
+
+        Args:
+            None.
+
+        Returns:
+            (list): App dicts containing 'app_name', 'app_path', 'app_gapi' and 'settings', empty if nothing is selected.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> selected_apps = .get_selected_applications()
+        """
+        # Write queued name edits first so callers matching on name find the entries in user_apps.json.
+        self.flush_name_writes()
+
+        selected_rows: list = self.get_selected_rows()
+        if not selected_rows:
+            QMessageBox.warning(self, "No Selection", "Please select an application to proceed.")
+            return []
+
+        return [self.app_model.app_at(row) for row in selected_rows]
+
     # ------------------------------------------------------------------------------ #
     # Get selected application details for settings panel                            #
     # ------------------------------------------------------------------------------ #
@@ -602,15 +1152,11 @@ class AppListPanel(QWidget):
                 >>> selection_details = .get_selected_application()
         """
 
-        # Set selected_row to impossible arbitrary value.
-        selected_row = -1
+        # Write queued name edits first so callers matching on name find the entry in user_apps.json.
+        self.flush_name_writes()
 
-        # Find the selected radio button.
-        for row in range(self.app_table.rowCount()):
-            radio_button = self.app_table.cellWidget(row, self._RADIO_BUTTON_COL)
-            if radio_button is not None and radio_button.isChecked():
-                selected_row = row
-                break
+        # Get the selected row from the selection model, -1 if nothing is selected.
+        selected_row: int = self.get_selected_row()
 
         # If selected row equals default value, no value has obviously been selected.
         if selected_row == -1:
@@ -621,9 +1167,10 @@ class AppListPanel(QWidget):
             selection: bool = True
         
         # Get path & name of the selected application.
-        file_path: str = self.app_table.item(selected_row, self._APP_PATH_COL).text()
-        app_name: str = self.app_table.item(selected_row, self._APP_NAME_COL).text()
-        gapi: str = self.app_table.item(selected_row, self._APP_GAPI_COL).text()
+        selected_app: dict = self.app_model.app_at(selected_row)
+        file_path: str = selected_app["app_path"]
+        app_name: str = selected_app["app_name"]
+        gapi: str = selected_app["app_gapi"]
 
         return [
             selection,
@@ -0,0 +1,329 @@
+"""
+File       : app_table_model.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Table model over the in-memory application store, displayed by the QTableView in app_list_panel.py.
+             Rows are only rendered for visible cells, and applications are indexed by path for O(1) lookups.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import os
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+
+# ---------------------------------------------------------------------------------------------------------------------- #
+#                                                                                                                        #
+# ██████                          ██████          ██                              ██  ██              ██                 #
+# ██  ██  ████    ████              ██      ████  ██      ██        ████          ██████  ██████      ██    ████  ██     #
+# ██████  ██  ██  ██  ██            ██    ██  ██  ████    ██      ██  ██          ██  ██  ██  ██    ████  ██  ██  ██     #
+# ██  ██  ██████  ██████            ██    ██  ██  ██  ██  ██      ████            ██  ██  ██  ██  ██  ██  ████    ██     #
+# ██  ██  ██      ██                ██    ██████  ██████  ██████    ████          ██  ██  ██████  ██████    ████  ██████ #
+#                                                                                                                        #
+# ---------------------------------------------------------------------------------------------------------------------- #
+
+
+class AppTableModel(QAbstractTableModel):
+    """
+    Table model holding the application store (one dict per application, as stored in user_apps.json).
+    """
+
+    # Global constants creation
+    APP_EXE_COL: int = 0
+    APP_NAME_COL: int = 1
+    APP_GAPI_COL: int = 2
+    APP_PATH_COL: int = 3
+
+    _HEADER_LABELS: tuple = ("File", "App Name", "Graphics API", "Path")
+
+    # Emitted with (app_path, new_name) when the user edits an application name.
+    app_renamed = pyqtSignal(str, str)
+
+    # ------------------------------------------------------------------------------ #
+    # Model initialisation.                                                          #
+    # ------------------------------------------------------------------------------ #
+    def __init__(self, parent=None) -> None:
+        """
+        Initializes an empty AppTableModel.
+
+        Args:
+            parent (QObject): Optional Qt parent.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> app_model = AppTableModel()
+        """
+        super().__init__(parent)
+
+        # Application store and path -> row index.
+        self._apps: list = []
+        self._row_by_path: dict = {}
+
+    # ------------------------------------------------------------------------------ #
+    # Qt model interface.                                                            #
+    # ------------------------------------------------------------------------------ #
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        # Table model, only the invisible root has children.
+        if parent.isValid():
+            return 0
+        return len(self._apps)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._HEADER_LABELS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._HEADER_LABELS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+
+        app: dict = self._apps[index.row()]
+        column: int = index.column()
+
+        # Only the path column carries a tooltip, as it is the one most likely to be truncated.
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return app["app_path"] if column == self.APP_PATH_COL else None
+
+        if column == self.APP_EXE_COL:
+            return os.path.basename(app["app_path"])
+        elif column == self.APP_NAME_COL:
+            return app["app_name"]
+        elif column == self.APP_GAPI_COL:
+            return app["app_gapi"]
+        elif column == self.APP_PATH_COL:
+            return app["app_path"]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+        # Only the 'App Name' column may be edited.
+        if index.column() == self.APP_NAME_COL:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        # Only name edits are accepted; empty names are rejected.
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole or index.column() != self.APP_NAME_COL:
+            return False
+
+        new_name: str = str(value).strip()
+        app: dict = self._apps[index.row()]
+        if not new_name or new_name == app["app_name"]:
+            return False
+
+        app["app_name"] = new_name
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self.app_renamed.emit(app["app_path"], new_name)
+        return True
+
+    # ------------------------------------------------------------------------------ #
+    # Application store operations.                                                  #
+    # ------------------------------------------------------------------------------ #
+    def append_apps(self,
+                    apps_input: list) -> None:
+        """
+        Appends application entries to the store with a single row insertion.
+
+        Args:
+            apps(list): List of app dicts containing 'app_name', 'app_path', 'app_gapi' and optionally 'settings'.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .append_apps([{"app_name": "Name", "app_path": "/path/to/application", "app_gapi": "DirectX 11"}])
+        """
+        # Skip entries already in the store.
+        apps: list = []
+        seen: set = set()
+        for app in apps_input:
+            if app["app_path"] not in self._row_by_path and app["app_path"] not in seen:
+                seen.add(app["app_path"])
+                settings: dict = dict(app["settings"][0]) if app.get("settings") else {}
+                apps.append({"app_name": app["app_name"], "app_path": app["app_path"], "app_gapi": app["app_gapi"], "settings": settings})
+
+        if not apps:
+            return
+
+        first_row: int = len(self._apps)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(apps) - 1)
+        for row, app in enumerate(apps, first_row):
+            self._apps.append(app)
+            self._row_by_path[app["app_path"]] = row
+        self.endInsertRows()
+
+    def remove_app(self,
+                   app_path_input: str) -> bool:
+        """
+        Removes an application from the store.
+
+        Args:
+            app_path(str): Path of the application to remove.
+
+        Returns:
+            (bool): 'True' if the application was found and removed, 'False' otherwise.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .remove_app("/path/to/application")
+        """
+        row: int = self._row_by_path.get(app_path_input, -1)
+        if row == -1:
+            return False
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._apps[row]
+        del self._row_by_path[app_path_input]
+
+        # Rows below the removed one shift up by one.
+        for shifted_row in range(row, len(self._apps)):
+            self._row_by_path[self._apps[shifted_row]["app_path"]] = shifted_row
+        self.endRemoveRows()
+        return True
+
+    def remove_apps(self,
+                    app_paths_input: list) -> int:
+        """
+        Removes many applications from the store with one row removal per contiguous run of rows, re-indexing the rows
+        below them once.
+
+        Args:
+            app_paths(list): Paths of the applications to remove. Paths not in the store are ignored.
+
+        Returns:
+            (int): Number of applications removed.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .remove_apps(["/path/to/application", "/path/to/other/application"])
+        """
+        rows: list = sorted({self._row_by_path[app_path] for app_path in app_paths_input if app_path in self._row_by_path}, reverse=True)
+        if not rows:
+            return 0
+
+        # Remove runs from the bottom up, so the rows of the runs above are still valid when their signals are sent.
+        run_start: int = 0
+        for position in range(1, len(rows) + 1):
+            if position < len(rows) and rows[position] == rows[position - 1] - 1:
+                continue
+            first_row, last_row = rows[position - 1], rows[run_start]
+            self.beginRemoveRows(QModelIndex(), first_row, last_row)
+            for app in self._apps[first_row:last_row + 1]:
+                del self._row_by_path[app["app_path"]]
+            del self._apps[first_row:last_row + 1]
+            self.endRemoveRows()
+            run_start = position
+
+        # Rows below the first removed one shift up.
+        for shifted_row in range(rows[-1], len(self._apps)):
+            self._row_by_path[self._apps[shifted_row]["app_path"]] = shifted_row
+        return len(rows)
+
+    def set_app_settings(self,
+                         app_path_input: str,
+                         settings_input: dict) -> bool:
+        """
+        Replaces the stored settings of an application, e.g. after they are saved from the settings panel.
+
+        Args:
+            app_path(str): Path of the application.
+            settings(dict): Settings dict as stored in user_apps.json.
+
+        Returns:
+            (bool): 'True' if the application was found, 'False' otherwise.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .set_app_settings("/path/to/application", {"settings_set": True, "fxaa_enable": True, ...})
+        """
+        row: int = self._row_by_path.get(app_path_input, -1)
+        if row == -1:
+            return False
+
+        self._apps[row]["settings"] = dict(settings_input)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._HEADER_LABELS) - 1))
+        return True
+
+    def contains_path(self,
+                      app_path_input: str) -> bool:
+        """
+        Checks whether an application path is in the store, in O(1).
+
+        Args:
+            app_path(str): Application path to check.
+
+        Returns:
+            (bool): 'True' if present, 'False' otherwise.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .contains_path("/path/to/application")
+        """
+        return app_path_input in self._row_by_path
+
+    def row_of(self,
+               app_path_input: str) -> int:
+        """
+        Gets the row of an application path, in O(1).
+
+        Args:
+            app_path(str): Application path to look up.
+
+        Returns:
+            (int): Row number, or -1 if the path is not in the store.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .row_of("/path/to/application")
+        """
+        return self._row_by_path.get(app_path_input, -1)
+
+    def app_at(self,
+               row_input: int) -> dict:
+        """
+        Gets the application entry stored at a row.
+
+        Args:
+            row(int): Row number.
+
+        Returns:
+            (dict): App dict containing 'app_name', 'app_path', 'app_gapi' and 'settings' (settings dict, may be empty).
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .app_at(0)
+        """
+        return self._apps[row_input]
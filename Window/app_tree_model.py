@@ -0,0 +1,345 @@
+"""
+File       : app_tree_model.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Tree model presenting the application store grouped as library root -> prefix -> application.
+             Children are only materialised when their group is expanded (canFetchMore / fetchMore), and group
+             counts come from library_index.py instead of rescanning the store.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import os
+import itertools
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex
+from Window.library_index import LibraryIndex
+from Window.app_table_model import AppTableModel
+
+
+# -------------------------------------------------------------------------------------------------------------- #
+#                                                                                                                #
+# ██████                          ██████                                  ██  ██              ██                 #
+# ██  ██  ████    ████              ██      ████    ████    ████          ██████  ██████      ██    ████  ██     #
+# ██████  ██  ██  ██  ██            ██    ██      ██  ██  ██  ██          ██  ██  ██  ██    ████  ██  ██  ██     #
+# ██  ██  ██████  ██████            ██    ██      ████    ████            ██  ██  ██  ██  ██  ██  ████    ██     #
+# ██  ██  ██      ██                ██    ██        ████    ████          ██  ██  ██████  ██████    ████  ██████ #
+#                                                                                                                #
+# -------------------------------------------------------------------------------------------------------------- #
+
+
+class _TreeNode:
+    """
+    Materialised node of the tree; library and prefix nodes hold the children fetched so far.
+    """
+    __slots__ = ("parent", "kind", "key", "row", "children")
+
+    def __init__(self, parent, kind: str, key, row: int) -> None:
+        self.parent = parent
+        self.kind: str = kind
+        self.key = key
+        self.row: int = row
+        self.children: list = []
+
+
+class AppTreeModel(QAbstractItemModel):
+    """
+    Grouped, lazily populated view model over an AppTableModel store.
+    """
+
+    # Global constants creation
+    NAME_COL: int = 0
+    GAPI_COL: int = 1
+
+    _HEADER_LABELS: tuple = ("Library / Application", "Graphics API")
+
+    # Node kinds
+    _ROOT: str = "root"
+    _LIBRARY: str = "library"
+    _PREFIX: str = "prefix"
+    _APP: str = "app"
+
+    # Number of children materialised per fetchMore() call.
+    _FETCH_BATCH_SIZE: int = 128
+
+    # ------------------------------------------------------------------------------ #
+    # Model initialisation.                                                          #
+    # ------------------------------------------------------------------------------ #
+    def __init__(self, app_model: AppTableModel, parent=None) -> None:
+        """
+        Initializes the AppTreeModel, indexing the current store once and following it incrementally afterwards.
+
+        Args:
+            app_model (AppTableModel): Application store to group.
+            parent (QObject): Optional Qt parent.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> tree_model = AppTreeModel(app_model)
+        """
+        super().__init__(parent)
+
+        self._app_model: AppTableModel = app_model
+        self._index = LibraryIndex()
+        self._root = _TreeNode(None, self._ROOT, None, -1)
+        self._app_nodes: dict = {}
+        self._syncing: bool = False
+
+        # Index the applications already in the store.
+        for row in range(app_model.rowCount()):
+            self._index.add(app_model.app_at(row)["app_path"])
+
+        # Follow the store from now on.
+        app_model.rowsInserted.connect(self._store_rows_inserted)
+        app_model.rowsAboutToBeRemoved.connect(self._store_rows_about_to_be_removed)
+        app_model.dataChanged.connect(self._store_data_changed)
+
+    # ------------------------------------------------------------------------------ #
+    # Node helpers.                                                                  #
+    # ------------------------------------------------------------------------------ #
+    def _node(self, index: QModelIndex) -> _TreeNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def _node_index(self, node: _TreeNode, column: int = 0) -> QModelIndex:
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, column, node)
+
+    def _child_keys(self, node: _TreeNode):
+        # Keys of every child of a node, in index order.
+        if node.kind == self._ROOT:
+            return self._index.libraries()
+        elif node.kind == self._LIBRARY:
+            return self._index.prefixes(node.key)
+        elif node.kind == self._PREFIX:
+            return self._index.apps(node.parent.key, node.key)
+        return []
+
+    def _child_total(self, node: _TreeNode) -> int:
+        # Number of children a node has in the index, whether materialised or not.
+        if node.kind == self._ROOT:
+            return len(self._index.libraries())
+        elif node.kind == self._LIBRARY:
+            return self._index.group_count(node.key)
+        elif node.kind == self._PREFIX:
+            return self._index.group_count(node.parent.key, node.key)
+        return 0
+
+    def _make_child(self, node: _TreeNode, key) -> _TreeNode:
+        kind: str = {self._ROOT: self._LIBRARY, self._LIBRARY: self._PREFIX, self._PREFIX: self._APP}[node.kind]
+        child = _TreeNode(node, kind, key, len(node.children))
+        node.children.append(child)
+        if kind == self._APP:
+            self._app_nodes[key] = child
+        return child
+
+    def _find_child(self, node: _TreeNode, key) -> _TreeNode | None:
+        for child in node.children:
+            if child.key == key:
+                return child
+        return None
+
+    def _drop_node(self, node: _TreeNode) -> None:
+        # Forget app nodes below a node that is being removed.
+        if node.kind == self._APP:
+            self._app_nodes.pop(node.key, None)
+        for child in node.children:
+            self._drop_node(child)
+
+    # ------------------------------------------------------------------------------ #
+    # Qt model interface.                                                            #
+    # ------------------------------------------------------------------------------ #
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node: _TreeNode = self._node(parent)
+        if 0 <= row < len(node.children) and 0 <= column < len(self._HEADER_LABELS):
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        return self._node_index(self._node(index).parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._HEADER_LABELS)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        # Groups report children before they are fetched, so the view draws an expand arrow.
+        node: _TreeNode = self._node(parent)
+        if node.kind == self._APP or (parent.isValid() and parent.column() != 0):
+            return False
+        return bool(node.children) or self._child_total(node) > 0
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        # The index runs ahead of the nodes while a store change is being applied, so nothing is fetchable then.
+        node: _TreeNode = self._node(parent)
+        if node.kind == self._APP or self._syncing:
+            return False
+        return len(node.children) < self._child_total(node)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not self.canFetchMore(parent):
+            return
+
+        node: _TreeNode = self._node(parent)
+        fetched: int = len(node.children)
+        keys: list = list(itertools.islice(self._child_keys(node), fetched, fetched + self._FETCH_BATCH_SIZE))
+        if not keys:
+            return
+
+        self.beginInsertRows(parent, fetched, fetched + len(keys) - 1)
+        for key in keys:
+            self._make_child(node, key)
+        self.endInsertRows()
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._HEADER_LABELS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+
+        node: _TreeNode = self._node(index)
+        column: int = index.column()
+
+        # Application rows show the stored name and graphics API.
+        if node.kind == self._APP:
+            app: dict = self._app_model.app_at(self._app_model.row_of(node.key))
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return app["app_path"]
+            return app["app_name"] if column == self.NAME_COL else app["app_gapi"]
+
+        # Group rows show their folder and the number of applications inside.
+        if column != self.NAME_COL:
+            return None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return node.key
+        if node.kind == self._LIBRARY:
+            return f"{node.key or '/'} ({self._index.library_count(node.key)})"
+        return f"{os.path.basename(node.key) or node.key} ({self._index.prefix_count(node.parent.key, node.key)})"
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    # ------------------------------------------------------------------------------ #
+    # Selection helpers.                                                             #
+    # ------------------------------------------------------------------------------ #
+    def app_path_of(self,
+                    index_input: QModelIndex) -> str | None:
+        """
+        Gets the application path of a tree index.
+
+        Args:
+            index(QModelIndex): Tree index.
+
+        Returns:
+            (str): Application path, or None if the index is a group row.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> .app_path_of(tree_view.currentIndex())
+        """
+        node: _TreeNode = self._node(index_input)
+        return node.key if node.kind == self._APP else None
+
+    # ------------------------------------------------------------------------------ #
+    # Store change handling.                                                         #
+    # ------------------------------------------------------------------------------ #
+    def _store_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        for row in range(first, last + 1):
+            self._add_path(self._app_model.app_at(row)["app_path"])
+
+    def _store_rows_about_to_be_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        for row in range(first, last + 1):
+            self._remove_path(self._app_model.app_at(row)["app_path"])
+
+    def _store_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: list = None) -> None:
+        # Repaint renamed applications that have been materialised.
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            node: _TreeNode = self._app_nodes.get(self._app_model.app_at(row)["app_path"])
+            if node is not None:
+                self.dataChanged.emit(self._node_index(node, self.NAME_COL), self._node_index(node, self.GAPI_COL))
+
+    def _add_path(self, app_path: str) -> None:
+        # Walk down the materialised nodes. A missing node is only inserted when its parent has every other child
+        # fetched already; otherwise, and for everything below a new node, fetchMore() picks it up on expand.
+        node: _TreeNode = self._root
+        for key in self._path_keys(app_path, self._index.add(app_path)):
+            child: _TreeNode = self._find_child(node, key) if node.kind != self._PREFIX else None
+            if child is None:
+                if len(node.children) == self._child_total(node) - 1:
+                    self._syncing = True
+                    self.beginInsertRows(self._node_index(node), len(node.children), len(node.children))
+                    self._make_child(node, key)
+                    self._syncing = False
+                    self.endInsertRows()
+                return
+
+            # Existing group, refresh its count.
+            self.dataChanged.emit(self._node_index(child), self._node_index(child))
+            node = child
+
+    def _remove_path(self, app_path: str) -> None:
+        location: tuple = self._index.location_of(app_path)
+        if location is None:
+            return
+
+        # Find the deepest materialised node on the way to the application.
+        chain: list = [self._root]
+        for key in self._path_keys(app_path, location):
+            if chain[-1].kind == self._PREFIX:
+                child: _TreeNode = self._app_nodes.get(key)
+            else:
+                child: _TreeNode = self._find_child(chain[-1], key)
+            if child is None:
+                break
+            chain.append(child)
+
+        self._index.remove(app_path)
+        self._syncing = True
+
+        # Remove materialised nodes that no longer exist in the index, deepest first, then refresh counts.
+        for node in reversed(chain[1:]):
+            exists: bool = node.kind != self._APP and self._child_total(node) > 0
+            if exists:
+                self.dataChanged.emit(self._node_index(node), self._node_index(node))
+                continue
+            parent: _TreeNode = node.parent
+            self.beginRemoveRows(self._node_index(parent), node.row, node.row)
+            del parent.children[node.row]
+            for shifted in parent.children[node.row:]:
+                shifted.row -= 1
+            self._drop_node(node)
+            self.endRemoveRows()
+
+        self._syncing = False
+
+    def _path_keys(self, app_path: str, location: tuple) -> tuple:
+        # Keys of the library, prefix and application nodes for a path.
+        library_root, prefix = location
+        return library_root, prefix, app_path
@@ -0,0 +1,125 @@
+"""
+File       : atomic_write.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Crash safe file writes. The new content goes to a temporary file in the target's directory, is flushed
+             to disk and then renamed over the target, so readers see either the old file or the whole new one, never
+             a truncated one.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import errno
+import os
+import tempfile
+from stat import S_ISREG
+
+
+# ------------------------------------------------------------------------------------------ #
+#                                                                                            #
+# ██████                          ██                    ██  ██          ██                   #
+# ██  ██    ██    ██████  ██  ██          ████          ██  ██    ████          ██      ████ #
+# ██████  ██████  ██  ██  ██████  ██    ██              ██  ██  ██      ██    ██████  ██  ██ #
+# ██  ██    ██    ██  ██  ██████  ██    ██              ██████  ██      ██      ██    ████   #
+# ██  ██    ████  ██████  ██  ██  ████    ████          ██  ██  ██      ████    ████    ████ #
+#                                                                                            #
+# ------------------------------------------------------------------------------------------ #
+
+
+def atomic_write(path_input: str,
+                 data_input: bytes,
+                 sync_directory_input: bool = True) -> None:
+    """
+    Replaces a file's content atomically: temporary file in the same directory, fsync, os.replace, then fsync of the
+    directory so the rename itself survives a crash. A plain file keeps its permissions; new files, and links (e.g. to
+    a read only config store blob) which become plain files, get 0644.
+
+    Args:
+        path(str): File to write.
+        data(bytes): Whole new content.
+        sync_directory(bool): Fsync the directory after the rename. Writers of several files in one directory pass
+            False and call fsync_directory() once at the end.
+
+    Returns:
+        None.
+
+    Raises:
+        OSError: If the file cannot be written; the target is then left as it was.
+
+    Examples:
+        Default usage:
+            .. code-block:: python
+            >>> atomic_write("/path/to/dxvk.conf", text.encode("utf-8"))
+    """
+    # Unpack inputs
+    path: str = path_input
+    data: bytes = data_input
+    sync_directory: bool = sync_directory_input
+
+    directory: str = os.path.dirname(os.path.abspath(path))
+    mode: int = 0o644
+    try:
+        stat: os.stat_result = os.lstat(path)
+        if S_ISREG(stat.st_mode) and stat.st_nlink == 1:
+            mode = stat.st_mode & 0o7777
+    except FileNotFoundError:
+        pass
+
+    file_descriptor, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if sync_directory:
+        fsync_directory(directory)
+
+
+def fsync_directory(directory_input: str) -> None:
+    """
+    Flushes a directory's entries to disk, making renames into it durable. Filesystems which cannot fsync a directory
+    are skipped.
+
+    Args:
+        directory(str): Directory to flush.
+
+    Returns:
+        None.
+
+    Raises:
+        OSError: If the directory cannot be opened.
+
+    Examples:
+        Default usage:
+            .. code-block:: python
+            >>> fsync_directory("/path/to/game")
+    """
+    file_descriptor: int = os.open(directory_input, os.O_RDONLY)
+    try:
+        os.fsync(file_descriptor)
+    except OSError as error:
+        if error.errno != errno.EINVAL:
+            raise
+    finally:
+        os.close(file_descriptor)
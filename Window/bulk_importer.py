@@ -0,0 +1,318 @@
+"""
+File       : bulk_importer.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Imports the existing dxvk.conf and vkBasalt.conf of many applications at once, e.g. hand tuned configs
+             from before the manager was used. Files are read and parsed by a pool of threads, mapped onto settings
+             records and saved to user_apps.json in one transaction, with a report of the values which are not options
+             of their setting. Runs from the GUI, or headless: python -m Window.bulk_importer [--json user_apps.json]
+             [--root /path/to/games].
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from Window.conf_handler import AppConfHandler
+from Window.json_handler import AppJSONHandler
+from Window.profile_layers import ProfileLayers
+from Window.redeploy_engine import RedeployEngine
+from Window.Settings import SettingsRegistry
+from Window.settings_code import SettingsCode
+from Window.settings_record import SettingsRecord
+
+
+# ------------------------------------------------------------------------------------------------------ #
+#                                                                                                        #
+# ████                    ██              ██████                                                         #
+# ██  ██  ██  ██  ██      ██  ██            ██    ██  ██  ████    ██████    ████    ██      ████    ████ #
+# ████    ██  ██  ██      ████              ██    ██████  ██  ██  ██  ██  ██      ██████  ██  ██  ██     #
+# ██  ██  ██  ██  ██      ██  ██            ██    ██████  ██████  ██  ██  ██        ██    ████    ██     #
+# ██████  ██████  ██████  ██  ██          ██████  ██  ██  ██      ██████  ██        ████    ████  ██     #
+#                                                                                                        #
+# ------------------------------------------------------------------------------------------------------ #
+
+
+class BulkImporter:
+    """
+    Reads the config files next to many applications back into their saved settings.
+    """
+
+    # Files read at the same time.
+    MAX_WORKERS: int = 8
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation                                                        #
+    # --------------------------------------------------------------------------- #
+    def __init__(self,
+                 json_handler_input: AppJSONHandler,
+                 conf_handler_input: AppConfHandler,
+                 max_workers_input: int = MAX_WORKERS) -> None:
+        self._json_handler: AppJSONHandler = json_handler_input
+        self._conf_handler: AppConfHandler = conf_handler_input
+        self._max_workers: int = max(1, max_workers_input)
+
+    # --------------------------------------------------------------------------- #
+    # Finding config files                                                        #
+    # --------------------------------------------------------------------------- #
+    def scan_directories(self,
+                         root_input: str) -> set:
+        """
+        Finds every directory under a root which holds a dxvk.conf or vkBasalt.conf. Symlinked directories are not
+        followed, so a scan never leaves the root or loops.
+
+        Args:
+            root(str): Directory to scan, e.g. a Steam library or a folder of Wine prefixes.
+
+        Returns:
+            (set): Paths of the directories holding config files.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> directories: set = importer.scan_directories("/games/SteamLibrary")
+        """
+        conf_names: set = set(self._conf_handler.conf_names())
+        found: set = set()
+        pending: list = [os.path.abspath(root_input)]
+        while pending:
+            directory: str = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name in conf_names:
+                            found.add(directory)
+            except OSError:
+                # Unreadable directories hold nothing to import.
+                continue
+        return found
+
+    # --------------------------------------------------------------------------- #
+    # Parsing                                                                     #
+    # --------------------------------------------------------------------------- #
+    def parse_all(self,
+                  apps_input: list) -> list:
+        """
+        Reads and parses the config files of every application, in parallel.
+
+        Args:
+            apps(list): Application dicts, as from RedeployEngine.load_apps() or the app list's model.
+
+        Returns:
+            (list): One (indices, unknown, error) per application, in order: option indices or None if it has no
+                config files, ((config key, value), ...) of the values which are not options of their setting, and the
+                error message if the files could not be read, else None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> parsed: list = importer.parse_all(apps)
+        """
+        def parse(app: dict) -> tuple:
+            try:
+                indices, unknown = self._conf_handler.import_conf(app["app_path"])
+            except OSError as exception:
+                return None, (), str(exception)
+            return indices, unknown, None
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return list(executor.map(parse, apps_input))
+
+    # --------------------------------------------------------------------------- #
+    # Importing                                                                   #
+    # --------------------------------------------------------------------------- #
+    def run(self,
+            apps_input: list,
+            root_input: str = None,
+            replace_saved_input: bool = False) -> dict:
+        """
+        Imports the config files of every application into user_apps.json, in one transaction. Settings the files
+        share with the application's profile layers are left to the layers, so only the differences are stored as the
+        application's own settings and later layer changes still reach it.
+
+        Args:
+            apps(list): Application dicts, as from RedeployEngine.load_apps() or the app list's model.
+            root(str): Only import applications in directories under this root which hold config files, None for every
+                application.
+            replace_saved(bool): 'True' to also replace the settings of applications already saved from the settings
+                panel, which are otherwise left as they are.
+
+        Returns:
+            (dict): Report of the import:
+                "imported": app_path -> settings dict as now stored in user_apps.json,
+                "unknown": app_path -> ((config key, value), ...) which could not be represented and were not imported:
+                    values which are not options of their setting, keys no setting writes and unknown effects,
+                "kept": paths of applications with saved settings left as they are,
+                "missing": paths of applications without config files,
+                "failures": app_path -> error message,
+                "unmatched": directories under root holding config files but no known application.
+
+        Raises:
+            OSError: If user_apps.json cannot be written; it is then left as it was.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> report: dict = importer.run(apps, "/games/SteamLibrary")
+        """
+        # Unpack inputs
+        apps: list = apps_input
+        root: str = root_input
+        replace_saved: bool = replace_saved_input
+
+        report: dict = {"imported": {}, "unknown": {}, "kept": [], "missing": [], "failures": {}, "unmatched": []}
+
+        if root is not None:
+            directories: set = self.scan_directories(root)
+            known: set = {os.path.dirname(app["app_path"]) for app in apps}
+            report["unmatched"] = sorted(directories - known)
+            apps = [app for app in apps if os.path.dirname(app["app_path"]) in directories]
+
+        if not replace_saved:
+            report["kept"] = [app["app_path"] for app in apps if app["settings"].get("settings_set")]
+            apps = [app for app in apps if not app["settings"].get("settings_set")]
+
+        parsed: list = self.parse_all(apps)
+        layers: ProfileLayers = self._json_handler.get_profile_layers()
+
+        with self._json_handler.transaction():
+            for app, (indices, unknown, error) in zip(apps, parsed):
+                if error is not None:
+                    report["failures"][app["app_path"]] = error
+                    continue
+                if indices is None:
+                    report["missing"].append(app["app_path"])
+                    continue
+                if unknown:
+                    report["unknown"][app["app_path"]] = unknown
+
+                # Every setting is replaced, so the stored profile code is the imported one, less what the layers already give.
+                code: int = SettingsCode.from_indices(self.own_indices(indices, layers, app["app_gapi"]))
+                record: SettingsRecord = SettingsCode.decode(code)
+                self._json_handler.add_app_settings(app["app_path"], app["app_name"], app["app_gapi"], record)
+                report["imported"][app["app_path"]] = dict(app["settings"], **record.to_dict(), settings_set=True, profile_code=SettingsCode.to_text(code))
+
+        return report
+
+    @staticmethod
+    def own_indices(indices_input: tuple,
+                    layers_input: ProfileLayers,
+                    app_gapi_input: str) -> tuple:
+        """
+        Leaves the settings an application would inherit from its profile layers unselected. An enable setting stays
+        selected while a setting it shows differs from the layers, as that setting is only stored under it.
+
+        Args:
+            indices(tuple): Option indices of the application's effective settings, e.g. as imported.
+            layers(ProfileLayers): Profile layers of user_apps.json.
+            app_gapi(str): Graphics API of the application.
+
+        Returns:
+            (tuple): Option indices of the application's own settings.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> own: tuple = BulkImporter.own_indices(indices, json_handler.get_profile_layers(), "DirectX 11")
+        """
+        # Unpack inputs
+        indices: tuple = indices_input
+
+        inherited: tuple = SettingsCode.indices(layers_input.resolve(SettingsCode.EMPTY, app_gapi_input))
+        own: list = [0 if index == inherited_index else index for index, inherited_index in zip(indices, inherited)]
+        for combobox_id, shown_by in enumerate(SettingsRegistry.SHOWN_BY_ID):
+            if shown_by is not None and own[combobox_id]:
+                own[shown_by[0]] = indices[shown_by[0]]
+        return tuple(own)
+
+    @staticmethod
+    def summarise_report(report_input: dict) -> str:
+        """
+        Counts a report from run() for display.
+
+        Args:
+            report(dict): Report from run().
+
+        Returns:
+            (str): e.g. "12 imported (2 with unknown values), 3 kept, 40 without config files, 0 failed".
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> print(BulkImporter.summarise_report(report))
+        """
+        # Unpack inputs
+        report: dict = report_input
+
+        return (f"{len(report['imported'])} imported ({len(report['unknown'])} with unknown values), {len(report['kept'])} kept, "
+                f"{len(report['missing'])} without config files, {len(report['failures'])} failed")
+
+
+def main(argv_input: list = None) -> int:
+    """
+    Headless entry point: imports the config files of the applications in user_apps.json and prints the report.
+
+    Args:
+        argv(list): Command line arguments, None for sys.argv[1:].
+
+    Returns:
+        (int): Exit status, 1 if any application failed.
+
+    Examples:
+        Default usage:
+            .. code-block:: shell
+            >>> python -m Window.bulk_importer --json ~/user_apps.json --root /games/SteamLibrary
+    """
+    parser = argparse.ArgumentParser(prog="python -m Window.bulk_importer", description="Import existing dxvk.conf and vkBasalt.conf files into user_apps.json.")
+    parser.add_argument("--json", default="user_apps.json", help="path of user_apps.json (default: %(default)s)")
+    parser.add_argument("--root", default=None, help="only import applications under this directory, listing config directories of unknown applications")
+    parser.add_argument("--replace-saved", action="store_true", help="also replace settings already saved from the settings panel")
+    parser.add_argument("--workers", type=int, default=BulkImporter.MAX_WORKERS, help="files read at once (default: %(default)s)")
+    arguments = parser.parse_args(argv_input)
+
+    json_handler = AppJSONHandler(arguments.json)
+    conf_handler = AppConfHandler()
+    importer = BulkImporter(json_handler, conf_handler, arguments.workers)
+    apps: list = RedeployEngine(json_handler, conf_handler).load_apps()
+
+    report: dict = importer.run(apps, arguments.root, arguments.replace_saved)
+    print(f"Configuration files: {BulkImporter.summarise_report(report)}.")
+    for app_path, unknown in report["unknown"].items():
+        print(f"Unknown values in {os.path.dirname(app_path)}: " + ", ".join(f"{key} = {value}" for key, value in unknown))
+    for directory in report["unmatched"]:
+        print(f"No application for: {directory}")
+    for path, error in report["failures"].items():
+        print(f"Failed: {path}: {error}", file=sys.stderr)
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,7 +19,17 @@ Description: Configuration handler for saving settings to dxvk.conf and vkBasalt
 # ██████  ██  ██  ██      ██████  ██        ████  ████   #
 #                                                        #
 # ------------------------------------------------------ #
+import hashlib
+import json
 import os
+import stat as stat_module
+from concurrent.futures import ThreadPoolExecutor
+from Window.atomic_write import atomic_write, fsync_directory
+from Window.config_store import ConfigStore
+from Window.conf_parser import ConfDocument
+from Window.conf_template import DXVK_TEMPLATE, GENERATED_MARK, VKBASALT_TEMPLATE
+from Window.Settings import DXVK, VKBASALT, SettingsRegistry
+from Window.settings_record import SettingsRecord
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -38,490 +48,812 @@ class AppConfHandler:
     Class for handling dxvk and vkBasalt configuration files.
     """
 
+    # Upper bound on config files written at the same time by save_conf_many().
+    _MAX_WRITE_WORKERS: int = 8
+
+    # Bytes at the start of a config file searched for the generated mark.
+    _HEADER_BYTES: int = 4096
+
+    # Tools whose config files save_conf_many() writes when not told which fields changed.
+    _ALL_TOOLS: frozenset = frozenset((VKBASALT, DXVK))
+
+    # Outcome of deploying one config file.
+    WRITTEN: str = "written"
+    UNCHANGED: str = "unchanged"
+    SKIPPED: str = "skipped"
+
+    # Drift of one deployed config file from the settings it was rendered from.
+    IN_SYNC: str = "in sync"
+    MODIFIED: str = "modified"
+    MISSING: str = "missing"
+
+    # Config path -> (st_size, st_mtime_ns, rendered content hash, pristine hash) of the file as last written or read,
+    # shared by every handler. While size and mtime still match, the file is known to be up to date without reading
+    # it. The pristine hash is the hash of the file's content when it was exactly a rendered template, None once it
+    # held anything else; a file still holding that content may be replaced, any other is merged into.
+    _deployed: dict = {}
+
+    # Directories config files were deployed to, shared by every handler.
+    _deployed_directories: set = set()
+
+    # Where load_deployed() and save_deployed() keep _deployed and _deployed_directories between runs.
+    DEPLOYED_CACHE: str = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "linux-3d-settings-manager", "deployed.json")
+
+    # Deployment modes: a copy of the config in each game directory, or a link to the shared config store.
+    COPY: str = "copy"
+    SYMLINK: str = "symlink"
+    HARDLINK: str = "hardlink"
+    DEPLOY_MODES: tuple = (COPY, SYMLINK, HARDLINK)
+
+    # Mode and store used by every handler, see set_deploy_mode().
+    _deploy_mode: str = COPY
+    _config_store: ConfigStore = None
+
     def __init__(self, dxvk_config="dxvk.conf", vkbasalt_config="vkBasalt.conf"):
         self._dxvk_config: str = dxvk_config
         self._vkbasalt_config: str = vkbasalt_config
 
+    # --------------------------------------------------------------------------- #
+    # Deployment mode                                                             #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def set_deploy_mode(cls,
+                        mode_in: str,
+                        config_store_in: ConfigStore = None) -> None:
+        """
+        Sets how every handler deploys config files: COPY writes them into the game directory, SYMLINK and HARDLINK
+        write each distinct config once into a content addressed store and link it into the game directory.
+
+        Args:
+            mode_in (str): COPY, SYMLINK or HARDLINK.
+            config_store_in (ConfigStore): Store of the link modes, None for the default store.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the mode is unknown.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> AppConfHandler.set_deploy_mode(AppConfHandler.SYMLINK)
+        """
+        if mode_in not in cls.DEPLOY_MODES:
+            raise ValueError(f"Unknown deploy mode {mode_in!r}")
+        cls._deploy_mode = mode_in
+        if config_store_in is not None:
+            cls._config_store = config_store_in
+        elif mode_in != cls.COPY and cls._config_store is None:
+            cls._config_store = ConfigStore()
+
+    @classmethod
+    def deploy_mode(cls) -> str:
+        """
+        Gets the current deployment mode.
+
+        Args:
+            None.
+
+        Returns:
+            str: COPY, SYMLINK or HARDLINK.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> linked = AppConfHandler.deploy_mode() != AppConfHandler.COPY
+        """
+        return cls._deploy_mode
+
+    def collect_garbage(self,
+                        app_paths_in: list) -> list:
+        """
+        Deletes config store blobs which nothing links to any more. The config files of every directory ever deployed
+        to count as links too, so the links of deleted applications whose configs were kept, or of applications not
+        passed in, keep their blobs.
+
+        Args:
+            app_paths_in (list): Paths of every application in the library, as in user_apps.json.
+
+        Returns:
+            list: Paths of the deleted blobs, empty if no store is in use.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> removed = conf_handler.collect_garbage([app["app_path"] for app in apps])
+        """
+        if self._config_store is None:
+            return []
+        directories: set = {os.path.dirname(app_path) for app_path in app_paths_in} | self._deployed_directories
+        return self._config_store.collect_garbage([os.path.join(directory, conf_name) for directory in directories for conf_name in self.conf_names()])
+
+    @classmethod
+    def is_store_link(cls,
+                      conf_path_in: str) -> bool:
+        """
+        Checks whether a config file is a symlink into the config store, even one whose blob is gone.
+
+        Args:
+            conf_path_in (str): Path of the config file.
+
+        Returns:
+            bool: 'True' if the file links to a store blob.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> if AppConfHandler.is_store_link("/path/to/dxvk.conf"):
+        """
+        try:
+            target: str = os.readlink(conf_path_in)
+        except OSError:
+            return False
+        return (cls._config_store or ConfigStore()).holds(target)
+
+    def conf_paths(self,
+                   app_path_in: str) -> tuple:
+        """
+        Gets the paths of an application's config files.
+
+        Args:
+            app_path_in (str): Path to the application's executable.
+
+        Returns:
+            tuple: (vkBasalt.conf path, dxvk.conf path) in the executable's directory.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> vkbasalt_path, dxvk_path = conf_handler.conf_paths("/path/to/app")
+        """
+        directory_path: str = os.path.dirname(app_path_in) + "/"
+        return f"{directory_path}{self._vkbasalt_config}", f"{directory_path}{self._dxvk_config}"
+
+    def conf_names(self) -> tuple:
+        """
+        Gets the file names of the config files.
+
+        Args:
+            None.
+
+        Returns:
+            tuple: (vkBasalt.conf name, dxvk.conf name).
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> vkbasalt_name, dxvk_name = conf_handler.conf_names()
+        """
+        return self._vkbasalt_config, self._dxvk_config
+
+    # --------------------------------------------------------------------------- #
+    # Rendering                                                                   #
+    # --------------------------------------------------------------------------- #
+    @staticmethod
+    def render_vkbasalt(settings_record_in: SettingsRecord) -> str:
+        """
+        Renders the vkBasalt configuration of a settings record, without touching disk.
+
+        Args:
+            settings_record_in (SettingsRecord): Settings values from the GUI.
+
+        Returns:
+            str: Whole vkBasalt.conf text.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> text = AppConfHandler.render_vkbasalt(settings_record)
+        """
+        return VKBASALT_TEMPLATE.render(settings_record_in)
+
+    @staticmethod
+    def render_dxvk(settings_record_in: SettingsRecord) -> str:
+        """
+        Renders the DXVK configuration of a settings record, without touching disk.
+
+        Args:
+            settings_record_in (SettingsRecord): Settings values from the GUI.
+
+        Returns:
+            str: Whole dxvk.conf text.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> text = AppConfHandler.render_dxvk(settings_record)
+        """
+        return DXVK_TEMPLATE.render(settings_record_in)
+
+    @staticmethod
+    def merge_vkbasalt(existing_text_in: str,
+                       settings_record_in: SettingsRecord) -> str:
+        """
+        Merges a settings record into an existing vkBasalt configuration, hand written or edited, without touching
+        disk. Only the lines of selected settings change; comments and unknown keys are kept.
+
+        Args:
+            existing_text_in (str): Text of the existing vkBasalt.conf.
+            settings_record_in (SettingsRecord): Settings values from the GUI.
+
+        Returns:
+            str: Merged vkBasalt.conf text.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> text = AppConfHandler.merge_vkbasalt(existing_text, settings_record)
+        """
+        document: ConfDocument = ConfDocument.parse(existing_text_in)
+        VKBASALT_TEMPLATE.merge(document, settings_record_in)
+        return document.render()
+
+    @staticmethod
+    def merge_dxvk(existing_text_in: str,
+                   settings_record_in: SettingsRecord) -> str:
+        """
+        Merges a settings record into an existing DXVK configuration, hand written or edited, without touching disk.
+        Only the lines of selected settings change; comments and unknown keys are kept.
+
+        Args:
+            existing_text_in (str): Text of the existing dxvk.conf.
+            settings_record_in (SettingsRecord): Settings values from the GUI.
+
+        Returns:
+            str: Merged dxvk.conf text.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> text = AppConfHandler.merge_dxvk(existing_text, settings_record)
+        """
+        document: ConfDocument = ConfDocument.parse(existing_text_in)
+        DXVK_TEMPLATE.merge(document, settings_record_in)
+        return document.render()
+
+    # --------------------------------------------------------------------------- #
+    # Importing                                                                   #
+    # --------------------------------------------------------------------------- #
+    def import_conf(self,
+                    app_path_in: str) -> tuple:
+        """
+        Reads an application's existing vkBasalt.conf and dxvk.conf back into settings panel option indices.
+
+        Args:
+            app_path_in (str): Path to the application's executable.
+
+        Returns:
+            tuple: (option indices or None if neither file exists, ((config key, value), ...) of the values which are
+                not options of their setting), as from SettingsRegistry.option_indices_from_config().
+
+        Raises:
+            OSError: If a file exists but cannot be read.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> indices, unknown = conf_handler.import_conf("/path/to/app")
+        """
+        values: dict = {}
+        found: bool = False
+        for conf_path in self.conf_paths(app_path_in):
+            try:
+                with open(conf_path, "r", encoding="utf-8", errors="replace") as conf_file:
+                    values.update(ConfDocument.parse(conf_file.read()).items())
+                found = True
+            except FileNotFoundError:
+                pass
+        if not found:
+            return None, ()
+        return SettingsRegistry.option_indices_from_config(values)
+
+    # --------------------------------------------------------------------------- #
+    # Saving                                                                      #
+    # --------------------------------------------------------------------------- #
+    @staticmethod
+    def _content_hash(data: bytes) -> bytes:
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    @classmethod
+    def is_pristine(cls,
+                    conf_path_in: str,
+                    existing_in: bytes) -> bool:
+        """
+        Checks whether a config file holds a template as rendered, so it may be replaced or removed. A file known from
+        an earlier deploy is pristine while it holds what was deployed, one not known (e.g. written by an older
+        version, or before the deploy cache was cleared) if it carries the generated mark.
+
+        Args:
+            conf_path_in (str): Path of the config file.
+            existing_in (bytes): Content of the file.
+
+        Returns:
+            bool: 'True' if the file is pristine, 'False' if it is hand written or was edited since it was deployed.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> pristine = AppConfHandler.is_pristine("/path/to/dxvk.conf", existing)
+        """
+        # Unpack inputs
+        existing: bytes = existing_in
+
+        known: tuple = cls._deployed.get(conf_path_in)
+        if known is not None:
+            return known[3] == cls._content_hash(existing)
+        return GENERATED_MARK.encode("utf-8") in existing[:cls._HEADER_BYTES]
+
+    def _expected(self,
+                  conf_path: str,
+                  existing: bytes,
+                  data: bytes,
+                  merge_in) -> bytes:
+        # A pristine file is replaced; any other, hand written or edited since it was deployed, keeps its lines and
+        # has the managed keys merged in.
+        if merge_in is None or existing == data or self.is_pristine(conf_path, existing):
+            return data
+        return merge_in(existing.decode("utf-8", errors="surrogateescape")).encode("utf-8", errors="surrogateescape")
+
+    def _is_edited(self,
+                   conf_path: str,
+                   data: bytes) -> bool:
+        # A plain file, not a link, whose content is not a template as rendered and deployed.
+        try:
+            stat: os.stat_result = os.lstat(conf_path)
+            if not stat_module.S_ISREG(stat.st_mode) or stat.st_nlink != 1:
+                return False
+            with open(conf_path, "rb") as conf_file:
+                existing: bytes = conf_file.read()
+        except OSError:
+            return False
+        return existing != data and not self.is_pristine(conf_path, existing)
+
+    def check_conf(self,
+                   conf_path_in: str,
+                   text_in: str,
+                   merge_in=None) -> str:
+        """
+        Checks whether a deployed config file still holds what deploy_conf() would write, without writing anything.
+        Like deploy_conf(), a file unchanged since it was last written or read is not read again.
+
+        Args:
+            conf_path_in (str): Path of the config file.
+            text_in (str): Rendered config text.
+            merge_in (callable): merge(existing text) -> expected text, for files which are not the template as
+                deployed. None to compare every file with the rendered text.
+
+        Returns:
+            str: IN_SYNC, MODIFIED, MISSING if the file was deleted, or SKIPPED if its directory does not exist
+                (e.g. an uninstalled game).
+
+        Raises:
+            OSError: If the file exists but cannot be read.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> drift = conf_handler.check_conf("/path/to/dxvk.conf", AppConfHandler.render_dxvk(settings_record))
+        """
+        # Unpack inputs
+        conf_path: str = conf_path_in
+        data: bytes = text_in.encode("utf-8")
+
+        content_hash: bytes = self._content_hash(data)
+        try:
+            stat: os.stat_result = os.stat(conf_path)
+        except FileNotFoundError:
+            return self.MISSING if os.path.isdir(os.path.dirname(conf_path)) else self.SKIPPED
+
+        # Only plain files are cached, as in deploy_conf(); links are read through.
+        plain: bool = stat.st_nlink == 1 and not os.path.islink(conf_path)
+        known: tuple = self._deployed.get(conf_path)
+        if plain and known is not None and known[:3] == (stat.st_size, stat.st_mtime_ns, content_hash):
+            return self.IN_SYNC
+
+        with open(conf_path, "rb") as conf_file:
+            existing: bytes = conf_file.read()
+        expected: bytes = self._expected(conf_path, existing, data, merge_in) if plain else data
+        if existing != expected:
+            return self.MODIFIED
+        if plain:
+            self._deployed[conf_path] = (stat.st_size, stat.st_mtime_ns, content_hash, content_hash if expected == data else None)
+        return self.IN_SYNC
+
+    @classmethod
+    def load_deployed(cls,
+                      cache_path_in: str = None) -> None:
+        """
+        Reads the sizes, mtimes and hashes of deployed files saved by save_deployed(), so files deployed in an earlier
+        run are not read again while unchanged, and the directories deployed to. Entries already known in this run
+        are kept.
+
+        Args:
+            cache_path_in (str): Cache file, None for DEPLOYED_CACHE.
+
+        Returns:
+            None.
+
+        Raises:
+            None. A missing or unreadable cache is ignored.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> AppConfHandler.load_deployed()
+        """
+        try:
+            with open(cache_path_in or cls.DEPLOYED_CACHE, "r", encoding="utf-8") as cache_file:
+                cache: dict = json.load(cache_file)
+            for conf_path, (size, mtime_ns, content_hash, pristine_hash) in cache["files"].items():
+                cls._deployed.setdefault(conf_path, (size, mtime_ns, bytes.fromhex(content_hash), bytes.fromhex(pristine_hash) if pristine_hash else None))
+            cls._deployed_directories.update(cache["directories"])
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+
+    @classmethod
+    def save_deployed(cls,
+                      cache_path_in: str = None) -> None:
+        """
+        Writes the sizes, mtimes and hashes of deployed files, and the directories deployed to, for load_deployed().
+
+        Args:
+            cache_path_in (str): Cache file, None for DEPLOYED_CACHE.
+
+        Returns:
+            None.
+
+        Raises:
+            OSError: If the cache cannot be written.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> AppConfHandler.save_deployed()
+        """
+        cache_path: str = cache_path_in or cls.DEPLOYED_CACHE
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        cache: dict = {"files": {conf_path: (size, mtime_ns, content_hash.hex(), pristine_hash.hex() if pristine_hash else None)
+                                 for conf_path, (size, mtime_ns, content_hash, pristine_hash) in list(cls._deployed.items())},
+                       "directories": sorted(cls._deployed_directories)}
+        atomic_write(cache_path, json.dumps(cache).encode("utf-8"), False)
+
+    @classmethod
+    def deployed_directories(cls) -> frozenset:
+        """
+        Gets the directories config files were deployed to, in this run and in earlier runs loaded by load_deployed().
+
+        Args:
+            None.
+
+        Returns:
+            frozenset: Directory paths.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> directories = AppConfHandler.deployed_directories()
+        """
+        return frozenset(cls._deployed_directories)
+
+    def forget_conf(self,
+                    conf_path_in: str) -> None:
+        """
+        Drops a removed config file from the deploy cache, and its directory from the deployed directories once none
+        of its config files are left, as a remaining link still keeps its blob alive.
+
+        Args:
+            conf_path_in (str): Path of the removed config file.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> conf_handler.forget_conf("/path/to/dxvk.conf")
+        """
+        directory: str = os.path.dirname(conf_path_in)
+        self._deployed.pop(conf_path_in, None)
+        if not any(os.path.lexists(os.path.join(directory, conf_name)) for conf_name in self.conf_names()):
+            self._deployed_directories.discard(directory)
+
+    def deploy_conf(self,
+                    conf_path_in: str,
+                    text_in: str,
+                    sync_directory_in: bool = True,
+                    merge_in=None) -> str:
+        """
+        Writes a config file only if its content differs from the file on disk, so unchanged files keep their mtime and
+        do not wake file watchers. The file is only read when it has changed since it was last written or read. Writes
+        are atomic, a crash leaves the old file rather than a truncated one. Only a file still holding the template
+        exactly as deployed is replaced; a hand written file, or one edited since it was deployed, is merged into so
+        its other lines are kept. In the link modes the content goes to the config store and the file becomes a link
+        to it, unless it is such a file.
+
+        Args:
+            conf_path_in (str): Path of the config file.
+            text_in (str): Rendered config text.
+            sync_directory_in (bool): Fsync the directory after writing, see atomic_write().
+            merge_in (callable): merge(existing text) -> text to write, for files which are not the template as
+                deployed. None to replace every file.
+
+        Returns:
+            str: WRITTEN, UNCHANGED, or SKIPPED if the file's directory does not exist (e.g. an uninstalled game).
+
+        Raises:
+            OSError: If the file cannot be read or written.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> outcome = conf_handler.deploy_conf("/path/to/dxvk.conf", AppConfHandler.render_dxvk(settings_record))
+        """
+        outcome: str = self._deploy_conf(conf_path_in, text_in.encode("utf-8"), sync_directory_in, merge_in)
+
+        # Directories deployed to, where the orphan collector looks for configs of removed applications.
+        if outcome != self.SKIPPED:
+            self._deployed_directories.add(os.path.dirname(conf_path_in))
+        return outcome
+
+    def _deploy_conf(self,
+                     conf_path: str,
+                     data: bytes,
+                     sync_directory_in: bool,
+                     merge_in) -> str:
+        # Hand written and edited files stay merged copies in the link modes too.
+        if self._deploy_mode != self.COPY and not (merge_in is not None and self._is_edited(conf_path, data)):
+            if not os.path.isdir(os.path.dirname(conf_path)):
+                return self.SKIPPED
+            if not self._config_store.link(self._config_store.put(data), conf_path, self._deploy_mode == self.HARDLINK):
+                return self.UNCHANGED
+            if sync_directory_in:
+                fsync_directory(os.path.dirname(conf_path))
+            return self.WRITTEN
+
+        # Hash of the rendered text; the file on disk may hold a merge of it into a hand written or edited file.
+        content_hash: bytes = self._content_hash(data)
+        rendered: bytes = data
+        try:
+            stat: os.stat_result = os.stat(conf_path)
+        except FileNotFoundError:
+            if not os.path.isdir(os.path.dirname(conf_path)):
+                return self.SKIPPED
+        else:
+            known: tuple = self._deployed.get(conf_path)
+            if known is not None and known[:3] == (stat.st_size, stat.st_mtime_ns, content_hash):
+                return self.UNCHANGED
+
+            # Links left by a link mode become copies; plain files are compared, and merged into unless they still
+            # hold the template as deployed.
+            if stat.st_nlink == 1 and not os.path.islink(conf_path):
+                with open(conf_path, "rb") as conf_file:
+                    existing: bytes = conf_file.read()
+                data = self._expected(conf_path, existing, data, merge_in)
+                if existing == data:
+                    self._deployed[conf_path] = (stat.st_size, stat.st_mtime_ns, content_hash, content_hash if data == rendered else None)
+                    return self.UNCHANGED
+
+        atomic_write(conf_path, data, sync_directory_in)
+        stat = os.stat(conf_path)
+        self._deployed[conf_path] = (stat.st_size, stat.st_mtime_ns, content_hash, content_hash if data == rendered else None)
+        return self.WRITTEN
+
     def save_conf_vkbasalt(self,
                            app_path_in: str,
-                           settings_list: list) -> None:
+                           settings_record_in: SettingsRecord,
+                           sync_directory_in: bool = True) -> str:
         """
-        Saves vkBasalt configuration based on provided settings from dropdowns in settings_panel.py.
+        Saves vkBasalt configuration based on provided settings from dropdowns in settings_panel.py, if it changed.
 
         Args:
             app_path_in (str): Path to the application directory.
-            settings_list (list): List of settings values from the GUI.
+            settings_record_in (SettingsRecord): Settings values from the GUI.
+            sync_directory_in (bool): Fsync the directory after writing, see atomic_write().
         
         Returns:
-            None.
+            str: WRITTEN, UNCHANGED or SKIPPED, as from deploy_conf().
 
         Raises:
-            None.
+            OSError: If the file cannot be written.
         
         Example:
             Default usage:
                 .. code-block:: python
                 >>> conf_handler = AppConfHandler()
-                >>> conf_handler.save_conf_vkbasalt("/path/to/app", settings_list)
-        """
-        # Unpack settings list
-        gui_data: list = settings_list
-
-        fxaa_enable: bool = gui_data[0]
-        fxaa_quality_subpixel: str = gui_data[1]
-        fxaa_quality_edge: str = gui_data[2]
-        fxaa_edge_threshold: str = gui_data[3]
-        smaa_enable: bool = gui_data[4]
-        smaa_edge_detection: str = gui_data[5]
-        smaa_threshold: str = gui_data[6]
-        smaa_search_steps: str = gui_data[7]
-        smaa_search_steps_diagonal: str = gui_data[8]
-        smaa_corner_rounding: str = gui_data[9]
-        cas_enable: bool = gui_data[18]
-        cas_sharpness: str = gui_data[19]
-        dls_enable: bool = gui_data[20]
-        dls_sharpness: str = gui_data[21]
-        dls_denoise: str = gui_data[22]
-        
+                >>> conf_handler.save_conf_vkbasalt("/path/to/app", settings_record)
+        """
         # Get Directory Path
         directory_path: str = os.path.dirname(app_path_in) + "/"
-        
 
-        # Determine CAS string
-        if cas_enable == True:
-            cas_str: str = "cas"
-        else:
-            cas_str: str = ""
-
-        # Determine DLS string
-        if dls_enable == True:
-            dls_str: str = "dls"
-        else:
-            dls_str: str = ""
-
-        # Determine FXAA string
-        if fxaa_enable == True:
-            fxaa_str: str = "fxaa"
-        else:
-            fxaa_str: str = ""
-
-        # Determine SMAA string
-        if smaa_enable == True:
-            smaa_str: str = "smaa"
-        else:
-            smaa_str: str = ""
-
-        with open(f"{directory_path}{self._vkbasalt_config}", "w+") as vkbasalt_conf_file:
-            vkbasalt_conf_file.write("# vkBasalt Configuration File\n")
-            vkbasalt_conf_file.write("# Generated by Linux 3D Graphics Settings Manager\n# \n")
-            vkbasalt_conf_file.write("# Effects List:\n")
-            vkbasalt_conf_file.write(f"effects = {smaa_str}:{fxaa_str}:{dls_str}:{cas_str}\n\n")
-            
-            # Rationale for effects order
-            vkbasalt_conf_file.write("# Effect Order Rationale:\n")
-            vkbasalt_conf_file.write("# SMAA is applied first to handle primary anti-aliasing.\n")
-            vkbasalt_conf_file.write("# FXAA follows to further smooth edges after SMAA.\n")
-            vkbasalt_conf_file.write("# DLS is applied next to enhance image sharpness after AA passes.\n")
-            vkbasalt_conf_file.write("# CAS is applied last to provide final sharpening to the image.\n")
-            vkbasalt_conf_file.write("# This works in this order despite one or more setttings being disabled.\n# \n")
-            
-            # Separator
-            vkbasalt_conf_file.write("# \n")
-
-            # Write CAS settings
-            vkbasalt_conf_file.write("# Contrast Adaptive Sharpening (CAS) Settings\n# \n")
-            if cas_enable == True:
-                # Write CAS Sharpness selected setting
-                vkbasalt_conf_file.write("# CAS Sharpness Amount:\n# \n")
-                if cas_sharpness == "Off" or cas_sharpness == "Select Option...":
-                    vkbasalt_conf_file.write("# casSharpness = 0.0\n")
-                else:
-                    vkbasalt_conf_file.write(f"casSharpness = {cas_sharpness}\n")
-            elif cas_enable == "Disabled" or cas_enable == "Select Option...":
-                vkbasalt_conf_file.write("# casSharpness = 0.0\n")
-            
-            # Separator
-            vkbasalt_conf_file.write("# \n")
-
-            # Write DLS settings
-            vkbasalt_conf_file.write("# Denoised Luma Sharpening (DLS) Settings\n# \n")
-            if dls_enable == True:
-                # Write DLS Sharpness selected setting
-                vkbasalt_conf_file.write("# DLS Sharpness Amount:\n# \n")
-                if dls_sharpness == "Select Option...":
-                    vkbasalt_conf_file.write("# dlsSharpness = 0.0\n")
-                else:
-                    vkbasalt_conf_file.write(f"dlsSharpness = {dls_sharpness}\n")
-                
-                # Separator
-                vkbasalt_conf_file.write("# \n")
-
-                # Write DLS Denoise selected setting
-                vkbasalt_conf_file.write("# DLS Denoise Amount:\n# \n")
-                if dls_denoise == "Select Option...":
-                    vkbasalt_conf_file.write("# dlsDenoise = 0.0\n")
-                else:
-                    vkbasalt_conf_file.write(f"dlsDenoise = {dls_denoise}\n")
-            elif dls_enable == "Disabled" or dls_enable == "Select Option...":
-                vkbasalt_conf_file.write("# dlsSharpness = 0.0\n")
-                vkbasalt_conf_file.write("# dlsDenoise = 0.0\n")
-
-            # Separator
-            vkbasalt_conf_file.write("# \n")
-
-            # Write FXAA settings
-            vkbasalt_conf_file.write("# FXAA Settings\n# \n")
-            if fxaa_enable == True:
-                # Write FXAA Quality Subpixel selected setting
-                vkbasalt_conf_file.write("# FXAA Quality Subpixel:\n# \n")
-                if fxaa_quality_subpixel == "Select Option...":
-                    vkbasalt_conf_file.write("# fxaaQualitySubpix = 0.00\n")
-                else:
-                    vkbasalt_conf_file.write(f"fxaaQualitySubpix = {fxaa_quality_subpixel}\n")
-                
-                # Separator
-                vkbasalt_conf_file.write("# \n")
-
-                # Write FXAA Quality Edge selected setting
-                vkbasalt_conf_file.write("# FXAA Quality Edge:\n# \n")
-                if fxaa_quality_edge == "Select Option...":
-                    vkbasalt_conf_file.write("# fxaaQualityEdgeThreshold = disabled\n")
-                elif fxaa_quality_edge == "Lowest Quality":
-                    vkbasalt_conf_file.write("fxaaQualityEdgeThreshold = 0.333\n")
-                elif fxaa_quality_edge == "Low Quality":
-                    vkbasalt_conf_file.write("fxaaQualityEdgeThreshold = 0.250\n")
-                elif fxaa_quality_edge == "Default":
-                    vkbasalt_conf_file.write("fxaaQualityEdgeThreshold = 0.166\n")
-                elif fxaa_quality_edge == "High Quality":
-                    vkbasalt_conf_file.write("fxaaQualityEdgeThreshold = 0.115\n")
-                elif fxaa_quality_edge == "Highest Quality":
-                    vkbasalt_conf_file.write("fxaaQualityEdgeThreshold = 0.063\n")
-                
-                # Separator
-                vkbasalt_conf_file.write("# \n")
-
-                # Write FXAA Edge Threshold selected setting
-                vkbasalt_conf_file.write("# FXAA Edge Threshold:\n# \n")
-                if fxaa_edge_threshold == "Select Option...":
-                    vkbasalt_conf_file.write("# fxaaEdgeThreshold = disabled\n")
-                elif fxaa_edge_threshold == "Zero":
-                    vkbasalt_conf_file.write("fxaaEdgeThreshold = 0.0000\n")
-                elif fxaa_edge_threshold == "Visible Limit":
-                    vkbasalt_conf_file.write("fxaaEdgeThreshold = 0.0312\n")
-                elif fxaa_edge_threshold == "High Quality":
-                    vkbasalt_conf_file.write("fxaaEdgeThreshold = 0.0625\n")
-                elif fxaa_edge_threshold == "Upper Limit":
-                    vkbasalt_conf_file.write("fxaaEdgeThreshold = 0.0833\n")
-            elif fxaa_enable == "Disabled" or fxaa_enable == "Select Option...":
-                vkbasalt_conf_file.write("# fxaaQualitySubpix = disabled\n")
-                vkbasalt_conf_file.write("# fxaaQualityEdgeThreshold = disabled\n")
-                vkbasalt_conf_file.write("# fxaaEdgeThreshold = disabled\n")
-
-                # Separator
-                vkbasalt_conf_file.write("# \n")
-
-            # Write SMAA settings
-            vkbasalt_conf_file.write("# SMAA Settings\n# \n")
-            if smaa_enable == True:
-                # Write SMAA Edge Detection selected setting
-                vkbasalt_conf_file.write("# SMAA Edge Detection Mode:\n# \n")
-                if smaa_edge_detection == "Select Option...":
-                    vkbasalt_conf_file.write("# smaaEdgeDetection = disabled\n")
-                elif smaa_edge_detection == "Color":
-                    vkbasalt_conf_file.write("smaaEdgeDetection = color\n")
-                elif smaa_edge_detection == "Luma":
-                    vkbasalt_conf_file.write("smaaEdgeDetection = luma\n")
-                
-                # Separator
-                vkbasalt_conf_file.write("# \n")
-
-                # Write SMAA Threshold selected setting
-                vkbasalt_conf_file.write("# SMAA Threshold:\n# \n")
-                if smaa_threshold == "Select Option...":
-                    vkbasalt_conf_file.write("# smaaThreshold = disabled\n")
-                elif smaa_threshold == "Lowest Quality":
-                    vkbasalt_conf_file.write("smaaThreshold = 0.50\n")
-                elif smaa_threshold == "Low Quality":
-                    vkbasalt_conf_file.write("smaaThreshold = 0.40\n")
-                elif smaa_threshold == "Balanced":
-                    vkbasalt_conf_file.write("smaaThreshold = 0.25\n")
-                elif smaa_threshold == "Quality":
-                    vkbasalt_conf_file.write("smaaThreshold = 0.10\n")
-                elif smaa_threshold == "Highest Quality":
-                    vkbasalt_conf_file.write("smaaThreshold = 0.05\n")
-                
-                # Separator
-                vkbasalt_conf_file.write("# \n")
-
-                # Write SMAA Search Steps selected setting
-                vkbasalt_conf_file.write("# SMAA Search Steps:\n# \n")
-                if smaa_search_steps == "Select Option...":
-                    vkbasalt_conf_file.write("# smaaMaxSearchSteps = disabled\n")
-                else:
-                    vkbasalt_conf_file.write(f"smaaMaxSearchSteps = {smaa_search_steps.strip("x")}\n")
-                
-                # Separator
-                vkbasalt_conf_file.write("# \n")
-
-                # Write SMAA Search Steps Diagonal selected setting
-                vkbasalt_conf_file.write("# SMAA Search Steps Diagonal:\n# \n")
-                if smaa_search_steps_diagonal == "Select Option...":
-                    vkbasalt_conf_file.write("# smaaMaxSearchStepsDiag = disabled\n")
-                else:
-                    vkbasalt_conf_file.write(f"smaaMaxSearchStepsDiag = {smaa_search_steps_diagonal.strip("x")}\n")
-
-                # Separator
-                vkbasalt_conf_file.write("# \n")
-
-                # Write SMAA Corner Rounding selected setting
-                vkbasalt_conf_file.write("# SMAA Corner Rounding:\n# \n")
-                if smaa_corner_rounding == "Select Option...":
-                    vkbasalt_conf_file.write("# smaaCornerRounding = disabled\n")
-                else:
-                    vkbasalt_conf_file.write(f"smaaCornerRounding = {smaa_corner_rounding}\n")
-            elif smaa_enable == "Disabled" or smaa_enable == "Select Option...":
-                vkbasalt_conf_file.write("# smaaEdgeDetection = luma\n")
-                vkbasalt_conf_file.write("# smaaThreshold = disabled\n")
-                vkbasalt_conf_file.write("# smaaSearchSteps = disabled\n")
-                vkbasalt_conf_file.write("# smaaSearchStepsDiagonal = disabled\n")
+        return self.deploy_conf(f"{directory_path}{self._vkbasalt_config}", self.render_vkbasalt(settings_record_in), sync_directory_in,
+                                lambda existing_text: self.merge_vkbasalt(existing_text, settings_record_in))
 
     def save_conf_dxvk(self,
                        app_path_in: str,
-                       settings_list: list) -> None:
+                       settings_record_in: SettingsRecord,
+                       sync_directory_in: bool = True) -> str:
         """
-        Saves DXVK configuration based on provided settings from dropdowns in settings_panel.py.
+        Saves DXVK configuration based on provided settings from dropdowns in settings_panel.py, if it changed.
 
         Args:
             app_path_in (str): Path to the application directory.
-            settings_list (list): List of settings values from the GUI.
+            settings_record_in (SettingsRecord): Settings values from the GUI.
+            sync_directory_in (bool): Fsync the directory after writing, see atomic_write().
         
         Returns:
-            None.
+            str: WRITTEN, UNCHANGED or SKIPPED, as from deploy_conf().
 
         Raises:
-            None.
+            OSError: If the file cannot be written.
         
         Example:
             Default usage:
                 .. code-block:: python
                 >>> conf_handler = AppConfHandler()
-                >>> conf_handler.save_conf_dxvk("/path/to/app", settings_list)
-        """
-        # Unpack settings list
-        gui_data: list = settings_list
-
-        anistropic_enable: str = gui_data[10]
-        anistropic_level: str = gui_data[11]
-        anistropic_level_d3d9: str = gui_data[12]
-        lod_enable: str = gui_data[13]
-        lod_bias: str = gui_data[14]
-        lod_bias_d3d9: str = gui_data[15]
-        clamp_negative_lod: str = gui_data[16]
-        clamp_negative_lod_d3d9: str = gui_data[17]
-        vsync_enable: str = gui_data[23]
-        vsync_level: str = gui_data[24]
-        vsync_level_d3d9: str = gui_data[25]
-        frame_limit_enable: str = gui_data[26]
-        frame_limit_level: str = gui_data[27]
-        frame_limit_level_d3d9: str = gui_data[28]
-        hdr_enable: bool = gui_data[29]
-        d3d_level: str = gui_data[30]
-        
+                >>> conf_handler.save_conf_dxvk("/path/to/app", settings_record)
+        """
         # Get Directory Path
         directory_path: str = os.path.dirname(app_path_in) + "/"
 
-        with open(f"{directory_path}{self._dxvk_config}", "w+") as dxvk_conf_file:
-            dxvk_conf_file.write("# DXVK Configuration File\n")
-            dxvk_conf_file.write("# Generated by Linux 3D Graphics Settings Manager\n# \n")
-
-            # Write Anisotropic Filtering settings
-            dxvk_conf_file.write("# Anisotropic Filtering Settings\n# \n")
-            if anistropic_enable == "Enable" and anistropic_level != None:
-                # Write Anisotropic Level selected setting
-                dxvk_conf_file.write("# Anisotropic Filtering Level for D3D10/11:\n# \n")
-                if anistropic_level == "Select Option...":
-                    dxvk_conf_file.write("# d3d11.samplerAnisotropy = disabled\n")
-                else:
-                    dxvk_conf_file.write(f"d3d11.samplerAnisotropy = {anistropic_level.strip("x")}\n")
-            elif anistropic_enable == "Disable" and anistropic_level == None:
-                dxvk_conf_file.write("# Anisotropic Filtering Level for D3D10/11:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# d3d11.samplerAnisotropy = disabled\n")
-
-            # Write Anisotropic Filtering settings for D3D9
-            if anistropic_enable == "Enable (D3D9)" and anistropic_level_d3d9 != None:
-                # Write Anisotropic Level selected setting
-                dxvk_conf_file.write("# Anisotropic Filtering Level for D3D9:\n# \n")
-                if anistropic_level_d3d9 == "Select Option...":
-                    dxvk_conf_file.write("# d3d9.samplerAnisotropy = disabled\n")
-                else:
-                    dxvk_conf_file.write(f"d3d9.samplerAnisotropy = {anistropic_level_d3d9.strip("x")}\n")
-            elif anistropic_enable == "Disable" and anistropic_level_d3d9 == None:
-                dxvk_conf_file.write("# Anisotropic Filtering Level for D3D9:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# d3d9.samplerAnisotropy = disabled\n")
-
-            # Separator
-            dxvk_conf_file.write("# \n")
-
-            # Write LOD settings
-            dxvk_conf_file.write("# Level of Detail (LOD) Settings\n# \n")
-            if lod_enable == "Enable" and lod_bias != None:
-                # Write LOD Bias selected setting
-                dxvk_conf_file.write("# LOD Bias for D3D10/11:\n# \n")
-                if lod_bias == "Select Option...":
-                    dxvk_conf_file.write("# d3d11.samplerLodBias = disabled\n")
-                else:
-                    dxvk_conf_file.write(f"d3d11.samplerLodBias = {lod_bias}\n")
-            elif lod_enable == "Disable" and lod_bias == None:
-                dxvk_conf_file.write("# LOD Bias for D3D10/11:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# d3d11.samplerLodBias = disabled\n")
-
-            # Write Clamp Negative LOD Bias settings
-            dxvk_conf_file.write("# Clamp Negative LOD Bias Settings\n# \n")
-            if lod_enable == "Enable" and clamp_negative_lod != None:
-                # Write Clamp Negative LOD selected setting
-                dxvk_conf_file.write("# Clamp Negative LOD for D3D10/11:\n# \n")
-                if clamp_negative_lod == "Select Option...":
-                    dxvk_conf_file.write("# d3d11.clampNegativeLodBias = disabled\n")
-                elif clamp_negative_lod == "Enabled":
-                    dxvk_conf_file.write("d3d11.clampNegativeLodBias = True\n")
-                elif clamp_negative_lod == "Disabled":
-                    dxvk_conf_file.write("d3d11.clampNegativeLodBias = False\n")
-            elif lod_enable == "Disable" and clamp_negative_lod == None:
-                dxvk_conf_file.write("# Clamp Negative LOD for D3D10/11:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# d3d11.clampNegativeLodBias = disabled\n")
-
-            # Write LOD settings for D3D9
-            if lod_enable == "Enable (D3D9)" and lod_bias_d3d9 != None:
-                # Write LOD Bias selected setting
-                dxvk_conf_file.write("# LOD Bias for D3D9:\n# \n")
-                if lod_bias_d3d9 == "Select Option...":
-                    dxvk_conf_file.write("# d3d9.samplerLodBias = disabled\n")
-                else:
-                    dxvk_conf_file.write(f"d3d9.samplerLodBias = {lod_bias_d3d9}\n")
-            elif lod_enable == "Disable" and lod_bias_d3d9 == None:
-                dxvk_conf_file.write("# LOD Bias for D3D9:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# d3d9.samplerLodBias = disabled\n")
-
-            # Write Clamp Negative LOD settings for D3D9
-            if lod_enable == "Enable (D3D9)" and clamp_negative_lod_d3d9 != None:
-                # Write Clamp Negative LOD selected setting
-                dxvk_conf_file.write("# Clamp Negative LOD for D3D9:\n# \n")
-                if clamp_negative_lod_d3d9 == "Select Option...":
-                    dxvk_conf_file.write("# d3d9.clampNegativeLodBias = disabled\n")
-                elif clamp_negative_lod_d3d9 == "Enabled":
-                    dxvk_conf_file.write("d3d9.clampNegativeLodBias = True\n")
-                elif clamp_negative_lod_d3d9 == "Disabled":
-                    dxvk_conf_file.write("d3d9.clampNegativeLodBias = False\n")
-            elif lod_enable == "Disable" and clamp_negative_lod_d3d9 == None:
-                dxvk_conf_file.write("# Clamp Negative LOD for D3D9:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# d3d9.clampNegativeLodBias = disabled\n")
-
-            # Separator
-            dxvk_conf_file.write("# \n")
-
-            # Write VSync settings
-            if vsync_enable == "Enable" and vsync_level != None:
-                # Write VSync selected setting
-                dxvk_conf_file.write("# VSync for D3D10/11:\n# \n")
-                if vsync_level == "Select Option...":
-                    dxvk_conf_file.write("# dxgi.syncInterval = -1\n")
-                elif vsync_level == "Off":
-                    dxvk_conf_file.write("dxgi.syncInterval = 0\n")
-                else:
-                    dxvk_conf_file.write(f"dxgi.syncInterval = {vsync_level.strip(" Frames")}\n")
-            elif vsync_enable == "Disable" and vsync_level == None:
-                dxvk_conf_file.write("# VSync for D3D10/11:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# dxgi.syncInterval = -1\n")
-            
-            # Write Frame Limit Settings
-            if frame_limit_enable == "Enable" and frame_limit_level != None:
-                # Write Frame limit selected setting
-                dxvk_conf_file.write("# \n# Frame Limit for D3D10/11:\n# \n")
-                if frame_limit_level == "Select Option...":
-                    dxvk_conf_file.write("# dxgi.maxFrameRate = 0\n")
-                else:
-                    dxvk_conf_file.write(f"dxgi.maxFrameRate = {frame_limit_enable}\n")
-            elif frame_limit_enable == "Disable" and frame_limit_enable == None:
-                dxvk_conf_file.write("# Frame Limit for D3D10/11:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# dxgi.maxFrameRate = 0\n")
-
-            # Write VSync settings for D3D9
-            if vsync_enable == "Enable (D3D9)" and vsync_level_d3d9 != None:
-                # Write VSync selected setting
-                dxvk_conf_file.write("# VSync for D3D9:\n# \n")
-                if vsync_level_d3d9 == "Select Option...":
-                    dxvk_conf_file.write("# d3d9.presentInterval = -1\n")
-                elif vsync_level_d3d9 == "Off":
-                    dxvk_conf_file.write("d3d9.presentInterval = 0\n")
-                else:
-                    dxvk_conf_file.write(f"d3d9.presentInterval = {vsync_level_d3d9.strip(" Frames")}\n")
-            elif vsync_enable == ("Disable") and vsync_level_d3d9 == None:
-                dxvk_conf_file.write("# VSync for D3D9:\n# \n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# d3d9.presentInterval = -1")
-
-            # Write Frame Limit settings for D3D9
-            if frame_limit_enable == "Enable (D3D9)" and frame_limit_level_d3d9 != None:
-                # Write Frame Limit selected setting
-                dxvk_conf_file.write("# Frame Limit for D3D9:\n# \n")
-                if frame_limit_level_d3d9 == "Select Opiton...":
-                    dxvk_conf_file.write("# d3d9.maxFrameRate = 0\n")
-                else:
-                    dxvk_conf_file.write(f"d3d9.maxFrameRate = {frame_limit_level_d3d9}\n")
-            elif frame_limit_enable == "Disable" and frame_limit_level_d3d9 == None:
-                dxvk_conf_file.write("# Frame Limit for D3D9:\n")
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# d3d9.maxFrameRate = 0\n")
-
-            # Write Tear Free setting to Auto
-            dxvk_conf_file.write("dxvk.tearFree = Auto\n")
-
-            # Separator
-            dxvk_conf_file.write("# \n")
-
-            # Write HDR setting
-            dxvk_conf_file.write("# HDR Setting:\n")
-            if hdr_enable == True:
-                dxvk_conf_file.write("dxgi.enableHDR = True\n")
-            elif hdr_enable == False:
-                dxvk_conf_file.write("dxgi.enableHDR = False\n")
-            elif hdr_enable == None:
-                dxvk_conf_file.write("# Disabled\n")
-                dxvk_conf_file.write("# dxgi.enableHDR = disabled\n")
-
-            # Separator
-            dxvk_conf_file.write("# \n")
-
-            # Write D3D Level setting
-            dxvk_conf_file.write("# D3D Feature Level:\n# \n")
-            if d3d_level != None:
-                # Write D3D Level selected setting
-                if d3d_level == "Direct X 9.1":
-                    dxvk_conf_file.write("d3d11.maxFeatureLevel = 9_1\n")
-                elif d3d_level == "Direct X 9.2":
-                    dxvk_conf_file.write("d3d11.maxFeatureLevel = 9_2\n")
-                elif d3d_level == "Direct X 9.3":
-                    dxvk_conf_file.write("d3d11.maxfeatureLevel = 9_3\n")
-                elif d3d_level == "Direct X 10.0":
-                    dxvk_conf_file.write("d3d11.maxFeatureLevel = 10_0\n")
-                elif d3d_level == "Direct X 10.1":
-                    dxvk_conf_file.write("d3d11.maxFeatureLevel = 10_1\n")
-                elif d3d_level == "Direct X 11.0":
-                    dxvk_conf_file.write("d3d11.maxFeatureLevel = 11_0\n")
-                elif d3d_level == "Direct X 11.1":
-                    dxvk_conf_file.write("d3d11.maxFeatureLevel = 11_1\n")
-                elif d3d_level == "Direct X 12.0":
-                    dxvk_conf_file.write("d3d11.maxFeatureLevel = 12_0\n")
-                elif d3d_level == "Direct X 12.1":
-                    dxvk_conf_file.write("d3d11.maxFeatureLevel = 12_1\n")
-            else:
-                dxvk_conf_file.write("# Disabled")
-                dxvk_conf_file.write("# d3d11.maxFeatureLevel = disabled")
+        return self.deploy_conf(f"{directory_path}{self._dxvk_config}", self.render_dxvk(settings_record_in), sync_directory_in,
+                                lambda existing_text: self.merge_dxvk(existing_text, settings_record_in))
+
+    @staticmethod
+    def tools_of(fields_input: tuple) -> frozenset:
+        """
+        Gets the tools whose config files are generated from any of the given settings fields.
+
+        Args:
+            fields_input (tuple): Settings field names, e.g. from SettingsRecord.diff().
+
+        Returns:
+            frozenset: VKBASALT and / or DXVK, empty when no fields are given.
+
+        Raises:
+            KeyError: If a name is not a settings field.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> AppConfHandler.tools_of(("cas_enable", "cas_level")) # frozenset({"vkBasalt"})
+        """
+        return frozenset(SettingsRegistry.TOOL_OF[field] for field in fields_input)
+
+    @classmethod
+    def summarise_report(cls,
+                         report_input: dict) -> str:
+        """
+        Counts the outcomes of a save_conf_many() report.
+
+        Args:
+            report_input (dict): Config path -> WRITTEN, UNCHANGED or SKIPPED.
+
+        Returns:
+            str: Summary such as "3 written, 5 unchanged, 0 skipped".
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> summary = AppConfHandler.summarise_report(report)
+        """
+        outcomes: list = list(report_input.values())
+        return ", ".join(f"{outcomes.count(outcome)} {outcome}" for outcome in (cls.WRITTEN, cls.UNCHANGED, cls.SKIPPED))
+
+    def save_conf_many(self,
+                       app_settings_input: list,
+                       report_input: dict | None = None) -> dict:
+        """
+        Saves vkBasalt and DXVK configuration for several applications, writing the files in parallel. Files whose
+        content is unchanged are not rewritten, and each directory is fsynced once after its files are written.
+
+        Args:
+            app_settings_input (list): List of (app_path, SettingsRecord) tuples, or (app_path, SettingsRecord, fields)
+                to regenerate only the config files of the tools those changed fields belong to.
+            report_input (dict | None): If given, filled with config path -> WRITTEN, UNCHANGED or SKIPPED.
+
+        Returns:
+            dict: Application path -> error message, for every application whose files could not be written.
+
+        Raises:
+            None.
+
+        Example:
+            Default usage:
+                .. code-block:: python
+                >>> conf_handler = AppConfHandler()
+                >>> failures = conf_handler.save_conf_many([("/path/to/app_a", settings_record), ("/path/to/app_b", settings_record)])
+        """
+        # Unpack inputs
+        app_settings: list = app_settings_input
+        report: dict = report_input if report_input is not None else {}
+
+        def save_both(app_path: str, settings_record: SettingsRecord, tools: frozenset) -> str | None:
+            directory_path: str = os.path.dirname(app_path) + "/"
+            try:
+                if VKBASALT in tools:
+                    report[f"{directory_path}{self._vkbasalt_config}"] = self.save_conf_vkbasalt(app_path, settings_record, False)
+                if DXVK in tools:
+                    report[f"{directory_path}{self._dxvk_config}"] = self.save_conf_dxvk(app_path, settings_record, False)
+            except OSError as error:
+                return str(error)
+            return None
+
+        if not app_settings:
+            return {}
+
+        # Applications sharing a directory share its config files, so each directory is written by one worker in
+        # the given order; different directories are independent. The work is file I/O, which releases the GIL.
+        by_directory: dict = {}
+        for item in app_settings:
+            tools: frozenset = self.tools_of(item[2]) if len(item) > 2 else self._ALL_TOOLS
+            by_directory.setdefault(os.path.dirname(item[0]), []).append((item[0], item[1], tools))
+
+        def save_directory(items: list) -> dict:
+            errors: dict = {}
+            for app_path, settings_record, tools in items:
+                error: str = save_both(app_path, settings_record, tools)
+                if error is not None:
+                    errors[app_path] = error
+
+            # One directory fsync makes every rename into it durable.
+            directory_path: str = os.path.dirname(items[0][0]) + "/"
+            if self.WRITTEN in (report.get(f"{directory_path}{self._vkbasalt_config}"), report.get(f"{directory_path}{self._dxvk_config}")):
+                try:
+                    fsync_directory(directory_path)
+                except OSError as error:
+                    for app_path, _, _ in items:
+                        errors.setdefault(app_path, str(error))
+            return errors
+
+        failures: dict = {}
+        with ThreadPoolExecutor(max_workers=min(self._MAX_WRITE_WORKERS, len(by_directory))) as executor:
+            for errors in executor.map(save_directory, by_directory.values()):
+                failures.update(errors)
+
+        # Saved after every batch, so a crash does not lose which files are pristine.
+        try:
+            self.save_deployed()
+        except OSError:
+            # Only costs reading the files again next time.
+            pass
+        return failures
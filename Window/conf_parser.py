@@ -0,0 +1,245 @@
+"""
+File       : conf_parser.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Round trip parser of dxvk.conf and vkBasalt.conf. A file is kept as its lines, with an index of the
+             "key = value" lines and of commented out "# key = value" lines, so values can be read and patched in place
+             and the file written back with its comments, layout and unknown keys untouched.
+"""
+
+# ------------------------------------------------------------------------------------------------------ #
+#                                                                                                        #
+# ██████                    ████          ████                                                           #
+# ██  ██  ██████  ██████    ██            ██  ██  ██████    ████  ██  ██  ██  ██    ████  ██████    ██   #
+# ██      ██  ██  ██  ██  ██████          ██  ██  ██  ██  ██      ██  ██  ██████  ██  ██  ██  ██  ██████ #
+# ██  ██  ██  ██  ██  ██    ██            ██  ██  ██  ██  ██      ██  ██  ██████  ████    ██  ██    ██   #
+# ██████  ██████  ██  ██    ██            ████    ██████    ████  ██████  ██  ██    ████  ██  ██    ████ #
+#                                                                                                        #
+# ------------------------------------------------------------------------------------------------------ #
+
+
+class ConfDocument:
+    """
+    Lines of a config file with the position of every assignment. Rendering an unchanged document gives back the
+    parsed text exactly.
+    """
+    __slots__ = ("lines", "_active", "_commented", "_ending")
+
+    def __init__(self, lines: list) -> None:
+        self.lines: list = lines
+
+        # Key -> indices of its "key = value" lines in file order, the last being the one that applies, and key ->
+        # index of the first "# key = value" line, where a disabled key is switched back on.
+        self._active: dict = {}
+        self._commented: dict = {}
+
+        # Lines are split on "\n", so a CRLF file keeps its "\r" on each line; added lines follow the file.
+        self._ending: str = "\r" if len(lines) > 1 and lines[0].endswith("\r") else ""
+        for index, line in enumerate(lines):
+            stripped: str = line.strip()
+            if not stripped:
+                continue
+            if stripped[0] == "#":
+                key, separator, _ = stripped[1:].partition("=")
+                key = key.strip()
+                # Prose comments containing "=" have spaces in their "key".
+                if separator and key and not any(character.isspace() for character in key):
+                    self._commented.setdefault(key, index)
+                continue
+            key, separator, _ = stripped.partition("=")
+            if separator:
+                self._active.setdefault(key.strip(), []).append(index)
+
+    # --------------------------------------------------------------------------- #
+    # Parsing                                                                     #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def parse(cls,
+              text_input: str) -> "ConfDocument":
+        """
+        Parses a config file's text.
+
+        Args:
+            text(str): Whole config file.
+
+        Returns:
+            (ConfDocument): Document of the text.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> document: ConfDocument = ConfDocument.parse(open("dxvk.conf").read())
+        """
+        return cls(text_input.split("\n"))
+
+    def render(self) -> str:
+        """
+        Returns the document as config file text.
+
+        Args:
+            None.
+
+        Returns:
+            (str): Whole config file.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> text: str = document.render()
+        """
+        return "\n".join(self.lines)
+
+    # --------------------------------------------------------------------------- #
+    # Reading                                                                     #
+    # --------------------------------------------------------------------------- #
+    def get(self,
+            key_input: str) -> str:
+        """
+        Gets the value a key is set to.
+
+        Args:
+            key(str): Config key, e.g. "dxgi.maxFrameRate".
+
+        Returns:
+            (str): Value, None if the key is not set or only commented out.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> frame_limit: str = document.get("dxgi.maxFrameRate")
+        """
+        indices: list = self._active.get(key_input)
+        if not indices:
+            return None
+        return self.lines[indices[-1]].partition("=")[2].strip()
+
+    def items(self) -> list:
+        """
+        Gets every key which is set, with its value, in file order.
+
+        Args:
+            None.
+
+        Returns:
+            (list): (key, value) tuples.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> values: dict = dict(document.items())
+        """
+        return [(key, self.lines[indices[-1]].partition("=")[2].strip()) for key, indices in sorted(self._active.items(), key=lambda item: item[1][-1])]
+
+    # --------------------------------------------------------------------------- #
+    # Patching                                                                    #
+    # --------------------------------------------------------------------------- #
+    def set(self,
+            key_input: str,
+            value_input: str) -> bool:
+        """
+        Sets a key, patching its line in place, switching a commented out line back on, or else appending a line.
+        Earlier lines setting the same key are commented out, so only the patched one applies.
+
+        Args:
+            key(str): Config key.
+            value(str): New value.
+
+        Returns:
+            (bool): 'True' if the document changed.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> document.set("dxgi.maxFrameRate", "60")
+        """
+        # Unpack inputs
+        key: str = key_input
+        value: str = value_input
+
+        indices: list = self._active.get(key)
+        if indices:
+            changed: bool = len(indices) > 1
+            for index in indices[:-1]:
+                self._comment_out(key, index)
+            index: int = indices[-1]
+            self._active[key] = [index]
+            if self.get(key) == value:
+                return changed
+            line: str = self.lines[index]
+            self.lines[index] = f"{line[:len(line) - len(line.lstrip())]}{key} = {value}{self._ending_of(line)}"
+            return True
+
+        index = self._commented.pop(key, None)
+        if index is None:
+            # Appended before the final empty line of a file ending in a newline.
+            index = len(self.lines) - 1 if self.lines[-1] == "" else len(self.lines)
+            self.lines.insert(index, f"{key} = {value}{self._ending}")
+            self._shift(index)
+        else:
+            self.lines[index] = f"{key} = {value}{self._ending_of(self.lines[index])}"
+        self._active[key] = [index]
+        return True
+
+    def disable(self,
+                key_input: str) -> bool:
+        """
+        Comments out every line setting a key, keeping their values for when it is switched back on.
+
+        Args:
+            key(str): Config key.
+
+        Returns:
+            (bool): 'True' if the document changed.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> document.disable("dxgi.enableHDR")
+        """
+        indices: list = self._active.pop(key_input, None)
+        if not indices:
+            return False
+        for index in indices:
+            self._comment_out(key_input, index)
+        return True
+
+    def _comment_out(self, key: str, index: int) -> None:
+        # The first commented out line of a key is where it is switched back on.
+        line: str = self.lines[index]
+        self.lines[index] = f"# {line.strip()}{self._ending_of(line)}"
+        self._commented[key] = min(index, self._commented.get(key, index))
+
+    @staticmethod
+    def _ending_of(line: str) -> str:
+        return "\r" if line.endswith("\r") else ""
+
+    def _shift(self, inserted: int) -> None:
+        # Lines at or after an inserted line move down by one.
+        for key, index in self._commented.items():
+            if index >= inserted:
+                self._commented[key] = index + 1
+        for indices in self._active.values():
+            indices[:] = [index + 1 if index >= inserted else index for index in indices]
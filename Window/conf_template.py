@@ -0,0 +1,306 @@
+"""
+File       : conf_template.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Table driven templates of vkBasalt.conf and dxvk.conf. A template is a list of rows (comment lines,
+             settings and the vkBasalt effects list) compiled once against the settings registry into static text and
+             per option lookup tables, so rendering a config is a pure function of the settings: one lookup per
+             setting and a single join, without touching disk.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+from Window.Settings import SettingsRegistry
+from Window.conf_parser import ConfDocument
+from Window.settings_record import SettingsRecord
+
+
+# ------------------------------------------------------------------------------------------------------ #
+#                                                                                                        #
+# ██████                    ████          ██████                                                         #
+# ██  ██  ██████  ██████    ██              ██      ████  ██  ██  ████    ██        ████    ██      ████ #
+# ██      ██  ██  ██  ██  ██████            ██    ██  ██  ██████  ██  ██  ██      ██  ██  ██████  ██  ██ #
+# ██  ██  ██  ██  ██  ██    ██              ██    ████    ██████  ██████  ██      ██  ██    ██    ████   #
+# ██████  ██████  ██  ██    ██              ██      ████  ██  ██  ██      ██████  ██████    ████    ████ #
+#                                                                                                        #
+# ------------------------------------------------------------------------------------------------------ #
+
+
+class ConfSetting:
+    """
+    Template row writing one setting as "key = value" under a label, with the registry's config key and value of the
+    selected option. With no option selected, an option written commented out, or the setting's enable option not
+    selected, the key is written commented out with the disabled value.
+    """
+    __slots__ = ("key", "label", "disabled")
+
+    def __init__(self, key: str, label: str, disabled: str) -> None:
+        self.key: str = key
+        self.label: str = label
+        self.disabled: str = disabled
+
+
+class ConfEffects:
+    """
+    Template row writing the vkBasalt effects list: the config value of every enabled effect, in the given order.
+    """
+    __slots__ = ("keys",)
+
+    def __init__(self, keys: tuple) -> None:
+        self.keys: tuple = keys
+
+
+class ConfTemplate:
+    """
+    Compiled config template. Consecutive comment lines are joined into one static part; every setting row becomes a
+    table of its rendered text per option index.
+    """
+
+    def __init__(self,
+                 rows_input: tuple) -> None:
+        """
+        Compiles the template rows.
+
+        Args:
+            rows(tuple): Template rows: str for a literal line, ConfSetting or ConfEffects.
+
+        Returns:
+            None.
+
+        Raises:
+            KeyError: If a row names a setting which is not in the registry.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> template = ConfTemplate(("# Header", ConfSetting("cas_level", "CAS Sharpness Amount", "0.0")))
+        """
+        # Unpack inputs
+        rows: tuple = rows_input
+
+        # Parts: str for static text, ("setting", combobox ID, text per option, text when inactive, config key, value
+        # per option) or ("effects", ((combobox ID, value per option), ...)).
+        self._parts: list = []
+        static: list = []
+
+        for row in rows:
+            if isinstance(row, str):
+                static.append(row + "\n")
+                continue
+            if static:
+                self._parts.append("".join(static))
+                static = []
+
+            if isinstance(row, ConfEffects):
+                effects: list = []
+                for key in row.keys:
+                    entry = SettingsRegistry.BY_KEY[key]
+                    effects.append((SettingsRegistry.ID_OF[key], tuple(entry.config_value(option) if index else None for index, option in enumerate(entry.get_options()))))
+                self._parts.append(("effects", tuple(effects)))
+            else:
+                entry = SettingsRegistry.BY_KEY[row.key]
+                heading: str = f"# {row.label}:\n# \n"
+                commented: str = f"{heading}# {entry.config_key} = {row.disabled}\n"
+                values: tuple = tuple(entry.config_value(option) if index else None for index, option in enumerate(entry.get_options()))
+                by_index: tuple = tuple(commented if value is None else f"{heading}{entry.config_key} = {value}\n" for value in values)
+                self._parts.append(("setting", SettingsRegistry.ID_OF[row.key], by_index, commented, entry.config_key, values))
+
+        if static:
+            self._parts.append("".join(static))
+
+    def render(self,
+               record_input: SettingsRecord) -> str:
+        """
+        Renders the config file of a settings record. Pure: the same record always gives the same text.
+
+        Args:
+            record(SettingsRecord): Settings to render.
+
+        Returns:
+            (str): Whole config file text.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> text: str = DXVK_TEMPLATE.render(settings_record)
+        """
+        # Unpack inputs
+        record: SettingsRecord = record_input
+
+        # Values which are not options of their setting render as no selection.
+        indices, _ = SettingsRegistry.option_indices(record.as_tuple())
+
+        chunks: list = []
+        for part in self._parts:
+            if isinstance(part, str):
+                chunks.append(part)
+            elif part[0] == "setting":
+                _, combobox_id, by_index, commented, _, _ = part
+                shown_by: tuple = SettingsRegistry.SHOWN_BY_ID[combobox_id]
+                if shown_by is not None and indices[shown_by[0]] != shown_by[1]:
+                    chunks.append(commented)
+                else:
+                    chunks.append(by_index[indices[combobox_id]])
+            else:
+                enabled: list = [values[indices[combobox_id]] for combobox_id, values in part[1] if values[indices[combobox_id]] is not None]
+                chunks.append(f"effects = {':'.join(enabled)}\n" if enabled else "# effects = \n")
+        return "".join(chunks)
+
+    def merge(self,
+              document_input: ConfDocument,
+              record_input: SettingsRecord) -> bool:
+        """
+        Applies a settings record to an existing config file, hand written or edited since it was deployed, patching
+        only the lines of the settings it selects. Selected values are set, settings switched off or whose enable
+        option selects something else are commented out, and settings left on no selection keep whatever the file has.
+        Effects are added to and removed from the file's effects list.
+
+        Args:
+            document(ConfDocument): Parsed config file, patched in place.
+            record(SettingsRecord): Settings to apply.
+
+        Returns:
+            (bool): 'True' if the document changed.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> document = ConfDocument.parse(existing_text)
+                >>> if DXVK_TEMPLATE.merge(document, settings_record):
+                >>>     text: str = document.render()
+        """
+        # Unpack inputs
+        document: ConfDocument = document_input
+        record: SettingsRecord = record_input
+
+        indices, _ = SettingsRegistry.option_indices(record.as_tuple())
+
+        changed: bool = False
+        for part in self._parts:
+            if isinstance(part, str):
+                continue
+            if part[0] == "setting":
+                _, combobox_id, _, _, config_key, values = part
+                shown_by: tuple = SettingsRegistry.SHOWN_BY_ID[combobox_id]
+                if shown_by is not None and indices[shown_by[0]] != shown_by[1]:
+                    if indices[shown_by[0]]:
+                        changed = document.disable(config_key) or changed
+                    continue
+                index: int = indices[combobox_id]
+                if index:
+                    changed = (document.disable(config_key) if values[index] is None else document.set(config_key, values[index])) or changed
+            else:
+                selected: list = [(values, indices[combobox_id]) for combobox_id, values in part[1] if indices[combobox_id]]
+                if not selected:
+                    continue
+                current: str = document.get("effects")
+                names: list = [name.strip() for name in current.split(":") if name.strip()] if current else []
+                for values, index in selected:
+                    name: str = next(value for value in values if value is not None)
+                    if values[index] is None and name in names:
+                        names.remove(name)
+                    elif values[index] is not None and name not in names:
+                        names.append(name)
+                changed = (document.set("effects", ":".join(names)) if names else document.disable("effects")) or changed
+        return changed
+
+
+# Line identifying config files written from a template, e.g. to find those left behind by removed applications.
+GENERATED_MARK: str = "# Generated by Linux 3D Graphics Settings Manager"
+
+# vkBasalt.conf, effects in the order they are applied.
+VKBASALT_TEMPLATE = ConfTemplate((
+    "# vkBasalt Configuration File",
+    GENERATED_MARK,
+    "# ",
+    "# Effects List:",
+    ConfEffects(("smaa_enable", "fxaa_enable", "dls_enable", "cas_enable")),
+    "",
+    "# Effect Order Rationale:",
+    "# SMAA is applied first to handle primary anti-aliasing.",
+    "# FXAA follows to further smooth edges after SMAA.",
+    "# DLS is applied next to enhance image sharpness after AA passes.",
+    "# CAS is applied last to provide final sharpening to the image.",
+    "# This works in this order despite one or more settings being disabled.",
+    "# ",
+    "# ",
+    "# Contrast Adaptive Sharpening (CAS) Settings",
+    "# ",
+    ConfSetting("cas_level", "CAS Sharpness Amount", "0.0"),
+    "# ",
+    "# Denoised Luma Sharpening (DLS) Settings",
+    "# ",
+    ConfSetting("dls_sharpness", "DLS Sharpness Amount", "0.0"),
+    "# ",
+    ConfSetting("dls_denoise", "DLS Denoise Amount", "0.0"),
+    "# ",
+    "# FXAA Settings",
+    "# ",
+    ConfSetting("fxaa_quality_subpixel", "FXAA Quality Subpixel", "0.00"),
+    "# ",
+    ConfSetting("fxaa_quality_edge", "FXAA Quality Edge", "disabled"),
+    "# ",
+    ConfSetting("fxaa_edge_threshold", "FXAA Edge Threshold", "disabled"),
+    "# ",
+    "# SMAA Settings",
+    "# ",
+    ConfSetting("smaa_edge_detection", "SMAA Edge Detection Mode", "disabled"),
+    "# ",
+    ConfSetting("smaa_threshold", "SMAA Threshold", "disabled"),
+    "# ",
+    ConfSetting("smaa_search_steps", "SMAA Search Steps", "disabled"),
+    "# ",
+    ConfSetting("smaa_search_steps_diagonal", "SMAA Search Steps Diagonal", "disabled"),
+    "# ",
+    ConfSetting("smaa_corner_rounding", "SMAA Corner Rounding", "disabled"),
+))
+
+# dxvk.conf
+DXVK_TEMPLATE = ConfTemplate((
+    "# DXVK Configuration File",
+    GENERATED_MARK,
+    "# ",
+    "# Anisotropic Filtering Settings",
+    "# ",
+    ConfSetting("af_level", "Anisotropic Filtering Level for D3D10/11", "disabled"),
+    ConfSetting("af_level_d3d9", "Anisotropic Filtering Level for D3D9", "disabled"),
+    "# ",
+    "# Level of Detail (LOD) Settings",
+    "# ",
+    ConfSetting("lod_bias", "LOD Bias for D3D10/11", "disabled"),
+    ConfSetting("lod_bias_d3d9", "LOD Bias for D3D9", "disabled"),
+    "# ",
+    "# Clamp Negative LOD Bias Settings",
+    "# ",
+    ConfSetting("clamp_negative_lod", "Clamp Negative LOD for D3D10/11", "disabled"),
+    ConfSetting("clamp_negative_lod_d3d9", "Clamp Negative LOD for D3D9", "disabled"),
+    "# ",
+    ConfSetting("vsync_level", "VSync for D3D10/11", "-1"),
+    ConfSetting("vsync_level_d3d9", "VSync for D3D9", "-1"),
+    "# ",
+    ConfSetting("frame_limit_level", "Frame Limit for D3D10/11", "0"),
+    ConfSetting("frame_limit_level_d3d9", "Frame Limit for D3D9", "0"),
+    "dxvk.tearFree = Auto",
+    "# ",
+    ConfSetting("hdr_enable", "HDR Setting", "disabled"),
+    "# ",
+    ConfSetting("d3d_level", "D3D Feature Level", "disabled"),
+))
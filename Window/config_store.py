@@ -0,0 +1,244 @@
+"""
+File       : config_store.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Content addressed store of rendered config files. Each distinct config is written once, named by the hash
+             of its content, and game directories get a symlink or hardlink to it, so games sharing settings share one
+             file and changing a shared profile costs one write plus a link swap per game.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import errno
+import hashlib
+import os
+from Window.atomic_write import atomic_write
+
+
+# -------------------------------------------------------------------------------------------- #
+#                                                                                              #
+# ██████                    ████  ██                    ██████                                 #
+# ██  ██  ██████  ██████    ██            ████          ██        ██    ██████    ████    ████ #
+# ██      ██  ██  ██  ██  ██████  ██    ██  ██          ██████  ██████  ██  ██  ██      ██  ██ #
+# ██  ██  ██  ██  ██  ██    ██    ██    ██████              ██    ██    ██  ██  ██      ████   #
+# ██████  ██████  ██  ██    ██    ████      ██          ██████    ████  ██████  ██        ████ #
+#                                       ████                                                   #
+# -------------------------------------------------------------------------------------------- #
+
+
+class ConfigStore:
+    """
+    Directory of read only config blobs named <hash>.conf, linked into game directories.
+    """
+
+    # Suffix of blob files, anything else in the store directory is left alone.
+    _SUFFIX: str = ".conf"
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation                                                        #
+    # --------------------------------------------------------------------------- #
+    def __init__(self,
+                 root_input: str = None) -> None:
+        """
+        Opens a store, creating its directory on first write.
+
+        Args:
+            root(str): Store directory, None for $XDG_DATA_HOME/linux-3d-settings-manager/configs.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> store = ConfigStore()
+        """
+        data_home: str = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        self.root: str = os.path.abspath(root_input or os.path.join(data_home, "linux-3d-settings-manager", "configs"))
+
+    # --------------------------------------------------------------------------- #
+    # Blobs                                                                       #
+    # --------------------------------------------------------------------------- #
+    def put(self,
+            data_input: bytes) -> str:
+        """
+        Stores a config's content, writing it only if no blob holds it yet.
+
+        Args:
+            data(bytes): Rendered config file.
+
+        Returns:
+            (str): Path of the blob.
+
+        Raises:
+            OSError: If the blob cannot be written.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> blob_path: str = store.put(text.encode("utf-8"))
+        """
+        # Unpack inputs
+        data: bytes = data_input
+
+        blob_path: str = os.path.join(self.root, hashlib.blake2b(data, digest_size=16).hexdigest() + self._SUFFIX)
+        if not os.path.exists(blob_path):
+            os.makedirs(self.root, exist_ok=True)
+            atomic_write(blob_path, data)
+            # Blobs are shared by every linked game, so they are never edited in place.
+            os.chmod(blob_path, 0o444)
+        return blob_path
+
+    def holds(self,
+              path_input: str) -> bool:
+        """
+        Checks whether a path names a blob of this store, whether or not the blob still exists.
+
+        Args:
+            path(str): Absolute path, e.g. the target of a symlink.
+
+        Returns:
+            (bool): 'True' if the path is a blob path of this store.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> if store.holds(os.readlink(conf_path)):
+        """
+        # Unpack inputs
+        path: str = path_input
+
+        return os.path.dirname(path) == self.root and path.endswith(self._SUFFIX)
+
+    # --------------------------------------------------------------------------- #
+    # Links                                                                       #
+    # --------------------------------------------------------------------------- #
+    def link(self,
+             blob_path_input: str,
+             conf_path_input: str,
+             hardlink_input: bool = False) -> bool:
+        """
+        Points a game's config file at a blob, replacing whatever file or link is there in one rename. Hardlinks fall
+        back to a symlink when the game is on another filesystem than the store.
+
+        Args:
+            blob_path(str): Blob from put().
+            conf_path(str): Config file in the game directory.
+            hardlink(bool): Hardlink instead of symlink.
+
+        Returns:
+            (bool): 'True' if the config file changed, 'False' if it already was that link.
+
+        Raises:
+            OSError: If the link cannot be made.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> changed: bool = store.link(store.put(data), "/path/to/game/dxvk.conf")
+        """
+        # Unpack inputs
+        blob_path: str = blob_path_input
+        conf_path: str = conf_path_input
+        hardlink: bool = hardlink_input
+
+        try:
+            if os.path.islink(conf_path):
+                # A symlink to the blob is kept by the hardlink mode only where a hardlink cannot be made.
+                if os.readlink(conf_path) == blob_path and (not hardlink or os.stat(os.path.dirname(conf_path)).st_dev != os.stat(self.root).st_dev):
+                    return False
+            elif hardlink and os.path.samefile(conf_path, blob_path):
+                return False
+        except FileNotFoundError:
+            pass
+
+        temp_path: str = os.path.join(os.path.dirname(conf_path), f".{os.path.basename(conf_path)}.{os.getpid()}.link")
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+
+        made_hardlink: bool = False
+        if hardlink:
+            try:
+                os.link(blob_path, temp_path)
+                made_hardlink = True
+            except OSError as error:
+                if error.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+        if not made_hardlink:
+            os.symlink(blob_path, temp_path)
+
+        try:
+            os.replace(temp_path, conf_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return True
+
+    # --------------------------------------------------------------------------- #
+    # Garbage collection                                                          #
+    # --------------------------------------------------------------------------- #
+    def collect_garbage(self,
+                        conf_paths_input: list) -> list:
+        """
+        Deletes blobs no game links to any more. A blob is live if one of the given config files is a symlink to it, or
+        if it has another hardlink.
+
+        Args:
+            conf_paths(list): Config file paths which may link to the store, e.g. of every directory deployed to.
+
+        Returns:
+            (list): Paths of the deleted blobs.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> removed: list = store.collect_garbage(all_conf_paths)
+        """
+        # Unpack inputs
+        conf_paths: list = conf_paths_input
+
+        linked: set = set()
+        for conf_path in conf_paths:
+            try:
+                linked.add(os.readlink(conf_path))
+            except OSError:
+                pass
+
+        removed: list = []
+        try:
+            entries: list = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return removed
+        for entry in entries:
+            if not entry.name.endswith(self._SUFFIX) or entry.path in linked:
+                continue
+            try:
+                if entry.stat(follow_symlinks=False).st_nlink == 1:
+                    os.unlink(entry.path)
+                    removed.append(entry.path)
+            except OSError:
+                pass
+        return removed
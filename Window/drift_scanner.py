@@ -0,0 +1,152 @@
+"""
+File       : drift_scanner.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Finds the applications whose deployed config files no longer match user_apps.json, e.g. after they were
+             edited by hand, deleted or overwritten by a game update. The expected files are rendered in memory and the
+             deployed ones checked by a pool of threads; files whose size and mtime match a hash saved from an earlier
+             run are not read. Runs from the GUI, which offers to redeploy or import back the drifted applications, or
+             headless: python -m Window.drift_scanner [--json user_apps.json].
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from Window.conf_handler import AppConfHandler
+from Window.json_handler import AppJSONHandler
+from Window.redeploy_engine import RedeployEngine
+
+
+# ---------------------------------------------------------------------------------------------------- #
+#                                                                                                      #
+# ████            ██      ████                  ██████                                                 #
+# ██  ██    ████          ██      ██            ██        ████    ████  ██████  ██████    ████    ████ #
+# ██  ██  ██      ██    ██████  ██████          ██████  ██      ██  ██  ██  ██  ██  ██  ██  ██  ██     #
+# ██  ██  ██      ██      ██      ██                ██  ██      ██  ██  ██  ██  ██  ██  ████    ██     #
+# ████    ██      ████    ██      ████          ██████    ████  ██████  ██  ██  ██  ██    ████  ██     #
+#                                                                                                      #
+# ---------------------------------------------------------------------------------------------------- #
+
+
+class DriftScanner:
+    """
+    Compares the deployed config files of many applications with the files their saved settings render to.
+    """
+
+    # Files checked at the same time.
+    MAX_WORKERS: int = 8
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation                                                        #
+    # --------------------------------------------------------------------------- #
+    def __init__(self,
+                 json_handler_input: AppJSONHandler,
+                 conf_handler_input: AppConfHandler,
+                 max_workers_input: int = MAX_WORKERS) -> None:
+        self._json_handler: AppJSONHandler = json_handler_input
+        self._conf_handler: AppConfHandler = conf_handler_input
+        self._max_workers: int = max(1, max_workers_input)
+
+    # --------------------------------------------------------------------------- #
+    # Scanning                                                                    #
+    # --------------------------------------------------------------------------- #
+    def scan(self,
+             apps_input: list) -> tuple:
+        """
+        Checks the deployed config files of every application with saved settings. Hashes of the files found in sync
+        are saved, so an unchanged library is scanned next time with one stat per file.
+
+        Args:
+            apps(list): Application dicts, as from RedeployEngine.load_apps() or the app list's model.
+
+        Returns:
+            (tuple): (drifted, failures): app_path -> {config path: MODIFIED or MISSING} for every application with a
+                drifted file, and app_path -> error message for those whose files could not be read. Applications
+                whose directory is gone are not drifted.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> drifted, failures = scanner.scan(RedeployEngine(json_handler, conf_handler).load_apps())
+        """
+        jobs, _ = RedeployEngine(self._json_handler, self._conf_handler).render_all(apps_input)
+        AppConfHandler.load_deployed()
+
+        def check(job: tuple) -> tuple:
+            app_path, files = job
+            try:
+                return app_path, {conf_path: self._conf_handler.check_conf(conf_path, text, merge) for conf_path, text, merge in files}, None
+            except OSError as exception:
+                return app_path, None, str(exception)
+
+        drifted: dict = {}
+        failures: dict = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for app_path, checks, error in executor.map(check, jobs):
+                if error is not None:
+                    failures[app_path] = error
+                    continue
+                drift: dict = {conf_path: status for conf_path, status in checks.items() if status in (AppConfHandler.MODIFIED, AppConfHandler.MISSING)}
+                if drift:
+                    drifted[app_path] = drift
+
+        try:
+            AppConfHandler.save_deployed()
+        except OSError:
+            # Only costs reading the files again next time.
+            pass
+        return drifted, failures
+
+
+def main(argv_input: list = None) -> int:
+    """
+    Headless entry point: lists the applications in user_apps.json whose config files drifted.
+
+    Args:
+        argv(list): Command line arguments, None for sys.argv[1:].
+
+    Returns:
+        (int): Exit status, 1 if any application drifted or failed.
+
+    Examples:
+        Default usage:
+            .. code-block:: shell
+            >>> python -m Window.drift_scanner --json ~/user_apps.json
+    """
+    parser = argparse.ArgumentParser(prog="python -m Window.drift_scanner", description="List applications whose dxvk.conf or vkBasalt.conf no longer match user_apps.json.")
+    parser.add_argument("--json", default="user_apps.json", help="path of user_apps.json (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=DriftScanner.MAX_WORKERS, help="files checked at once (default: %(default)s)")
+    arguments = parser.parse_args(argv_input)
+
+    json_handler = AppJSONHandler(arguments.json)
+    conf_handler = AppConfHandler()
+    scanner = DriftScanner(json_handler, conf_handler, arguments.workers)
+
+    drifted, failures = scanner.scan(RedeployEngine(json_handler, conf_handler).load_apps())
+    for app_path, drift in drifted.items():
+        print(f"{app_path}: " + ", ".join(f"{conf_path} {status}" for conf_path, status in drift.items()))
+    print(f"{len(drifted)} applications drifted.")
+    for path, error in failures.items():
+        print(f"Failed: {path}: {error}", file=sys.stderr)
+    return 1 if drifted or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
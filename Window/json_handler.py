@@ -20,7 +20,14 @@ Description: Management class for all JSON CRUD operations pertinent to the appl
 #                                                        #
 # ------------------------------------------------------ #
 import os
+import re
 import json
+from contextlib import contextmanager
+from typing import Iterator
+from Window.atomic_write import atomic_write
+from Window.settings_record import SettingsRecord
+from Window.settings_code import SettingsCode
+from Window.profile_layers import ProfileLayers
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -35,6 +42,13 @@ import json
 
 
 class AppJSONHandler:
+
+    # Settings keys of an app entry, in the order of the settings panel.
+    SETTINGS_KEYS: tuple = SettingsRecord.FIELDS
+
+    # Pattern locating the opening bracket of the applications array while streaming.
+    _APPS_ARRAY_PATTERN = re.compile(r'"applications"\s*:\s*\[')
+
     # --------------------------------------------------------------------------- #
     # Class initialisation and private variable creation                          #
     # --------------------------------------------------------------------------- #
@@ -42,6 +56,10 @@ class AppJSONHandler:
                  app_json="user_apps.json"):
         self._app_json: str = app_json
 
+        # Data of the open transaction, if any, and whether it has been changed.
+        self._transaction_data: dict = None
+        self._transaction_dirty: bool = False
+
     # --------------------------------------------------------------------------- #
     # Load JSON data                                                              #
     # --------------------------------------------------------------------------- #
@@ -65,6 +83,10 @@ class AppJSONHandler:
         """
         data: dict = None
 
+        # Inside a transaction every load sees the transaction's in-memory data.
+        if self._transaction_data is not None:
+            return self._transaction_data
+
         # If user_apps.json is missing set data to defaults.
         if not os.path.exists(self._app_json):
             data = {"applications": []}
@@ -75,6 +97,95 @@ class AppJSONHandler:
             data = json.load(file)
             return data
 
+    # --------------------------------------------------------------------------- #
+    # Stream JSON data                                                            #
+    # --------------------------------------------------------------------------- #
+    def iter_app_details(self,
+                         read_size_input: int = 65536) -> Iterator[dict]:
+        """
+        Yield app entries from user_apps.json one at a time, as soon as each entry has been decoded.
+
+        The file is read in blocks of read_size bytes, so the first entries are available before the rest
+        of the file has been read or parsed.
+
+        Args:
+            read_size(int): Number of characters to read from user_apps.json per block.
+
+        Returns:
+            Iterator[dict]: App entry dictionaries in file order.
+
+        Raises:
+            json.JSONDecodeError: If user_apps.json is malformed.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> for app in AppJSONHandler.iter_app_details():
+            ...     print(app["app_name"])
+        """
+        # Unpack inputs
+        read_size: int = read_size_input
+
+        # If user_apps.json is missing there is nothing to yield.
+        if not os.path.exists(self._app_json):
+            return
+
+        decoder = json.JSONDecoder()
+
+        with open(self._app_json, "r", encoding="utf-8") as file:
+            buffer: str = ""
+            end_of_file: bool = False
+
+            # Read until the start of the applications array has been found.
+            match = None
+            while match is None and not end_of_file:
+                block: str = file.read(read_size)
+                end_of_file = not block
+                buffer += block
+                match = self._APPS_ARRAY_PATTERN.search(buffer)
+
+            # No applications array, fall back to a full load of whatever is there.
+            if match is None:
+                yield from json.loads(buffer or "{}").get("applications", [])
+                return
+
+            position: int = match.end()
+
+            while True:
+                # Skip whitespace and separators between entries.
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+
+                # Refill the buffer when it has been consumed.
+                if position >= len(buffer):
+                    buffer = file.read(read_size)
+                    position = 0
+                    if not buffer:
+                        raise json.JSONDecodeError("Unterminated applications array", buffer, position)
+                    continue
+
+                # End of the applications array.
+                if buffer[position] == "]":
+                    return
+
+                # Decode the next entry, reading more of the file if it is incomplete.
+                try:
+                    app, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    block: str = file.read(read_size)
+                    if not block:
+                        raise
+                    buffer = buffer[position:] + block
+                    position = 0
+                    continue
+
+                # Drop consumed text so the buffer stays around one block in size.
+                if position > read_size:
+                    buffer = buffer[position:]
+                    position = 0
+
+                yield app
+
     # --------------------------------------------------------------------------- #
     # Save JSON data                                                              #
     # --------------------------------------------------------------------------- #
@@ -90,7 +201,7 @@ class AppJSONHandler:
             None.
 
         Raises:
-            None.
+            OSError: If the file cannot be written; user_apps.json is then left as it was.
 
         Examples:
             Default usage:
@@ -100,9 +211,58 @@ class AppJSONHandler:
         # Unpack inputs
         data: dict = data_input
 
-        # Save data to user_apps.json
-        with open(self._app_json, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4)
+        # Inside a transaction the write is deferred until the transaction ends.
+        if self._transaction_data is not None:
+            self._transaction_data = data
+            self._transaction_dirty = True
+            return
+
+        # Save data to user_apps.json, atomically so a crash never leaves a truncated database.
+        atomic_write(self._app_json, json.dumps(data, indent=4).encode("utf-8"))
+
+    # --------------------------------------------------------------------------- #
+    # Transactions                                                                #
+    # --------------------------------------------------------------------------- #
+    @contextmanager
+    def transaction(self) -> Iterator[dict]:
+        """
+        Groups several operations into one load and one save of user_apps.json. Inside the block every method of this
+        handler works on the same in-memory data, which is written once when the block ends, only if it changed. If the
+        block raises, nothing is written. Nested transactions join the outer one.
+
+        Args:
+            None.
+
+        Returns:
+            (Iterator[dict]): The in-memory user_apps.json data.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> with AppJSONHandler.transaction():
+            >>>     AppJSONHandler.add_app_settings("Path A", "Name A", "DirectX 11", settings_record)
+            >>>     AppJSONHandler.add_app_settings("Path B", "Name B", "Vulkan", settings_record)
+        """
+        # Already in a transaction, join it.
+        if self._transaction_data is not None:
+            yield self._transaction_data
+            return
+
+        self._transaction_data = self.load_app_details()
+        self._transaction_dirty = False
+        try:
+            yield self._transaction_data
+            data: dict = self._transaction_data
+            dirty: bool = self._transaction_dirty
+        finally:
+            self._transaction_data = None
+            self._transaction_dirty = False
+
+        if dirty:
+            self.save_app_details(data)
 
     # --------------------------------------------------------------------------- #
     # Add application                                                             #
@@ -143,40 +303,7 @@ class AppJSONHandler:
             "app_name": app_name,
             "app_path": app_path,
             "app_gapi": app_gapi,
-            "settings": [{
-                "settings_set": False,
-                "fxaa_enable": None,
-                "fxaa_quality_subpixel": None,
-                "fxaa_quality_edge": None,
-                "fxaa_edge_threshold": None,
-                "smaa_enable": None,
-                "smaa_edge_detection": None,
-                "smaa_threshold": None,
-                "smaa_search_steps": None,
-                "smaa_search_steps_diagonal": None,
-                "smaa_corner_rounding": None,
-                "af_enable": None,
-                "af_level": None,
-                "af_level_d3d9": None,
-                "lod_enable": None,
-                "lod_bias": None,
-                "lod_bias_d3d9": None,
-                "clamp_negative_lod": None,
-                "clamp_negative_lod_d3d9": None,
-                "cas_enable": None,
-                "cas_level": None,
-                "dls_enable": None,
-                "dls_sharpness": None,
-                "dls_denoise": None,
-                "vsync_enable": None,
-                "vsync_level": None,
-                "vsync_level_d3d9": None,
-                "frame_limit_enable": None,
-                "frame_limit_level": None,
-                "frame_limit_level_d3d9": None,
-                "hdr_enable": None,
-                "d3d_level": None
-            }]
+            "settings": [dict(settings_set=False, **SettingsCode.decode(SettingsCode.DEFAULT).to_dict())]
         })
 
         # Save updated data to user_apps.json
@@ -186,14 +313,16 @@ class AppJSONHandler:
                          app_path_input: str, 
                          app_name_input: str, 
                          app_gapi_input: str,
-                         settings_list_input: list) -> None:
+                         settings_record_input: SettingsRecord,
+                         fields_input: tuple = None) -> None:
         """
         Save / update app settings to user_apps.json
 
         Args:
             app_name(str): String containing applications name.
             app_path(str): String containing applications path.
-            settings_list(list): List containing all settings values from GUI.
+            settings_record(SettingsRecord): Settings values from the GUI.
+            fields(tuple): Names of the fields to save, None for all. Other stored fields are left as they are.
 
         Returns:
             None.
@@ -204,129 +333,78 @@ class AppJSONHandler:
         Examples:
             Default usage:
             .. code-block:: python
-            >>> AppJSONHandler.add_app_settings("Application Path", "Application Name", "Application Graphics API", settings_list)
+            >>> AppJSONHandler.add_app_settings("Application Path", "Application Name", "Application Graphics API", settings_record)
         """
         # Unpack inputs
         app_path: str = app_path_input
         app_name: str = app_name_input
         app_gapi: str = app_gapi_input
+        settings_record: SettingsRecord = settings_record_input
+        fields: tuple = fields_input if fields_input is not None else SettingsRecord.FIELDS
 
         # Load existing data from user_apps.json
         data: dict = self.load_app_details()
 
-        # Unpack settings list
-        settings_list: list = settings_list_input
-
-        # Assign settings values from list
-        fxaa_enable: bool = settings_list[0]
-        fxaa_quality_subpixel: str = settings_list[1]
-        fxaa_quality_edge: str = settings_list[2]
-        fxaa_edge_threshold: str = settings_list[3]
-        smaa_enable: bool = settings_list[4]
-        smaa_edge_detection: str = settings_list[5]
-        smaa_threshold: str = settings_list[6]
-        smaa_search_steps: str = settings_list[7]
-        smaa_search_steps_diagonal: str = settings_list[8]
-        smaa_corner_rounding: str = settings_list[9]
-        anisotropic_enable: bool = settings_list[10]
-        anisotropic_level: str = settings_list[11]
-        anisotropic_level_d3d9: str = settings_list[12]
-        lod_enable: bool = settings_list[13]
-        lod_bias: str = settings_list[14]
-        lod_bias_d3d9: str = settings_list[15]
-        clamp_negative_lod: str = settings_list[16]
-        clamp_negative_lod_d3d9: str = settings_list[17]
-        cas_enable: bool = settings_list[18]
-        cas_sharpness: str = settings_list[19]
-        dls_enable: bool = settings_list[20]
-        dls_sharpness: str = settings_list[21]
-        dls_denoise: str = settings_list[22]
-        vsync_enable: bool = settings_list[23]
-        vsync_level: str = settings_list[24]
-        vsync_level_d3d9: str = settings_list[25]
-        frame_limit_enable: bool = settings_list[26]
-        frame_limit_level: str = settings_list[27]
-        frame_limit_level_d3d9: str = settings_list[28]
-        hdr_enable: bool = settings_list[29]
-        d3d_level: str = settings_list[30]
-
         # Iterate through apps in data
         for app in data["applications"]:
             # Match app entry
             if app["app_name"] == app_name and app["app_path"] == app_path and app["app_gapi"] == app_gapi:
-                # Get settings dict for app
+                # Copy the saved fields across in one update.
                 settings: dict = app["settings"][0]
-                # Update only changed settings values. On initial save all values will be changed from None.
-                if settings["settings_set"] != True:
-                    settings["settings_set"] = True
-                if settings["fxaa_enable"] != fxaa_enable:
-                    settings["fxaa_enable"] = fxaa_enable
-                if settings["fxaa_quality_subpixel"] != fxaa_quality_subpixel:
-                    settings["fxaa_quality_subpixel"] = fxaa_quality_subpixel
-                if settings["fxaa_quality_edge"] != fxaa_quality_edge:
-                    settings["fxaa_quality_edge"] = fxaa_quality_edge
-                if settings["fxaa_edge_threshold"] != fxaa_edge_threshold:
-                    settings["fxaa_edge_threshold"] = fxaa_edge_threshold
-                if settings["smaa_enable"] != smaa_enable:
-                    settings["smaa_enable"] = smaa_enable
-                if settings["smaa_edge_detection"] != smaa_edge_detection:
-                    settings["smaa_edge_detection"] = smaa_edge_detection
-                if settings["smaa_threshold"] != smaa_threshold:
-                    settings["smaa_threshold"] = smaa_threshold
-                if settings["smaa_search_steps"] != smaa_search_steps:
-                    settings["smaa_search_steps"] = smaa_search_steps
-                if settings["smaa_search_steps_diagonal"] != smaa_search_steps_diagonal:
-                    settings["smaa_search_steps_diagonal"] = smaa_search_steps_diagonal
-                if settings["smaa_corner_rounding"] != smaa_corner_rounding:
-                    settings["smaa_corner_rounding"] = smaa_corner_rounding
-                if settings["af_enable"] != anisotropic_enable:
-                    settings["af_enable"] = anisotropic_enable
-                if settings["af_level"] != anisotropic_level:
-                    settings["af_level"] = anisotropic_level
-                if settings["af_level_d3d9"] != anisotropic_level_d3d9:
-                    settings["af_level_d3d9"] = anisotropic_level_d3d9
-                if settings["lod_enable"] != lod_enable:
-                    settings["lod_enable"] = lod_enable
-                if settings["lod_bias"] != lod_bias:
-                    settings["lod_bias"] = lod_bias
-                if settings["lod_bias_d3d9"] != lod_bias_d3d9:
-                    settings["lod_bias_d3d9"] = lod_bias_d3d9
-                if settings["clamp_negative_lod"] != clamp_negative_lod:
-                    settings["clamp_negative_lod"] = clamp_negative_lod
-                if settings["clamp_negative_lod_d3d9"] != clamp_negative_lod_d3d9:
-                    settings["clamp_negative_lod_d3d9"] = clamp_negative_lod_d3d9
-                if settings["cas_enable"] != cas_enable:
-                    settings["cas_enable"] = cas_enable
-                if settings["cas_level"] != cas_sharpness:
-                    settings["cas_level"] = cas_sharpness
-                if settings["dls_enable"] != dls_enable:
-                    settings["dls_enable"] = dls_enable
-                if settings["dls_sharpness"] != dls_sharpness:                    
-                    settings["dls_sharpness"] = dls_sharpness
-                if settings["dls_denoise"] != dls_denoise:
-                    settings["dls_denoise"] = dls_denoise
-                if settings["vsync_enable"] != vsync_enable:
-                    settings["vsync_enable"] = vsync_enable
-                if settings["vsync_level"] != vsync_level:
-                    settings["vsync_level"] = vsync_level
-                if settings["vsync_level_d3d9"] != vsync_level_d3d9:
-                    settings["vsync_level_d3d9"] = vsync_level_d3d9
-                if settings["frame_limit_enable"] != frame_limit_enable:
-                    settings["frame_limit_enable"] = frame_limit_enable
-                if settings["frame_limit_level"] != frame_limit_level:
-                    settings["frame_limit_level"] = frame_limit_level
-                if settings["frame_limit_level_d3d9"] != frame_limit_level_d3d9:
-                    settings["frame_limit_level_d3d9"] = frame_limit_level_d3d9
-                if settings["hdr_enable"] != hdr_enable:
-                    settings["hdr_enable"] = hdr_enable
-                if settings["d3d_level"] != d3d_level:
-                    settings["d3d_level"] = d3d_level
+                settings.update((field, getattr(settings_record, field)) for field in fields)
+                settings["settings_set"] = True
+
+                # Profile code stored alongside the readable fields, None for values the settings panel cannot show.
+                try:
+                    settings["profile_code"] = SettingsCode.to_text(SettingsCode.encode(SettingsRecord.from_dict(settings)))
+                except ValueError:
+                    settings["profile_code"] = None
         
         # Save updated data to user_apps.json
         self.save_app_details(data)
 
     # --------------------------------------------------------------------------- #
-    # Remove application                                                          #
+    # Rename applications                                                         #
+    # --------------------------------------------------------------------------- #
+    def rename_apps(self,
+                    app_names_input: dict) -> None:
+        """
+        Update the names of one or more app entries in user_apps.json with a single load and save.
+
+        Args:
+            app_names(dict): Dictionary mapping application paths to their new application names.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppJSONHandler.rename_apps({"Application Path": "New Application Name"})
+        """
+        # Unpack inputs
+        app_names: dict = app_names_input
+
+        # Nothing to rename, avoid touching the file.
+        if not app_names:
+            return
+
+        # Load existing data from user_apps.json
+        data: dict = self.load_app_details()
+
+        # Update every matching app entry
+        for app in data["applications"]:
+            if app["app_path"] in app_names:
+                app["app_name"] = app_names[app["app_path"]]
+
+        # Save updated data to user_apps.json
+        self.save_app_details(data)
+
+    # --------------------------------------------------------------------------- #
+    # Remove applications                                                         #
     # --------------------------------------------------------------------------- #
     def remove_app(self, 
                    file_path_input: str) -> None:
@@ -345,16 +423,42 @@ class AppJSONHandler:
         Examples:
             Default usage:
             .. code-block:: python
-            >>> AppJSONHandler.add_new_app("Application Path")
+            >>> AppJSONHandler.remove_app("Application Path")
+        """
+        self.remove_apps([file_path_input])
+
+    def remove_apps(self,
+                    file_paths_input: list) -> None:
+        """
+        Remove one or more app entries from user_apps.json with a single load and save.
+
+        Args:
+            file_paths(list): List of application paths to remove.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppJSONHandler.remove_apps(["Application Path A", "Application Path B"])
         """
         # Unpack inputs
-        file_path: str = file_path_input
+        file_paths: set = set(file_paths_input)
+
+        # Nothing to remove, avoid touching the file.
+        if not file_paths:
+            return
 
         # Load existing data from user_apps.json
         data: dict = self.load_app_details()
 
-        # Create new app list excluding app to be removed
-        app_list: list = [app for app in data["applications"] if os.path.basename(app["app_path"]) != os.path.basename(file_path)]
+        # Create new app list excluding the apps to be removed. Matched on the full path, so another game's
+        # executable with the same file name is kept.
+        app_list: list = [app for app in data["applications"] if app["app_path"] not in file_paths]
 
         # Update data dict with new app list
         data["applications"] = app_list
@@ -368,15 +472,15 @@ class AppJSONHandler:
     def get_app_settings(self, 
                         app_path_input: str,
                         app_name_input: str,
-                        app_gapi_input: str) -> dict:
+                        app_gapi_input: str) -> SettingsRecord:
         """
-        Get app entry from user_apps.json
+        Get app settings from user_apps.json
 
         Args:
             file_path(str): String containing applications path.
 
         Returns:
-            app(dict): Dictionary containing app entry details.
+            (SettingsRecord): Settings of the app entry, None if there is no matching entry.
 
         Raises:
             None.
@@ -394,47 +498,122 @@ class AppJSONHandler:
         # Load existing data from user_apps.json
         data: dict = self.load_app_details()
 
-        # Initialize empty setting list
-        setting_list: list
-
         # Iterate through apps in data
         for app in data["applications"]:
             # Match app entry
             if app["app_name"] == app_name and app["app_path"] == app_path and app["app_gapi"] == app_gapi:
-                # Get settings dict for app
-                settings: dict = app["settings"][0]
-                # Assign settings values to list
-                setting_list = [None] * 31
-                setting_list[0] = settings["fxaa_enable"]
-                setting_list[1] = settings["fxaa_quality_subpixel"]
-                setting_list[2] = settings["fxaa_quality_edge"]
-                setting_list[3] = settings["fxaa_edge_threshold"]
-                setting_list[4] = settings["smaa_enable"]
-                setting_list[5] = settings["smaa_edge_detection"]
-                setting_list[6] = settings["smaa_threshold"]
-                setting_list[7] = settings["smaa_search_steps"]
-                setting_list[8] = settings["smaa_search_steps_diagonal"]
-                setting_list[9] = settings["smaa_corner_rounding"]
-                setting_list[10] = settings["af_enable"]
-                setting_list[11] = settings["af_level"]
-                setting_list[12] = settings["af_level_d3d9"]
-                setting_list[13] = settings["lod_enable"]
-                setting_list[14] = settings["lod_bias"]
-                setting_list[15] = settings["lod_bias_d3d9"]
-                setting_list[16] = settings["clamp_negative_lod"]
-                setting_list[17] = settings["clamp_negative_lod_d3d9"]
-                setting_list[18] = settings["cas_enable"]
-                setting_list[19] = settings["cas_level"]
-                setting_list[20] = settings["dls_enable"]
-                setting_list[21] = settings["dls_sharpness"]
-                setting_list[22] = settings["dls_denoise"]
-                setting_list[23] = settings["vsync_enable"]
-                setting_list[24] = settings["vsync_level"]
-                setting_list[25] = settings["vsync_level_d3d9"]
-                setting_list[26] = settings["frame_limit_enable"]
-                setting_list[27] = settings["frame_limit_level"]
-                setting_list[28] = settings["frame_limit_level_d3d9"]
-                setting_list[29] = settings["hdr_enable"]
-                setting_list[30] = settings["d3d_level"]
+                return SettingsCode.record_of(app["settings"][0])
         
-        return setting_list
\ No newline at end of file
+        return None
+
+    # --------------------------------------------------------------------------- #
+    # Profile layers                                                              #
+    # --------------------------------------------------------------------------- #
+    def get_profile_layers(self) -> ProfileLayers:
+        """
+        Get the global and per graphics API profiles from user_apps.json.
+
+        Args:
+            None.
+
+        Returns:
+            (ProfileLayers): Profile layers, empty if none have been saved.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> record: SettingsRecord = AppJSONHandler.get_profile_layers().resolve_settings(settings, "DirectX 9")
+        """
+        return ProfileLayers.from_dict(self.load_app_details().get("profiles"))
+
+    def set_profile_layer(self,
+                          app_gapi_input: str,
+                          settings_record_input: SettingsRecord) -> list:
+        """
+        Save the global profile, or the profile of every application of one graphics API, to user_apps.json. Settings
+        left on no selection are inherited from the layer below.
+
+        Args:
+            app_gapi(str): Graphics API of the layer, None for the global profile.
+            settings_record(SettingsRecord): Settings values from the GUI.
+
+        Returns:
+            (list): (app_path, SettingsRecord) of each saved application whose effective settings changed, to have
+            its configuration files rewritten.
+
+        Raises:
+            ValueError: If a value is not one of its setting's options.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> changed: list = AppJSONHandler.set_profile_layer("DirectX 9", settings_record)
+        """
+        # Unpack inputs
+        app_gapi: str = app_gapi_input
+        settings_record: SettingsRecord = settings_record_input
+
+        code: int = SettingsCode.encode(settings_record)
+
+        # Load existing data from user_apps.json
+        data: dict = self.load_app_details()
+
+        layers: ProfileLayers = ProfileLayers.from_dict(data.get("profiles"))
+        new_layers: ProfileLayers = layers.with_layer(app_gapi, code)
+        affected: list = layers.affected_apps([(app["app_path"], app["app_gapi"], app["settings"][0]) for app in data["applications"]], new_layers)
+
+        data["profiles"] = new_layers.to_dict()
+
+        # Save updated data to user_apps.json
+        self.save_app_details(data)
+
+        return affected
+
+    # --------------------------------------------------------------------------- #
+    # Deployment mode                                                             #
+    # --------------------------------------------------------------------------- #
+    def get_deploy_mode(self) -> str:
+        """
+        Get how config files are deployed, as saved in user_apps.json.
+
+        Args:
+            None.
+
+        Returns:
+            (str): "copy", "symlink" or "hardlink"; "copy" if never set.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppConfHandler.set_deploy_mode(AppJSONHandler.get_deploy_mode())
+        """
+        return self.load_app_details().get("deploy_mode", "copy")
+
+    def set_deploy_mode(self,
+                        deploy_mode_input: str) -> None:
+        """
+        Save how config files are deployed to user_apps.json.
+
+        Args:
+            deploy_mode(str): "copy", "symlink" or "hardlink".
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppJSONHandler.set_deploy_mode("symlink")
+        """
+        data: dict = self.load_app_details()
+        data["deploy_mode"] = deploy_mode_input
+        self.save_app_details(data)
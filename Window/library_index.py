@@ -0,0 +1,222 @@
+"""
+File       : library_index.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Incrementally maintained index grouping applications by library root (Steam library or folder holding
+             Wine prefixes) and prefix (Wine prefix or Steam install folder), with per-group counts.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import os
+
+
+# ---------------------------------------------------------------------------------------------------- #
+#                                                                                                      #
+# ██      ██    ██                                              ██████              ██                 #
+# ██            ██        ████    ████    ████  ██  ██            ██    ██████      ██    ████  ██  ██ #
+# ██      ██    ████    ██      ██  ██  ██      ██  ██            ██    ██  ██    ████  ██  ██    ██   #
+# ██      ██    ██  ██  ██      ██  ██  ██      ██████            ██    ██  ██  ██  ██  ████      ██   #
+# ██████  ████  ██████  ██      ██████  ██          ██          ██████  ██  ██  ██████    ████  ██  ██ #
+#                                               ████                                                   #
+# ---------------------------------------------------------------------------------------------------- #
+
+
+class LibraryIndex:
+    """
+    Groups application paths as library root -> prefix -> application, keeping counts up to date on every add and
+    remove so no group ever has to be rescanned.
+    """
+
+    # Path markers used to recognise Steam libraries and Wine prefixes.
+    _STEAM_MARKER: str = "/steamapps/"
+    _STEAM_COMMON_MARKER: str = "/steamapps/common/"
+    _WINE_MARKER: str = "/drive_c/"
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation and private variable creation                          #
+    # --------------------------------------------------------------------------- #
+    def __init__(self) -> None:
+        # library root -> prefix -> ordered set (dict) of application paths.
+        self._libraries: dict = {}
+        self._library_counts: dict = {}
+        self._location_by_path: dict = {}
+
+    # --------------------------------------------------------------------------- #
+    # Path classification                                                         #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def split_library_path(cls,
+                           app_path_input: str) -> tuple:
+        """
+        Works out the library root and prefix an application path belongs to.
+
+        Args:
+            app_path(str): Application path.
+
+        Returns:
+            (tuple): (library_root, prefix) strings.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> LibraryIndex.split_library_path("/games/SteamLibrary/steamapps/common/Game/bin/game.exe")
+            ("/games/SteamLibrary", "/games/SteamLibrary/steamapps/common/Game")
+            >>> LibraryIndex.split_library_path("/home/user/Games/wine-game/drive_c/Game/game.exe")
+            ("/home/user/Games", "/home/user/Games/wine-game")
+        """
+        # Unpack inputs
+        app_path: str = app_path_input
+
+        # Wine prefix, the prefix is the folder holding drive_c.
+        wine_position: int = app_path.find(cls._WINE_MARKER)
+        if wine_position != -1:
+            prefix: str = app_path[:wine_position]
+            # Proton prefixes live inside a Steam library's compatdata folder.
+            steam_position: int = prefix.find(cls._STEAM_MARKER)
+            if steam_position != -1:
+                return prefix[:steam_position], prefix
+            return os.path.dirname(prefix), prefix
+
+        # Steam install, the prefix is the game's folder under steamapps/common.
+        steam_position: int = app_path.find(cls._STEAM_COMMON_MARKER)
+        if steam_position != -1:
+            game_start: int = steam_position + len(cls._STEAM_COMMON_MARKER)
+            game_end: int = app_path.find("/", game_start)
+            prefix: str = app_path if game_end == -1 else app_path[:game_end]
+            return app_path[:steam_position], prefix
+
+        # Anything else is grouped by its folder and that folder's parent.
+        prefix: str = os.path.dirname(app_path)
+        return os.path.dirname(prefix), prefix
+
+    # --------------------------------------------------------------------------- #
+    # Index maintenance                                                           #
+    # --------------------------------------------------------------------------- #
+    def add(self,
+            app_path_input: str) -> tuple:
+        """
+        Adds an application path to the index.
+
+        Args:
+            app_path(str): Application path.
+
+        Returns:
+            (tuple): (library_root, prefix) the path was filed under.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> LibraryIndex.add("/path/to/application")
+        """
+        # Unpack inputs
+        app_path: str = app_path_input
+
+        # Already indexed, nothing changes.
+        if app_path in self._location_by_path:
+            return self._location_by_path[app_path]
+
+        library_root, prefix = self.split_library_path(app_path)
+        self._libraries.setdefault(library_root, {}).setdefault(prefix, {})[app_path] = None
+        self._library_counts[library_root] = self._library_counts.get(library_root, 0) + 1
+        self._location_by_path[app_path] = (library_root, prefix)
+        return library_root, prefix
+
+    def remove(self,
+               app_path_input: str) -> tuple | None:
+        """
+        Removes an application path from the index, dropping groups left empty.
+
+        Args:
+            app_path(str): Application path.
+
+        Returns:
+            (tuple): (library_root, prefix) the path was filed under.
+            None: If the path was not indexed.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> LibraryIndex.remove("/path/to/application")
+        """
+        # Unpack inputs
+        app_path: str = app_path_input
+
+        location: tuple = self._location_by_path.pop(app_path, None)
+        if location is None:
+            return None
+
+        library_root, prefix = location
+        prefixes: dict = self._libraries[library_root]
+        del prefixes[prefix][app_path]
+        if not prefixes[prefix]:
+            del prefixes[prefix]
+
+        self._library_counts[library_root] -= 1
+        if not self._library_counts[library_root]:
+            del self._library_counts[library_root]
+            del self._libraries[library_root]
+        return location
+
+    # --------------------------------------------------------------------------- #
+    # Index queries                                                               #
+    # --------------------------------------------------------------------------- #
+    def location_of(self,
+                    app_path_input: str) -> tuple | None:
+        # (library_root, prefix) of an indexed path, None if not indexed.
+        return self._location_by_path.get(app_path_input)
+
+    def libraries(self) -> list:
+        # Library roots in the order they were first seen.
+        return list(self._libraries)
+
+    def prefixes(self,
+                 library_root_input: str) -> list:
+        # Prefixes of a library root in the order they were first seen.
+        return list(self._libraries.get(library_root_input, ()))
+
+    def apps(self,
+             library_root_input: str,
+             prefix_input: str) -> list:
+        # Application paths of a prefix in the order they were added.
+        return list(self._libraries.get(library_root_input, {}).get(prefix_input, ()))
+
+    def library_count(self,
+                      library_root_input: str) -> int:
+        # Number of applications under a library root.
+        return self._library_counts.get(library_root_input, 0)
+
+    def prefix_count(self,
+                     library_root_input: str,
+                     prefix_input: str) -> int:
+        # Number of applications in a prefix.
+        return len(self._libraries.get(library_root_input, {}).get(prefix_input, ()))
+
+    def group_count(self,
+                    library_root_input: str,
+                    prefix_input: str | None = None) -> int:
+        # Number of direct children of a library root (prefixes) or prefix (applications).
+        if prefix_input is None:
+            return len(self._libraries.get(library_root_input, ()))
+        return self.prefix_count(library_root_input, prefix_input)
@@ -22,6 +22,7 @@ Description: Main window file for building the main window incorporating panels
 from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QSplitter
 from Window.settings_panel import SettingsPanel
 from Window.app_list_panel import AppListPanel
+from Window.conf_handler import AppConfHandler
 
 
 # ---------------------------------------------------------------------------------- #
@@ -68,6 +69,9 @@ class MainWindow(QMainWindow):
         splitter = QSplitter()
         layout.addWidget(splitter)
 
+        # Read what earlier runs deployed, so unchanged config files are not read again and orphans can be found
+        AppConfHandler.load_deployed()
+
         # Create app list panel and settings panel
         self.app_list_panel = AppListPanel()
         self.settings_panel = SettingsPanel(app_list_panel_ref=self.app_list_panel) # Pass reference to app_list_panel
@@ -78,3 +82,29 @@ class MainWindow(QMainWindow):
 
         # Set sizes for the splitter
         splitter.setSizes([10, 20])
+
+    def closeEvent(self, event) -> None:
+        """
+        Write any queued application name edits, and what was deployed this run, before the main window closes.
+
+        Args:
+            event (QCloseEvent): Close event passed in by Qt.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default Usage:
+            .. code-block:: python
+            >>> main_window.close()
+        """
+        self.app_list_panel.flush_name_writes()
+        try:
+            AppConfHandler.save_deployed()
+        except OSError:
+            # Only costs reading the config files again next run.
+            pass
+        super().closeEvent(event)
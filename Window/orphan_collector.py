@@ -0,0 +1,226 @@
+"""
+File       : orphan_collector.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Removes the config files generated for applications which are no longer in user_apps.json, which would
+             otherwise keep affecting the game. Only the directories config files were deployed to are looked in, so no
+             drive is ever walked, and only files carrying the generated header are removed; hand written configs are
+             never touched. Runs from the GUI after applications are deleted, or headless:
+             python -m Window.orphan_collector [--json user_apps.json] [--dry-run].
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import argparse
+import os
+import sys
+from Window.conf_handler import AppConfHandler
+from Window.conf_template import GENERATED_MARK
+from Window.json_handler import AppJSONHandler
+
+
+# ------------------------------------------------------------------------------------------------------------------------------ #
+#                                                                                                                                #
+# ██████                  ██                              ██████                                                                 #
+# ██  ██    ████  ████    ██        ████  ██████          ██  ██  ██████  ██      ██        ████    ████    ██    ██████    ████ #
+# ██  ██  ██      ██  ██  ████    ██  ██  ██  ██          ██      ██  ██  ██      ██      ██  ██  ██      ██████  ██  ██  ██     #
+# ██  ██  ██      ██████  ██  ██  ██  ██  ██  ██          ██  ██  ██  ██  ██      ██      ████    ██        ██    ██  ██  ██     #
+# ██████  ██      ██      ██  ██  ██████  ██  ██          ██████  ██████  ██████  ██████    ████    ████    ████  ██████  ██     #
+#                                                                                                                                #
+# ------------------------------------------------------------------------------------------------------------------------------ #
+
+
+class OrphanCollector:
+    """
+    Finds and removes generated config files which no application in user_apps.json uses any more.
+    """
+
+    # Bytes read from the start of a config file when looking for the generated header.
+    _HEADER_BYTES: int = 4096
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation                                                        #
+    # --------------------------------------------------------------------------- #
+    def __init__(self,
+                 json_handler_input: AppJSONHandler,
+                 conf_handler_input: AppConfHandler) -> None:
+        self._json_handler: AppJSONHandler = json_handler_input
+        self._conf_handler: AppConfHandler = conf_handler_input
+
+    # --------------------------------------------------------------------------- #
+    # Finding orphans                                                             #
+    # --------------------------------------------------------------------------- #
+    def find_orphans(self,
+                     directories_input: tuple = ()) -> list:
+        """
+        Finds the generated config files in directories no application in user_apps.json lives in. The directories
+        looked in are those config files were deployed to, see AppConfHandler.load_deployed(), and any given.
+
+        Args:
+            directories(tuple): Further directories to look in, e.g. those of applications just deleted.
+
+        Returns:
+            (list): Paths of the orphaned config files, sorted.
+
+        Raises:
+            json.JSONDecodeError: If user_apps.json is malformed.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> orphans: list = collector.find_orphans([os.path.dirname(app_path) for app_path in deleted])
+        """
+        backed: set = {os.path.dirname(app["app_path"]) for app in self._json_handler.iter_app_details()}
+        candidates: set = (AppConfHandler.deployed_directories() | set(directories_input)) - backed
+
+        orphans: list = []
+        for directory in candidates:
+            for conf_name in self._conf_handler.conf_names():
+                conf_path: str = os.path.join(directory, conf_name)
+                if self.is_generated(conf_path):
+                    orphans.append(conf_path)
+                elif not os.path.lexists(conf_path):
+                    # Already gone, nothing left to look for.
+                    self._conf_handler.forget_conf(conf_path)
+        return sorted(orphans)
+
+    @classmethod
+    def is_generated(cls,
+                     conf_path_input: str) -> bool:
+        """
+        Checks whether a config file was generated from a template and not edited since, reading through links to the
+        config store. Generated files the user edited are kept, as redeploying them keeps the edits too.
+
+        Args:
+            conf_path(str): Path of the config file.
+
+        Returns:
+            (bool): 'True' if the file links into the config store, even to a blob which is gone, or is pristine as
+                checked by AppConfHandler.is_pristine(); 'False' if it is hand written, edited, missing or
+                unreadable.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> if OrphanCollector.is_generated("/path/to/dxvk.conf"):
+        """
+        if AppConfHandler.is_store_link(conf_path_input):
+            return True
+        try:
+            with open(conf_path_input, "rb") as conf_file:
+                # The mark is in the header, so large hand written files are not read whole.
+                header: bytes = conf_file.read(cls._HEADER_BYTES)
+                if GENERATED_MARK.encode("utf-8") not in header:
+                    return False
+                return AppConfHandler.is_pristine(conf_path_input, header + conf_file.read())
+        except OSError:
+            return False
+
+    # --------------------------------------------------------------------------- #
+    # Removing orphans                                                            #
+    # --------------------------------------------------------------------------- #
+    def remove(self,
+               conf_paths_input: list,
+               dry_run_input: bool = False) -> tuple:
+        """
+        Removes orphaned config files, as found by find_orphans(). Links to the config store are removed, not the
+        stored config, which AppConfHandler.collect_garbage() removes once nothing links to it.
+
+        Args:
+            conf_paths(list): Paths of the config files to remove.
+            dry_run(bool): 'True' to only report what would be removed.
+
+        Returns:
+            (tuple): (removed, failures): paths removed, or that would be in a dry run, and path -> error message.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> removed, failures = collector.remove(collector.find_orphans(), dry_run_input=True)
+        """
+        # Unpack inputs
+        conf_paths: list = conf_paths_input
+        dry_run: bool = dry_run_input
+
+        removed: list = []
+        failures: dict = {}
+        for conf_path in conf_paths:
+            # Checked again, in case the file was replaced since it was found.
+            if not self.is_generated(conf_path):
+                continue
+            if not dry_run:
+                try:
+                    os.unlink(conf_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as exception:
+                    failures[conf_path] = str(exception)
+                    continue
+                self._conf_handler.forget_conf(conf_path)
+            removed.append(conf_path)
+        return removed, failures
+
+
+def main(argv_input: list = None) -> int:
+    """
+    Headless entry point: removes, or lists with --dry-run, the generated config files of applications no longer in
+    user_apps.json.
+
+    Args:
+        argv(list): Command line arguments, None for sys.argv[1:].
+
+    Returns:
+        (int): Exit status, 1 if any file could not be removed.
+
+    Examples:
+        Default usage:
+            .. code-block:: shell
+            >>> python -m Window.orphan_collector --json ~/user_apps.json --dry-run
+    """
+    parser = argparse.ArgumentParser(prog="python -m Window.orphan_collector", description="Remove dxvk.conf and vkBasalt.conf files generated for applications no longer in user_apps.json.")
+    parser.add_argument("--json", default="user_apps.json", help="path of user_apps.json (default: %(default)s)")
+    parser.add_argument("--dry-run", action="store_true", help="only list the files which would be removed")
+    parser.add_argument("--directory", action="append", default=[], help="also look in this directory (repeatable)")
+    arguments = parser.parse_args(argv_input)
+
+    json_handler = AppJSONHandler(arguments.json)
+    conf_handler = AppConfHandler()
+    AppConfHandler.set_deploy_mode(json_handler.get_deploy_mode())
+    AppConfHandler.load_deployed()
+    collector = OrphanCollector(json_handler, conf_handler)
+
+    removed, failures = collector.remove(collector.find_orphans([os.path.abspath(directory) for directory in arguments.directory]), arguments.dry_run)
+    for conf_path in removed:
+        print(f"{'Would remove' if arguments.dry_run else 'Removed'}: {conf_path}")
+    print(f"{len(removed)} orphaned config files {'found' if arguments.dry_run else 'removed'}.")
+    if not arguments.dry_run:
+        conf_handler.collect_garbage([app["app_path"] for app in json_handler.iter_app_details()])
+        try:
+            AppConfHandler.save_deployed()
+        except OSError:
+            pass
+    for path, error in failures.items():
+        print(f"Failed: {path}: {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+File       : profile_layers.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Layered settings profiles: a global profile, one profile per graphics API and each game's own settings
+             on top. A layer only holds the settings it selects an option for, the others are inherited from the
+             layer below. Effective settings are resolved from the layers' profile codes and memoized per code.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+from functools import lru_cache
+from Window.settings_record import SettingsRecord
+from Window.settings_code import SettingsCode
+
+
+# ------------------------------------------------------------------------------------------------------------ #
+#                                                                                                              #
+# ██████                    ████  ██                            ██                                             #
+# ██  ██    ████  ██████    ██          ██        ████          ██        ████  ██  ██    ████    ████    ████ #
+# ██████  ██      ██  ██  ██████  ██    ██      ██  ██          ██      ██  ██  ██  ██  ██  ██  ██        ██   #
+# ██      ██      ██  ██    ██    ██    ██      ████            ██      ██  ██  ██████  ████    ██        ██   #
+# ██      ██      ██████    ██    ████  ██████    ████          ██████  ██████      ██    ████  ██      ████   #
+#                                                                               ████                           #
+# ------------------------------------------------------------------------------------------------------------ #
+
+
+class ProfileLayers:
+    """
+    Global and per graphics API profiles of user_apps.json, as profile codes. Instances are immutable: changing a
+    layer returns new layers, so the old and new effective settings of every game can be compared.
+
+    Resolution is memoized on the codes of the three layers, so a changed layer never reuses a stale result while
+    games of untouched layers keep hitting the cache.
+    """
+
+    # Graphics APIs with a layer, as detected for an application.
+    GAPIS: tuple = ("DirectX 9", "DirectX 10", "DirectX 11", "DirectX 12", "Vulkan", "OpenGL")
+
+    __slots__ = ("global_code", "_gapi_codes")
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation                                                        #
+    # --------------------------------------------------------------------------- #
+    def __init__(self,
+                 global_code_input: int = SettingsCode.EMPTY,
+                 gapi_codes_input: dict = None) -> None:
+        # Unpack inputs
+        global_code: int = global_code_input
+        gapi_codes: dict = gapi_codes_input or {}
+
+        object.__setattr__(self, "global_code", global_code)
+        # Empty layers are not kept, they change nothing.
+        object.__setattr__(self, "_gapi_codes", {gapi: code for gapi, code in gapi_codes.items() if code != SettingsCode.EMPTY})
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"ProfileLayers is immutable, use with_layer() instead of setting {name}")
+
+    # --------------------------------------------------------------------------- #
+    # Conversion                                                                  #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def from_dict(cls,
+                  profiles_input: dict) -> "ProfileLayers":
+        """
+        Builds the layers from the "profiles" entry of user_apps.json. Missing or invalid codes are empty layers.
+
+        Args:
+            profiles(dict): {"global": text code, "gapi": {graphics API: text code}}, or None.
+
+        Returns:
+            (ProfileLayers): Layers of the entry.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> layers: ProfileLayers = ProfileLayers.from_dict(data.get("profiles"))
+        """
+        # Unpack inputs
+        profiles: dict = profiles_input or {}
+
+        def code_of(text: str) -> int:
+            try:
+                return SettingsCode.from_text(text) if text else SettingsCode.EMPTY
+            except ValueError:
+                return SettingsCode.EMPTY
+
+        return cls(code_of(profiles.get("global")), {gapi: code_of(text) for gapi, text in profiles.get("gapi", {}).items()})
+
+    def to_dict(self) -> dict:
+        """
+        Returns the layers as the "profiles" entry of user_apps.json.
+
+        Args:
+            None.
+
+        Returns:
+            (dict): {"global": text code, "gapi": {graphics API: text code}}.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> data["profiles"] = layers.to_dict()
+        """
+        return {"global": SettingsCode.to_text(self.global_code),
+                "gapi": {gapi: SettingsCode.to_text(code) for gapi, code in self._gapi_codes.items()}}
+
+    # --------------------------------------------------------------------------- #
+    # Layers                                                                      #
+    # --------------------------------------------------------------------------- #
+    def layer_code(self,
+                   gapi_input: str = None) -> int:
+        """
+        Gets the profile code of one layer.
+
+        Args:
+            gapi(str): Graphics API of the layer, None for the global layer.
+
+        Returns:
+            (int): Profile code, SettingsCode.EMPTY if the layer selects nothing.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> code: int = layers.layer_code("DirectX 9")
+        """
+        # Unpack inputs
+        gapi: str = gapi_input
+
+        if gapi is None:
+            return self.global_code
+        return self._gapi_codes.get(gapi, SettingsCode.EMPTY)
+
+    def with_layer(self,
+                   gapi_input: str,
+                   code_input: int) -> "ProfileLayers":
+        """
+        Returns a copy of the layers with one layer replaced.
+
+        Args:
+            gapi(str): Graphics API of the layer, None for the global layer.
+            code(int): New profile code of the layer.
+
+        Returns:
+            (ProfileLayers): New layers, these are left unchanged.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> new_layers: ProfileLayers = layers.with_layer("DirectX 9", SettingsCode.encode(record))
+        """
+        # Unpack inputs
+        gapi: str = gapi_input
+        code: int = code_input
+
+        if gapi is None:
+            return ProfileLayers(code, self._gapi_codes)
+        return ProfileLayers(self.global_code, dict(self._gapi_codes, **{gapi: code}))
+
+    # --------------------------------------------------------------------------- #
+    # Resolution                                                                  #
+    # --------------------------------------------------------------------------- #
+    def resolve(self,
+                app_code_input: int,
+                app_gapi_input: str) -> int:
+        """
+        Resolves the effective profile code of a game: its own settings over its graphics API's layer over the global
+        layer.
+
+        Args:
+            app_code(int): Profile code of the game's own settings.
+            app_gapi(str): Graphics API of the game.
+
+        Returns:
+            (int): Effective profile code.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> code: int = layers.resolve(SettingsCode.encode(record), "DirectX 11")
+        """
+        return _resolve(self.global_code, self.layer_code(app_gapi_input), app_code_input)
+
+    def resolve_settings(self,
+                         settings_input: dict,
+                         app_gapi_input: str) -> SettingsRecord:
+        """
+        Resolves the effective settings of an app entry's settings dict. Settings the panel cannot show (e.g. hand
+        edited values) are not layered and come back as stored.
+
+        Args:
+            settings(dict): Settings dict of an app entry in user_apps.json.
+            app_gapi(str): Graphics API of the app entry.
+
+        Returns:
+            (SettingsRecord): Effective settings.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> record: SettingsRecord = layers.resolve_settings(app["settings"][0], app["app_gapi"])
+        """
+        # Unpack inputs
+        settings: dict = settings_input
+        app_gapi: str = app_gapi_input
+
+        try:
+            app_code: int = SettingsCode.code_of(settings)
+        except ValueError:
+            return SettingsCode.record_of(settings)
+        return SettingsCode.decode(self.resolve(app_code, app_gapi))
+
+    def affected_apps(self,
+                      apps_input: list,
+                      new_layers_input: "ProfileLayers") -> list:
+        """
+        Finds the saved games whose effective settings differ between these layers and new layers, with their new
+        effective settings. Games of graphics APIs whose layers did not change are not resolved at all.
+
+        Args:
+            apps(list): (app_path, app_gapi, settings dict) of each app entry.
+            new_layers(ProfileLayers): Layers after the change.
+
+        Returns:
+            (list): (app_path, SettingsRecord) of each affected game, as taken by AppConfHandler.save_conf_many.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> changed: list = layers.affected_apps(apps, layers.with_layer(None, global_code))
+        """
+        # Unpack inputs
+        apps: list = apps_input
+        new_layers: ProfileLayers = new_layers_input
+
+        global_changed: bool = self.global_code != new_layers.global_code
+
+        affected: list = []
+        for app_path, app_gapi, settings in apps:
+            # Games never saved from the settings panel have no config files to rewrite.
+            if not settings.get("settings_set"):
+                continue
+            if not global_changed and self.layer_code(app_gapi) == new_layers.layer_code(app_gapi):
+                continue
+            try:
+                app_code: int = SettingsCode.code_of(settings)
+            except ValueError:
+                continue
+
+            # Compare the decoded settings, a change hidden behind a disabled enable setting writes the same files.
+            new_record: SettingsRecord = SettingsCode.decode(new_layers.resolve(app_code, app_gapi))
+            if SettingsCode.decode(self.resolve(app_code, app_gapi)) != new_record:
+                affected.append((app_path, new_record))
+        return affected
+
+
+def _resolve_uncached(global_code: int, gapi_code: int, app_code: int) -> int:
+    return SettingsCode.overlay(SettingsCode.overlay(global_code, gapi_code), app_code)
+
+
+# Effective codes by (global, graphics API, game) code.
+_resolve = lru_cache(maxsize=4096)(_resolve_uncached)
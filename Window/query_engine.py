@@ -0,0 +1,464 @@
+"""
+File       : query_engine.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Column store over the application library answering field queries such as "gapi:dx9 af:on" or
+             "smaa:on -cas:on -dls:on" with bitmap intersections. Used by the app list filter box, and free of Qt so
+             it can also be run headless against user_apps.json.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import os
+import re
+from array import array
+from Window.json_handler import AppJSONHandler
+
+# NumPy is optional, it only speeds up turning a result bitmap back into rows.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# ---------------------------------------------------------------------------------------------------------------------------- #
+#                                                                                                                              #
+# ██████                          ██████                                          ██████                  ██                   #
+# ██  ██  ████    ████            ██  ██  ██  ██    ████    ████  ██  ██          ██      ██████    ████        ██████    ████ #
+# ██████  ██  ██  ██  ██          ██  ██  ██  ██  ██  ██  ██      ██  ██          ██████  ██  ██  ██  ██  ██    ██  ██  ██  ██ #
+# ██  ██  ██████  ██████          ██████  ██  ██  ████    ██      ██████          ██      ██  ██  ██████  ██    ██  ██  ████   #
+# ██  ██  ██      ██                  ██  ██████    ████  ██          ██          ██████  ██  ██      ██  ████  ██  ██    ████ #
+#                                                                 ████                            ████                         #
+# ---------------------------------------------------------------------------------------------------------------------------- #
+
+
+class AppQueryEngine:
+    """
+    Column store of the application library. Every application occupies a slot; each categorical field (graphics API
+    and every settings key) is dictionary encoded into one array per field, with a bitmap per distinct value. A query
+    term is answered by OR-ing the bitmaps of the values it accepts, and terms are combined by AND.
+
+    Query syntax, terms separated by spaces:
+        field:value             e.g. gapi:dx11, af:on, af_level:x16, lod_bias:-2, name:witcher
+        field:value1,value2     any of the values
+        -field:value            negation (also !field:value)
+        field:"two words"       quoted values
+    Enable fields accept on/off (also yes/no, true/false, enabled/disabled), and every field accepts 'unset' for
+    values never saved.
+    """
+
+    # Fields matched by substring, scanned per query rather than bitmap indexed as nearly every value is unique.
+    TEXT_FIELDS: tuple = ("app_name", "app_exe", "app_path")
+
+    # Fields dictionary encoded into bitmaps.
+    CATEGORY_FIELDS: tuple = ("app_gapi", "settings_set") + AppJSONHandler.SETTINGS_KEYS
+
+    # Short field names accepted in queries, besides the full names above.
+    FIELD_ALIASES: dict = {
+        "name": "app_name",
+        "exe": "app_exe",
+        "file": "app_exe",
+        "path": "app_path",
+        "gapi": "app_gapi",
+        "api": "app_gapi",
+        "set": "settings_set",
+        "fxaa": "fxaa_enable",
+        "smaa": "smaa_enable",
+        "af": "af_enable",
+        "lod": "lod_enable",
+        "cas": "cas_enable",
+        "dls": "dls_enable",
+        "vsync": "vsync_enable",
+        "frame_limit": "frame_limit_enable",
+        "fps": "frame_limit_enable",
+        "hdr": "hdr_enable",
+        "d3d": "d3d_level",
+    }
+
+    # Graphics API shorthands, only used for the app_gapi field.
+    _GAPI_ALIASES: dict = {
+        "dx9": "directx 9", "d3d9": "directx 9",
+        "dx10": "directx 10", "d3d10": "directx 10",
+        "dx11": "directx 11", "d3d11": "directx 11",
+        "dx12": "directx 12", "d3d12": "directx 12",
+        "vk": "vulkan",
+        "gl": "opengl",
+    }
+
+    _ON_WORDS: frozenset = frozenset(("on", "yes", "true", "enable", "enabled"))
+    _OFF_WORDS: frozenset = frozenset(("off", "no", "false", "disable", "disabled"))
+    _UNSET_WORDS: frozenset = frozenset(("unset", "none", "null", "default"))
+
+    # A field term: optional negation, field name, then a quoted or bare value.
+    _TERM_PATTERN = re.compile(r'(?<!\S)([-!]?)([A-Za-z0-9_]+):("[^"]*"|\S+)')
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation and private variable creation                          #
+    # --------------------------------------------------------------------------- #
+    def __init__(self) -> None:
+        # Slot bookkeeping, freed slots are reused so bitmaps stay dense.
+        self._paths: list = []
+        self._slot_by_path: dict = {}
+        self._free_slots: list = []
+        self._live: int = 0
+
+        # Text fields, slot -> lowered value.
+        self._texts: dict = {field: [] for field in self.TEXT_FIELDS}
+
+        # Category fields: slot -> value code, code -> value, value -> code, and code -> bitmap of slots.
+        self._codes: dict = {field: array("I") for field in self.CATEGORY_FIELDS}
+        self._values: dict = {field: [] for field in self.CATEGORY_FIELDS}
+        self._code_of: dict = {field: {} for field in self.CATEGORY_FIELDS}
+        self._bitmaps: dict = {field: [] for field in self.CATEGORY_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._slot_by_path)
+
+    @classmethod
+    def from_json(cls,
+                  json_handler_input: AppJSONHandler) -> "AppQueryEngine":
+        """
+        Builds an engine from user_apps.json without any GUI, streaming the entries.
+
+        Args:
+            json_handler(AppJSONHandler): Handler of the user_apps.json file to read.
+
+        Returns:
+            (AppQueryEngine): Engine holding every application in the file.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> engine = AppQueryEngine.from_json(AppJSONHandler())
+            >>> engine.query("gapi:dx9 af:on")
+        """
+        engine = cls()
+        for app in json_handler_input.iter_app_details():
+            engine.add(app)
+        return engine
+
+    # --------------------------------------------------------------------------- #
+    # Column maintenance                                                          #
+    # --------------------------------------------------------------------------- #
+    def add(self,
+            app_input: dict) -> None:
+        """
+        Adds an application to the columns, or replaces its values if the path is already present.
+
+        Args:
+            app(dict): App dict containing 'app_name', 'app_path', 'app_gapi' and 'settings', the latter either the
+                       settings dict or the list holding it as stored in user_apps.json.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppQueryEngine.add({"app_name": "Name", "app_path": "/path/to/app.exe", "app_gapi": "DirectX 11", "settings": {}})
+        """
+        # Unpack inputs
+        app: dict = app_input
+        app_path: str = app["app_path"]
+
+        settings = app.get("settings") or {}
+        if isinstance(settings, list):
+            settings = settings[0] if settings else {}
+
+        self.remove(app_path)
+
+        # Take a free slot, or grow every column by one.
+        if self._free_slots:
+            slot: int = self._free_slots.pop()
+            self._paths[slot] = app_path
+        else:
+            slot: int = len(self._paths)
+            self._paths.append(app_path)
+            for texts in self._texts.values():
+                texts.append(None)
+            for codes in self._codes.values():
+                codes.append(0)
+        self._slot_by_path[app_path] = slot
+        bit: int = 1 << slot
+        self._live |= bit
+
+        self._texts["app_name"][slot] = app["app_name"].lower()
+        self._texts["app_exe"][slot] = os.path.basename(app_path).lower()
+        self._texts["app_path"][slot] = app_path.lower()
+
+        for field in self.CATEGORY_FIELDS:
+            value = app["app_gapi"] if field == "app_gapi" else settings.get(field)
+            code: int = self._code_of[field].get(value, -1)
+            if code == -1:
+                code = len(self._values[field])
+                self._code_of[field][value] = code
+                self._values[field].append(value)
+                self._bitmaps[field].append(0)
+            self._codes[field][slot] = code
+            self._bitmaps[field][code] |= bit
+
+    def remove(self,
+               app_path_input: str) -> bool:
+        """
+        Removes an application from the columns.
+
+        Args:
+            app_path(str): Application path.
+
+        Returns:
+            (bool): 'True' if the application was present, 'False' otherwise.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppQueryEngine.remove("/path/to/app.exe")
+        """
+        # Unpack inputs
+        app_path: str = app_path_input
+
+        slot: int = self._slot_by_path.pop(app_path, -1)
+        if slot == -1:
+            return False
+
+        bit: int = 1 << slot
+        self._live ^= bit
+        for field in self.CATEGORY_FIELDS:
+            self._bitmaps[field][self._codes[field][slot]] ^= bit
+        for texts in self._texts.values():
+            texts[slot] = None
+        self._paths[slot] = None
+        self._free_slots.append(slot)
+        return True
+
+    # --------------------------------------------------------------------------- #
+    # Query parsing                                                               #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def resolve_field(cls,
+                      field_input: str) -> str | None:
+        """
+        Resolves a field name or alias used in a query.
+
+        Args:
+            field(str): Field name as typed, e.g. "af" or "af_level".
+
+        Returns:
+            (str): Full field name.
+            None: If the name is not a known field.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppQueryEngine.resolve_field("af")
+            "af_enable"
+        """
+        # Unpack inputs
+        field: str = field_input.lower()
+
+        field = cls.FIELD_ALIASES.get(field, field)
+        if field in cls.TEXT_FIELDS or field in cls.CATEGORY_FIELDS:
+            return field
+        return None
+
+    @classmethod
+    def split_query(cls,
+                    text_input: str) -> tuple:
+        """
+        Splits filter box text into field terms and the remaining free text.
+
+        Args:
+            text(str): Text typed in the filter box.
+
+        Returns:
+            (tuple): (terms, free_text) where terms is a list of (negated, field, values) tuples. Terms naming an
+                     unknown field are left in the free text.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppQueryEngine.split_query('witcher gapi:dx11,dx12 -cas:on')
+            ([(False, "app_gapi", ["dx11", "dx12"]), (True, "cas_enable", ["on"])], "witcher")
+        """
+        # Unpack inputs
+        text: str = text_input
+
+        terms: list = []
+        free_parts: list = []
+        position: int = 0
+        for match in cls._TERM_PATTERN.finditer(text):
+            field: str = cls.resolve_field(match.group(2))
+            if field is None:
+                continue
+            free_parts.append(text[position:match.start()])
+            position = match.end()
+
+            value: str = match.group(3)
+            if value.startswith('"'):
+                values: list = [value.strip('"').lower()]
+            else:
+                values: list = [part for part in value.lower().split(",") if part]
+            terms.append((match.group(1) != "", field, values))
+        free_parts.append(text[position:])
+        return terms, " ".join(" ".join(free_parts).split())
+
+    # --------------------------------------------------------------------------- #
+    # Query evaluation                                                            #
+    # --------------------------------------------------------------------------- #
+    def query(self,
+              query_input: str) -> set | None:
+        """
+        Finds the applications matching every field term of a query. Free text is ignored, see split_query().
+
+        Args:
+            query(str): Query, e.g. "gapi:dx9 af:on" or "smaa:on -cas:on -dls:on".
+
+        Returns:
+            (set): Paths of the matching applications.
+            None: If the query has no field terms, i.e. everything matches.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppQueryEngine.query("gapi:dx9 af:on")
+        """
+        terms, _ = self.split_query(query_input)
+        if not terms:
+            return None
+        return self.paths_of(self.query_mask(terms))
+
+    def query_mask(self,
+                   terms_input: list) -> int:
+        """
+        Evaluates parsed field terms to a bitmap of matching slots.
+
+        Args:
+            terms(list): (negated, field, values) tuples as returned by split_query().
+
+        Returns:
+            (int): Bitmap with bit n set if slot n matches.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppQueryEngine.query_mask([(False, "af_enable", ["on"])])
+        """
+        mask: int = self._live
+        for negated, field, values in terms_input:
+            if not mask:
+                break
+            term_mask: int = self._term_mask(field, values)
+            mask &= (self._live ^ term_mask) if negated else term_mask
+        return mask
+
+    def _term_mask(self, field: str, values: list) -> int:
+        # Text fields, scan the lowered values of the live slots.
+        if field in self._texts:
+            slots: list = [slot for slot, text in enumerate(self._texts[field]) if text is not None and any(value in text for value in values)]
+            return self._mask_of(slots)
+
+        # Category fields, test each distinct value once and OR the bitmaps of those accepted.
+        if field == "app_gapi":
+            values = [self._GAPI_ALIASES.get(value, value) for value in values]
+        term_mask: int = 0
+        for code, stored in enumerate(self._values[field]):
+            if any(self._value_matches(stored, value) for value in values):
+                term_mask |= self._bitmaps[field][code]
+        return term_mask
+
+    @classmethod
+    def _value_matches(cls, stored, wanted: str) -> bool:
+        # None, booleans and the 'Enable'/'Disable' style strings all understand on/off/unset.
+        if stored is None:
+            return wanted in cls._UNSET_WORDS
+        if isinstance(stored, bool):
+            return wanted in (cls._ON_WORDS if stored else cls._OFF_WORDS)
+
+        stored_text: str = str(stored).lower()
+        if wanted in cls._ON_WORDS and stored_text.startswith("enable"):
+            return True
+        if wanted in cls._OFF_WORDS and (stored_text.startswith("disable") or stored_text == "off"):
+            return True
+
+        # Numbers compare by value, so "-2" matches "-2.0".
+        try:
+            return float(stored_text) == float(wanted)
+        except ValueError:
+            pass
+
+        # Otherwise the wanted text must appear as a whole word, e.g. "11" in "direct x 11.0" but not "x1" in "x16".
+        return re.search(rf"(?<![a-z0-9.]){re.escape(wanted)}(?![a-z0-9])", stored_text) is not None
+
+    # --------------------------------------------------------------------------- #
+    # Bitmap conversion                                                           #
+    # --------------------------------------------------------------------------- #
+    def _mask_of(self, slots: list) -> int:
+        # Set the bits in a byte buffer and convert once, rather than OR-ing one large int per slot.
+        buffer = bytearray((len(self._paths) + 7) // 8)
+        for slot in slots:
+            buffer[slot >> 3] |= 1 << (slot & 7)
+        return int.from_bytes(buffer, "little")
+
+    def paths_of(self,
+                 mask_input: int) -> set:
+        """
+        Converts a bitmap of slots to the paths of the applications in them.
+
+        Args:
+            mask(int): Bitmap as returned by query_mask().
+
+        Returns:
+            (set): Application paths.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppQueryEngine.paths_of(AppQueryEngine.query_mask(terms))
+        """
+        # Unpack inputs
+        mask: int = mask_input
+        if not mask:
+            return set()
+
+        paths: list = self._paths
+        if numpy is not None:
+            raw = numpy.frombuffer(mask.to_bytes((mask.bit_length() + 7) // 8, "little"), dtype=numpy.uint8)
+            return {paths[slot] for slot in numpy.flatnonzero(numpy.unpackbits(raw, bitorder="little")).tolist()}
+
+        bits: str = bin(mask)[:1:-1]
+        return {paths[slot] for slot, bit in enumerate(bits) if bit == "1"}
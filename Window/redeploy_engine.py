@@ -0,0 +1,290 @@
+"""
+File       : redeploy_engine.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Redeploys the config files of the whole library, e.g. after a profile layer or the config templates
+             change. Every config is rendered in memory first, then written by a bounded pool of threads with one
+             worker per filesystem device, so a spinning disk is never written by several threads at once. Runs from
+             the GUI with a progress dialog, or headless: python -m Window.redeploy_engine [--json user_apps.json]. Both
+             then remove config store blobs which no game links to any more.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import argparse
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from Window.atomic_write import fsync_directory
+from Window.conf_handler import AppConfHandler
+from Window.json_handler import AppJSONHandler
+from Window.profile_layers import ProfileLayers
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                                                                                      #
+# ██████              ██                                                  ██████                  ██                   #
+# ██  ██    ████      ██    ████  ████    ██      ██████  ██  ██          ██      ██████    ████        ██████    ████ #
+# ████    ██  ██    ████  ██  ██  ██  ██  ██      ██  ██  ██  ██          ██████  ██  ██  ██  ██  ██    ██  ██  ██  ██ #
+# ██  ██  ████    ██  ██  ████    ██████  ██      ██  ██  ██████          ██      ██  ██  ██████  ██    ██  ██  ████   #
+# ██  ██    ████  ██████    ████  ██      ██████  ██████      ██          ██████  ██  ██      ██  ████  ██  ██    ████ #
+#                                                         ████                            ████                         #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+class RedeployEngine:
+    """
+    Renders and writes the config files of many applications at once.
+    """
+
+    # Upper bound on filesystem devices written at the same time.
+    MAX_WORKERS: int = 4
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation                                                        #
+    # --------------------------------------------------------------------------- #
+    def __init__(self,
+                 json_handler_input: AppJSONHandler,
+                 conf_handler_input: AppConfHandler,
+                 max_workers_input: int = MAX_WORKERS) -> None:
+        self._json_handler: AppJSONHandler = json_handler_input
+        self._conf_handler: AppConfHandler = conf_handler_input
+        self._max_workers: int = max(1, max_workers_input)
+
+    # --------------------------------------------------------------------------- #
+    # Applications                                                                #
+    # --------------------------------------------------------------------------- #
+    def load_apps(self) -> list:
+        """
+        Reads every application from user_apps.json, in the form the app list's model holds them.
+
+        Args:
+            None.
+
+        Returns:
+            (list): Dicts of app_name, app_path, app_gapi and the settings dict.
+
+        Raises:
+            json.JSONDecodeError: If user_apps.json is malformed.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> apps: list = engine.load_apps()
+        """
+        return [{"app_name": app["app_name"], "app_path": app["app_path"], "app_gapi": app["app_gapi"], "settings": dict(app["settings"][0]) if app.get("settings") else {}}
+                for app in self._json_handler.iter_app_details()]
+
+    # --------------------------------------------------------------------------- #
+    # Rendering                                                                   #
+    # --------------------------------------------------------------------------- #
+    def render_all(self,
+                   apps_input: list) -> tuple:
+        """
+        Renders the config files of every application with saved settings, from its settings over its profile layers.
+        Applications with the same effective settings share one rendering.
+
+        Args:
+            apps(list): Application dicts, as from load_apps() or the app list's model.
+
+        Returns:
+            (tuple): (jobs, unsaved): jobs is a list of (app_path, ((config path, text, merge), ...)), merge being the
+                merge into a hand written or edited file as taken by AppConfHandler.deploy_conf(); unsaved the paths of
+                applications never saved from the settings panel, which have nothing to deploy.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> jobs, unsaved = engine.render_all(engine.load_apps())
+        """
+        # Unpack inputs
+        apps: list = apps_input
+
+        layers: ProfileLayers = self._json_handler.get_profile_layers()
+        rendered: dict = {}
+        jobs: list = []
+        unsaved: list = []
+        for app in apps:
+            if not app["settings"].get("settings_set"):
+                unsaved.append(app["app_path"])
+                continue
+            record = layers.resolve_settings(app["settings"], app["app_gapi"])
+            texts: tuple = rendered.get(record)
+            if texts is None:
+                texts = rendered[record] = (AppConfHandler.render_vkbasalt(record), AppConfHandler.render_dxvk(record))
+            merges: tuple = (lambda existing_text, record=record: AppConfHandler.merge_vkbasalt(existing_text, record),
+                             lambda existing_text, record=record: AppConfHandler.merge_dxvk(existing_text, record))
+            jobs.append((app["app_path"], tuple(zip(self._conf_handler.conf_paths(app["app_path"]), texts, merges))))
+        return jobs, unsaved
+
+    # --------------------------------------------------------------------------- #
+    # Writing                                                                     #
+    # --------------------------------------------------------------------------- #
+    def run(self,
+            apps_input: list,
+            progress_input=None) -> tuple:
+        """
+        Renders, then writes, the config files of every application. Files whose content is unchanged are not
+        rewritten, and each directory is fsynced once.
+
+        Args:
+            apps(list): Application dicts, as from load_apps() or the app list's model.
+            progress(callable): Called on the calling thread as progress(done, total, app_path) after each application;
+                returning False cancels the applications not yet started. None for no progress.
+
+        Returns:
+            (tuple): (report, failures, unsaved): config path -> WRITTEN / UNCHANGED / SKIPPED, application path ->
+                error message, and the paths of applications with no saved settings.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> report, failures, unsaved = engine.run(engine.load_apps(), lambda done, total, path: print(done, total))
+        """
+        # Unpack inputs
+        apps: list = apps_input
+        progress = progress_input
+
+        jobs, unsaved = self.render_all(apps)
+        report: dict = {}
+        failures: dict = {}
+
+        # Group by filesystem device, then by directory; applications whose directory is gone are skipped.
+        by_device: dict = {}
+        done: int = 0
+        for app_path, files in jobs:
+            try:
+                device: int = os.stat(os.path.dirname(app_path) or ".").st_dev
+            except OSError:
+                report.update((conf_path, AppConfHandler.SKIPPED) for conf_path, _, _ in files)
+                done += 1
+                continue
+            by_device.setdefault(device, {}).setdefault(os.path.dirname(app_path), []).append((app_path, files))
+
+        results: queue.Queue = queue.Queue()
+        cancelled: threading.Event = threading.Event()
+
+        def write_device(directories: dict) -> None:
+            try:
+                for directory, items in directories.items():
+                    written: bool = False
+                    for app_path, files in items:
+                        # Stop, but still fsync this directory below for the files already renamed into it.
+                        if cancelled.is_set():
+                            break
+                        error: str = None
+                        try:
+                            for conf_path, text, merge in files:
+                                outcome: str = self._conf_handler.deploy_conf(conf_path, text, False, merge)
+                                # Applications sharing a directory share its files; keep that a file was written.
+                                if report.get(conf_path) != AppConfHandler.WRITTEN:
+                                    report[conf_path] = outcome
+                                written = written or outcome == AppConfHandler.WRITTEN
+                        except OSError as exception:
+                            error = str(exception)
+                        results.put((app_path, error, True))
+                    if written:
+                        try:
+                            fsync_directory(directory)
+                        except OSError as exception:
+                            results.put((directory, str(exception), False))
+                    if cancelled.is_set():
+                        return
+            finally:
+                # End of this device's work, even if it failed.
+                results.put(None)
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(by_device)) or 1) as executor:
+            futures: list = [executor.submit(write_device, directories) for directories in by_device.values()]
+
+            # Failures and progress are handled here, on the calling thread, so progress may update a GUI.
+            running: int = len(futures)
+            while running:
+                result: tuple = results.get()
+                if result is None:
+                    running -= 1
+                    continue
+                path, error, finished_app = result
+                if error is not None:
+                    failures[path] = error
+                if not finished_app:
+                    continue
+                done += 1
+                if progress is not None and progress(done, len(jobs), path) is False:
+                    cancelled.set()
+
+            for future in futures:
+                future.result()
+
+        # Saved after every batch, so a crash does not lose which files are pristine.
+        try:
+            AppConfHandler.save_deployed()
+        except OSError:
+            # Only costs reading the files again next time.
+            pass
+        return report, failures, unsaved
+
+
+def main(argv_input: list = None) -> int:
+    """
+    Headless entry point: redeploys every application in user_apps.json and prints progress and failures.
+
+    Args:
+        argv(list): Command line arguments, None for sys.argv[1:].
+
+    Returns:
+        (int): Exit status, 1 if any application failed.
+
+    Examples:
+        Default usage:
+            .. code-block:: shell
+            >>> python -m Window.redeploy_engine --json ~/user_apps.json --workers 2
+    """
+    parser = argparse.ArgumentParser(prog="python -m Window.redeploy_engine", description="Redeploy dxvk.conf and vkBasalt.conf for every application in user_apps.json.")
+    parser.add_argument("--json", default="user_apps.json", help="path of user_apps.json (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=RedeployEngine.MAX_WORKERS, help="filesystem devices written at once (default: %(default)s)")
+    arguments = parser.parse_args(argv_input)
+
+    json_handler = AppJSONHandler(arguments.json)
+    conf_handler = AppConfHandler()
+    AppConfHandler.set_deploy_mode(json_handler.get_deploy_mode())
+    AppConfHandler.load_deployed()
+    engine = RedeployEngine(json_handler, conf_handler, arguments.workers)
+
+    def show_progress(done: int, total: int, app_path: str) -> None:
+        print(f"\r[{done}/{total}] {app_path}"[:120].ljust(120), end="", flush=True)
+
+    apps: list = engine.load_apps()
+    report, failures, unsaved = engine.run(apps, show_progress)
+    removed: list = conf_handler.collect_garbage([app["app_path"] for app in apps])
+    print()
+    print(f"Configuration files: {AppConfHandler.summarise_report(report)}; {len(unsaved)} applications without saved settings.")
+    if removed:
+        print(f"Removed {len(removed)} unused configs from the config store.")
+    for path, error in failures.items():
+        print(f"Failed: {path}: {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
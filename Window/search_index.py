@@ -0,0 +1,307 @@
+"""
+File       : search_index.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: In-memory trigram index over application name, file, path and graphics API used by the app list search
+             box. Kept up to date on add, rename and delete, and free of Qt so it can be used and timed headless.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import os
+import re
+
+
+# ------------------------------------------------------------------------------------------------------------------------------ #
+#                                                                                                                                #
+# ██████                          ██████                                  ██              ██████              ██                 #
+# ██  ██  ████    ████            ██        ████    ████    ████    ████  ██                ██    ██████      ██    ████  ██  ██ #
+# ██████  ██  ██  ██  ██          ██████  ██  ██  ██  ██  ██      ██      ████              ██    ██  ██    ████  ██  ██    ██   #
+# ██  ██  ██████  ██████              ██  ████    ██  ██  ██      ██      ██  ██            ██    ██  ██  ██  ██  ████      ██   #
+# ██  ██  ██      ██              ██████    ████  ██████  ██        ████  ██  ██          ██████  ██  ██  ██████    ████  ██  ██ #
+#                                                                                                                                #
+# ------------------------------------------------------------------------------------------------------------------------------ #
+
+
+class AppSearchIndex:
+    """
+    Trigram index of applications keyed by path. Every token of a query must match; a token matches an application
+    when it is a substring of its name, file name, path or graphics API or, if no application contains it exactly,
+    when it is within a small edit distance of the start of one of their words.
+    """
+
+    # Length of the n-grams used to look up candidates.
+    _GRAM_SIZE: int = 3
+
+    # Tokens shorter than this are only matched exactly; longer ones allow a second typo.
+    _FUZZY_MIN_LENGTH: int = 4
+    _FUZZY_LONG_LENGTH: int = 8
+
+    # Fields are joined with a character no token can contain, so a token never matches across two fields.
+    _FIELD_SEPARATOR: str = "\n"
+
+    _WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+    # Token results kept for reuse between keystrokes.
+    _TOKEN_CACHE_SIZE: int = 256
+
+    # Short names the graphics APIs are also found by, e.g. "dx11" or "d3d11".
+    _GAPI_ALIASES: dict = {
+        "DirectX 9": "dx9 d3d9",
+        "DirectX 10": "dx10 d3d10",
+        "DirectX 11": "dx11 d3d11",
+        "DirectX 12": "dx12 d3d12",
+        "Vulkan": "vk",
+        "OpenGL": "gl",
+    }
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation and private variable creation                          #
+    # --------------------------------------------------------------------------- #
+    def __init__(self) -> None:
+        # path -> lowered searchable text, and text trigram -> paths.
+        self._texts: dict = {}
+        self._grams: dict = {}
+
+        # word -> paths, and word trigram -> words, used for fuzzy matching.
+        self._word_paths: dict = {}
+        self._word_grams: dict = {}
+
+        # token -> matching paths, emptied whenever the index changes.
+        self._token_cache: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, app_path: str) -> bool:
+        return app_path in self._texts
+
+    # --------------------------------------------------------------------------- #
+    # Index maintenance                                                           #
+    # --------------------------------------------------------------------------- #
+    def add(self,
+            app_path_input: str,
+            app_name_input: str,
+            app_gapi_input: str) -> None:
+        """
+        Adds an application to the index, or updates it if the path is already indexed (e.g. after a rename).
+
+        Args:
+            app_path(str): Application path, used as the key.
+            app_name(str): Application name.
+            app_gapi(str): Graphics API of the application.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppSearchIndex.add("/path/to/application", "Name", "DirectX 11")
+        """
+        # Unpack inputs
+        app_path: str = app_path_input
+        app_name: str = app_name_input
+        app_gapi: str = app_gapi_input
+
+        text: str = self._FIELD_SEPARATOR.join((app_name, os.path.basename(app_path), app_path, app_gapi, self._GAPI_ALIASES.get(app_gapi, ""))).lower()
+        self._reindex(app_path, self._texts.get(app_path, ""), text)
+        self._texts[app_path] = text
+
+    def remove(self,
+               app_path_input: str) -> bool:
+        """
+        Removes an application from the index.
+
+        Args:
+            app_path(str): Application path.
+
+        Returns:
+            (bool): 'True' if the path was indexed, 'False' otherwise.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppSearchIndex.remove("/path/to/application")
+        """
+        # Unpack inputs
+        app_path: str = app_path_input
+
+        text: str = self._texts.pop(app_path, None)
+        if text is None:
+            return False
+
+        self._reindex(app_path, text, "")
+        return True
+
+    def _reindex(self, app_path: str, old_text: str, new_text: str) -> None:
+        self._token_cache.clear()
+
+        # Only the trigrams and words that differ between the old and new text are touched, so a rename costs
+        # about as much as the characters that changed.
+        old_grams: set = self._grams_of(old_text)
+        new_grams: set = self._grams_of(new_text)
+        for gram in old_grams - new_grams:
+            self._discard(self._grams, gram, app_path)
+        for gram in new_grams - old_grams:
+            self._grams.setdefault(gram, set()).add(app_path)
+
+        old_words: set = set(self._WORD_PATTERN.findall(old_text))
+        new_words: set = set(self._WORD_PATTERN.findall(new_text))
+        for word in old_words - new_words:
+            if self._discard(self._word_paths, word, app_path):
+                for gram in self._grams_of(f" {word}"):
+                    self._discard(self._word_grams, gram, word)
+        for word in new_words - old_words:
+            if word not in self._word_paths:
+                self._word_paths[word] = set()
+                for gram in self._grams_of(f" {word}"):
+                    self._word_grams.setdefault(gram, set()).add(word)
+            self._word_paths[word].add(app_path)
+
+    @classmethod
+    def _grams_of(cls, text: str) -> set:
+        return {text[i:i + cls._GRAM_SIZE] for i in range(len(text) - cls._GRAM_SIZE + 1)}
+
+    @staticmethod
+    def _discard(postings: dict, key: str, value: str) -> bool:
+        # Remove a value from a posting set, dropping the set once empty. Returns 'True' if it was dropped.
+        values: set = postings[key]
+        values.discard(value)
+        if values:
+            return False
+        del postings[key]
+        return True
+
+    # --------------------------------------------------------------------------- #
+    # Searching                                                                   #
+    # --------------------------------------------------------------------------- #
+    def search(self,
+               query_input: str) -> set | None:
+        """
+        Finds the applications matching every whitespace separated token of a query, case-insensitively.
+
+        Args:
+            query(str): Search text, e.g. "witcher dx11".
+
+        Returns:
+            (set): Paths of the matching applications.
+            None: If the query is empty, i.e. everything matches.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+            .. code-block:: python
+            >>> AppSearchIndex.search("witcher dx11")
+            {"/games/SteamLibrary/steamapps/common/The Witcher 3/bin/x64/witcher3.exe"}
+        """
+        # Unpack inputs
+        tokens: list = query_input.lower().split()
+        if not tokens:
+            return None
+
+        # Intersect from the smallest result up.
+        results: list = sorted((self._match_token(token) for token in set(tokens)), key=len)
+        matches: set = set(results[0])
+        for token_matches in results[1:]:
+            if not matches:
+                break
+            matches &= token_matches
+        return matches
+
+    def _key_grams(self, token: str) -> list:
+        # Non-overlapping trigrams covering the token (plus the last one). Substring confirmation catches anything
+        # the skipped trigrams would have ruled out, for a fraction of the set intersections.
+        last: int = len(token) - self._GRAM_SIZE
+        return [token[i:i + self._GRAM_SIZE] for i in range(0, last, self._GRAM_SIZE)] + [token[last:]]
+
+    def _match_token(self, token: str) -> set:
+        cached: set = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+
+        # While typing, the token one character shorter was looked up on the previous keystroke, and anything
+        # containing the token also contains it, so only its matches need checking.
+        candidates: set = self._token_cache.get(token[:-1])
+        if candidates is None:
+            if len(token) < self._GRAM_SIZE:
+                # Too short for the trigram index, scan every text.
+                candidates = self._texts.keys()
+            else:
+                # Intersect the posting sets from the smallest up.
+                postings: list = sorted((self._grams.get(gram, ()) for gram in self._key_grams(token)), key=len)
+                candidates = set(postings[0])
+                for paths in postings[1:]:
+                    if not candidates:
+                        break
+                    candidates &= paths
+
+        # Confirm the token really is a substring, falling back to fuzzy matching if nothing contains it.
+        matches: set = {app_path for app_path in candidates if token in self._texts[app_path]}
+        if not matches and len(token) >= self._FUZZY_MIN_LENGTH:
+            matches = self._fuzzy_match(token)
+
+        if len(self._token_cache) >= self._TOKEN_CACHE_SIZE:
+            self._token_cache.clear()
+        self._token_cache[token] = matches
+        return matches
+
+    def _fuzzy_match(self, token: str) -> set:
+        # Words sharing enough leading-padded trigrams with the token are candidates; each edit breaks at most
+        # three of them.
+        max_distance: int = 1 if len(token) < self._FUZZY_LONG_LENGTH else 2
+        token_grams: set = self._grams_of(f" {token}")
+        shared: dict = {}
+        for gram in token_grams:
+            for word in self._word_grams.get(gram, ()):
+                shared[word] = shared.get(word, 0) + 1
+
+        min_shared: int = len(token_grams) - self._GRAM_SIZE * max_distance
+        # Only the first len(token) + max_distance characters of a word can line up with the token, so words sharing
+        # those (e.g. "witcher2" and "witcher3") are checked once.
+        head_length: int = len(token) + max_distance
+        head_within: dict = {}
+        matches: set = set()
+        for word, count in shared.items():
+            if count < min_shared:
+                continue
+            head: str = word[:head_length]
+            if head not in head_within:
+                head_within[head] = self._prefix_distance_within(token, head, max_distance)
+            if head_within[head]:
+                matches |= self._word_paths[word]
+        return matches
+
+    @staticmethod
+    def _prefix_distance_within(token: str, word: str, max_distance: int) -> bool:
+        # Levenshtein distance between the token and the closest prefix of the word, stopping as soon as every
+        # alignment is over the limit.
+        previous: list = list(range(len(word) + 1))
+        for i, token_char in enumerate(token, 1):
+            current: list = [i]
+            for j, word_char in enumerate(word, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (token_char != word_char)))
+            if min(current) > max_distance:
+                return False
+            previous = current
+        return min(previous) <= max_distance
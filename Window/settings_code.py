@@ -0,0 +1,455 @@
+"""
+File       : settings_code.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Packs a SettingsRecord into a 128 bit profile code, one 4 bit option index per setting, for storage,
+             comparison, cache keys and sharing profiles as a short text code.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import base64
+from functools import lru_cache
+from Window.Settings.registry import SettingsRegistry
+from Window.settings_record import SettingsRecord
+
+
+# ---------------------------------------------------------------------------------------------------- #
+#                                                                                                      #
+# ██████                          ██                                    ██████              ██         #
+# ██        ████    ██      ██          ██████    ████    ████          ██  ██  ██████      ██    ████ #
+# ██████  ██  ██  ██████  ██████  ██    ██  ██  ██  ██    ██            ██      ██  ██    ████  ██  ██ #
+#     ██  ████      ██      ██    ██    ██  ██  ██████    ██            ██  ██  ██  ██  ██  ██  ████   #
+# ██████    ████    ████    ████  ████  ██  ██      ██  ████            ██████  ██████  ██████    ████ #
+#                                               ████                                                   #
+# ---------------------------------------------------------------------------------------------------- #
+
+
+class SettingsCode:
+    """
+    Profile codes of settings records. Every setting is a choice of at most 16 combobox options, so its option index
+    fits in a nibble: nibble i holds the index of SettingsRecord.FIELDS[i] and the top nibble the format version, 128
+    bits in all. Two profiles are equal exactly when their codes are, and XOR-ing two codes leaves non-zero nibbles
+    only where they differ.
+
+    Codes hold what the settings panel shows, so a setting whose enable option is not selected decodes as None, as
+    get_combobox_values would return it.
+    """
+
+    VERSION: int = 1
+
+    # Bits per setting, and the mask of one setting's nibble.
+    _BITS: int = 4
+    _MASK: int = 0xF
+
+    # Combobox options of every field, in FIELDS order.
+    OPTIONS: tuple = tuple(entry.get_options() for entry in SettingsRegistry.ENTRIES)
+
+    # Enable settings stored as True / False rather than their option text.
+    _BOOL_FIELDS: frozenset = SettingsRegistry.BOOL_KEYS
+
+    # Setting -> (enable setting, option index of the enable setting under which it is shown).
+    _PARENTS: dict = {entry.key: entry.shown_by for entry in SettingsRegistry.ENTRIES if entry.shown_by is not None}
+
+    # Lookup tables built by _compile(): per field the stored value -> option index, the option index -> stored
+    # value when shown, and (shift of the enable setting's nibble, enable option index) or None if always shown.
+    _INDEX_OF: tuple = ()
+    _VALUE_OF: tuple = ()
+    _SHOWN_BY: tuple = ()
+
+    # Code of the registry's default options, and the code with no option selected, built by _compile().
+    DEFAULT: int = 0
+    EMPTY: int = 0
+
+    _VERSION_SHIFT: int = len(SettingsRecord.FIELDS) * _BITS
+    _BYTES: int = (_VERSION_SHIFT + _BITS) // 8
+
+    # Lowest bit of every setting's nibble.
+    _NIBBLE_LOW_BITS: int = sum(1 << shift for shift in range(0, _VERSION_SHIFT, _BITS))
+
+    @classmethod
+    def _compile(cls) -> None:
+        value_of: list = []
+        shown_by: list = []
+        for field, options in zip(SettingsRecord.FIELDS, cls.OPTIONS):
+            if field in cls._BOOL_FIELDS:
+                value_of.append((None, True, False))
+            else:
+                # Always shown settings store None when nothing is selected; dependent ones store the option text.
+                value_of.append((options[0] if field in cls._PARENTS else None,) + tuple(options[1:]))
+            if field in cls._PARENTS:
+                parent, enabling_index = cls._PARENTS[field]
+                shown_by.append((SettingsRecord.FIELDS.index(parent) * cls._BITS, enabling_index))
+            else:
+                shown_by.append(None)
+        cls._INDEX_OF = SettingsRegistry.INDEX_OF
+        cls._VALUE_OF = tuple(value_of)
+        cls._SHOWN_BY = tuple(shown_by)
+        cls.DEFAULT = cls.from_indices(tuple(entry.default for entry in SettingsRegistry.ENTRIES))
+        cls.EMPTY = cls.from_indices((0,) * len(SettingsRegistry.ENTRIES))
+
+    # --------------------------------------------------------------------------- #
+    # Encoding                                                                    #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def encode(cls,
+               record_input: SettingsRecord) -> int:
+        """
+        Packs a settings record into its profile code.
+
+        Args:
+            record(SettingsRecord): Settings to pack.
+
+        Returns:
+            (int): Profile code.
+
+        Raises:
+            ValueError: If a value is not one of its setting's options.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> code: int = SettingsCode.encode(settings_panel.get_combobox_values())
+        """
+        # Unpack inputs
+        record: SettingsRecord = record_input
+
+        code: int = cls.VERSION << cls._VERSION_SHIFT
+        shift: int = 0
+        for field, value, index_of in zip(record.FIELDS, record.as_tuple(), cls._INDEX_OF):
+            index: int = index_of.get(value)
+            if index is None:
+                raise ValueError(f"{value!r} is not an option of {field}")
+            code |= index << shift
+            shift += cls._BITS
+        return code
+
+    @classmethod
+    def from_indices(cls,
+                     indices_input: tuple) -> int:
+        """
+        Packs one combobox option index per field into a profile code.
+
+        Args:
+            indices(tuple): Option indices, in FIELDS order.
+
+        Returns:
+            (int): Profile code.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> code: int = SettingsCode.from_indices(tuple(combobox.currentIndex() for combobox in comboboxes.values()))
+        """
+        # Unpack inputs
+        indices: tuple = indices_input
+
+        code: int = cls.VERSION << cls._VERSION_SHIFT
+        shift: int = 0
+        for index in indices:
+            code |= index << shift
+            shift += cls._BITS
+        return code
+
+    @classmethod
+    def indices(cls,
+                code_input: int) -> tuple:
+        """
+        Unpacks a profile code into one combobox option index per field.
+
+        Args:
+            code(int): Profile code.
+
+        Returns:
+            (tuple): Option indices, in FIELDS order.
+
+        Raises:
+            ValueError: If the code is not a valid profile code.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> for combobox_id, index in enumerate(SettingsCode.indices(code)):
+                >>>     comboboxes[combobox_id].setCurrentIndex(index)
+        """
+        # Unpack inputs
+        code: int = code_input
+
+        if code >> cls._VERSION_SHIFT != cls.VERSION:
+            raise ValueError(f"Not a version {cls.VERSION} profile code")
+
+        indices: tuple = tuple((code >> shift) & cls._MASK for shift in range(0, cls._VERSION_SHIFT, cls._BITS))
+        for field, index, options in zip(SettingsRecord.FIELDS, indices, cls.OPTIONS):
+            if index >= len(options):
+                raise ValueError(f"Option {index} of {field} does not exist")
+        return indices
+
+    @classmethod
+    def decode(cls,
+               code_input: int) -> SettingsRecord:
+        """
+        Unpacks a profile code into a settings record. Results are cached per code, records being immutable.
+
+        Args:
+            code(int): Profile code.
+
+        Returns:
+            (SettingsRecord): Settings of the code.
+
+        Raises:
+            ValueError: If the code is not a valid profile code.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> record: SettingsRecord = SettingsCode.decode(code)
+        """
+        return _decode(code_input)
+
+    @classmethod
+    def _decode_uncached(cls,
+                         code: int) -> SettingsRecord:
+        indices: tuple = cls.indices(code)
+        values: dict = {}
+        for field, index, value_of, shown_by in zip(SettingsRecord.FIELDS, indices, cls._VALUE_OF, cls._SHOWN_BY):
+            if shown_by is not None and (code >> shown_by[0]) & cls._MASK != shown_by[1]:
+                values[field] = None
+            else:
+                values[field] = value_of[index]
+        return SettingsRecord(**values)
+
+    @classmethod
+    def code_of(cls,
+                settings_input: dict) -> int:
+        """
+        Gets the profile code of an app entry's settings dict. The readable fields are the settings, as older versions
+        and hand edits of user_apps.json change only those; the stored profile code is used when they are absent.
+
+        Args:
+            settings(dict): Settings dict of an app entry in user_apps.json.
+
+        Returns:
+            (int): Profile code of the entry.
+
+        Raises:
+            ValueError: If a readable field holds a value which is not an option of its setting.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> code: int = SettingsCode.code_of(app["settings"][0])
+        """
+        # Unpack inputs
+        settings: dict = settings_input
+
+        if not any(field in settings for field in SettingsRecord.FIELDS):
+            profile_code: str = settings.get("profile_code")
+            if profile_code:
+                try:
+                    return cls.from_text(profile_code)
+                except ValueError:
+                    pass
+        return cls.encode(SettingsRecord.from_dict(settings))
+
+    @classmethod
+    def record_of(cls,
+                  settings_input: dict) -> SettingsRecord:
+        """
+        Gets the settings record of an app entry's settings dict, from its readable fields, or from its stored profile
+        code when it has none.
+
+        Args:
+            settings(dict): Settings dict of an app entry in user_apps.json.
+
+        Returns:
+            (SettingsRecord): Settings of the entry.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> record: SettingsRecord = SettingsCode.record_of(app["settings"][0])
+        """
+        # Unpack inputs
+        settings: dict = settings_input
+
+        if any(field in settings for field in SettingsRecord.FIELDS):
+            return SettingsRecord.from_dict(settings)
+        return _decode(cls.code_of(settings))
+
+    # --------------------------------------------------------------------------- #
+    # Comparison                                                                  #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def diff(cls,
+             code_a_input: int,
+             code_b_input: int) -> tuple:
+        """
+        Names the settings which differ between two profile codes.
+
+        Args:
+            code_a(int): First profile code.
+            code_b(int): Second profile code.
+
+        Returns:
+            (tuple): Differing field names, in FIELDS order.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> changed: tuple = SettingsCode.diff(saved_code, gui_code)
+        """
+        # Unpack inputs
+        code_a: int = code_a_input
+        code_b: int = code_b_input
+
+        changed: list = []
+        difference: int = (code_a ^ code_b) & ((1 << cls._VERSION_SHIFT) - 1)
+        while difference:
+            # Lowest differing nibble, then clear it.
+            nibble: int = ((difference & -difference).bit_length() - 1) // cls._BITS
+            changed.append(SettingsRecord.FIELDS[nibble])
+            difference &= ~(cls._MASK << (nibble * cls._BITS))
+        return tuple(changed)
+
+    # --------------------------------------------------------------------------- #
+    # Layering                                                                    #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def overlay(cls,
+                base_input: int,
+                override_input: int) -> int:
+        """
+        Lays one profile code over another: every setting the override selects an option for replaces the base's,
+        settings left on option 0 (no selection) keep the base's option.
+
+        Args:
+            base(int): Profile code underneath, e.g. the global profile.
+            override(int): Profile code on top, e.g. a game's own settings.
+
+        Returns:
+            (int): Combined profile code.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> code: int = SettingsCode.overlay(SettingsCode.overlay(global_code, gapi_code), game_code)
+        """
+        # Unpack inputs
+        base: int = base_input
+        override: int = override_input
+
+        # Fold each nibble of the override onto its lowest bit, then widen the set bits back to whole nibbles.
+        selected: int = (override | override >> 1 | override >> 2 | override >> 3) & cls._NIBBLE_LOW_BITS
+        mask: int = selected * cls._MASK
+        return (base & ~mask) | (override & mask)
+
+    # --------------------------------------------------------------------------- #
+    # Text codes                                                                  #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def to_bytes(cls,
+                 code_input: int) -> bytes:
+        """
+        Returns the profile code as 16 big endian bytes.
+
+        Args:
+            code(int): Profile code.
+
+        Returns:
+            (bytes): Packed code.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> packed: bytes = SettingsCode.to_bytes(code)
+        """
+        return code_input.to_bytes(cls._BYTES, "big")
+
+    @classmethod
+    def to_text(cls,
+                code_input: int) -> str:
+        """
+        Returns the profile code as a 26 character text code for storing in user_apps.json or sharing.
+
+        Args:
+            code(int): Profile code.
+
+        Returns:
+            (str): Lower case base32 code.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> text: str = SettingsCode.to_text(SettingsCode.encode(record))
+        """
+        return base64.b32encode(cls.to_bytes(code_input)).decode("ascii").rstrip("=").lower()
+
+    @classmethod
+    def from_text(cls,
+                  text_input: str) -> int:
+        """
+        Parses a text code back into a profile code. Case, spaces and dashes are ignored.
+
+        Args:
+            text(str): Text code from to_text.
+
+        Returns:
+            (int): Profile code.
+
+        Raises:
+            ValueError: If the text is not a valid profile code.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> code: int = SettingsCode.from_text("ai...")
+        """
+        # Unpack inputs
+        text: str = "".join(text_input.split()).replace("-", "").upper()
+
+        try:
+            packed: bytes = base64.b32decode(text + "=" * (-len(text) % 8))
+        except ValueError:
+            raise ValueError("Not a profile code") from None
+        if len(packed) != cls._BYTES:
+            raise ValueError("Not a profile code")
+
+        code: int = int.from_bytes(packed, "big")
+        cls.indices(code)
+        return code
+
+
+SettingsCode._compile()
+
+# Decoded records by code, shared by everyone decoding stored or pasted codes.
+_decode = lru_cache(maxsize=256)(SettingsCode._decode_uncached)
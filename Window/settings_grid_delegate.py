@@ -0,0 +1,60 @@
+"""
+File       : settings_grid_delegate.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Item delegate editing a settings grid option with a combobox. The combobox only exists while its cell
+             is being edited; the rest of the grid is painted by the view.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+from PyQt6.QtCore import Qt, QModelIndex
+from PyQt6.QtWidgets import QStyledItemDelegate, QComboBox, QWidget
+from Window.settings_grid_model import SettingsGridModel
+
+
+# ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------ #
+#                                                                                                                                                                                      #
+# ██████                          ██                                    ██████                  ██                      ████                                                           #
+# ██        ████    ██      ██          ██████    ████    ████          ██  ██  ██████  ██  ██  ██      ██████          ██  ██    ████  ██        ████    ████    ████    ██      ████ #
+# ██████  ██  ██  ██████  ██████  ██    ██  ██  ██  ██    ██            ██      ██  ██  ██████  ████    ██  ██          ██  ██  ██  ██  ██      ██  ██  ██  ██  ██  ██  ██████  ██  ██ #
+#     ██  ████      ██      ██    ██    ██  ██  ██████    ██            ██  ██  ██  ██  ██████  ██  ██  ██  ██          ██  ██  ████    ██      ████    ██████  ██  ██    ██    ████   #
+# ██████    ████    ████    ████  ████  ██  ██      ██  ████            ██████  ██████  ██  ██  ██████  ██████          ████      ████  ██████    ████      ██  ██████    ████    ████ #
+#                                               ████                                                                                                    ████                           #
+# ------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------ #
+
+
+class SettingsComboDelegate(QStyledItemDelegate):
+    """
+    Edits the option column of a SettingsGridModel with a combobox of the setting's options, applying the choice as soon
+    as it is made.
+    """
+
+    def createEditor(self, parent: QWidget, option, index: QModelIndex) -> QWidget:
+        editor = QComboBox(parent)
+        editor.addItems(index.data(SettingsGridModel.OPTIONS_ROLE))
+        # Apply the option on selection rather than when the editor loses focus.
+        editor.activated.connect(lambda _: self._commit_and_close(editor))
+        return editor
+
+    def setEditorData(self, editor: QComboBox, index: QModelIndex) -> None:
+        editor.setCurrentIndex(index.data(Qt.ItemDataRole.EditRole))
+
+    def setModelData(self, editor: QComboBox, model, index: QModelIndex) -> None:
+        model.setData(index, editor.currentIndex(), Qt.ItemDataRole.EditRole)
+
+    def _commit_and_close(self, editor: QComboBox) -> None:
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
@@ -0,0 +1,317 @@
+"""
+File       : settings_grid_model.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Item model holding the option selected for every setting of the settings registry, grouped by settings
+             tab. The settings panel keeps its values here; the tabbed comboboxes and the property grid view are
+             both views of it, so a grid shows 31 settings without a widget per setting.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+import re
+import html
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex
+from Window.Settings import SettingsRegistry
+
+
+# -------------------------------------------------------------------------------------------------------------------------------------------------- #
+#                                                                                                                                                    #
+# ██████                          ██                                    ██████          ██        ██          ██  ██              ██                 #
+# ██        ████    ██      ██          ██████    ████    ████          ██        ████            ██          ██████  ██████      ██    ████  ██     #
+# ██████  ██  ██  ██████  ██████  ██    ██  ██  ██  ██    ██            ██  ██  ██      ██      ████          ██  ██  ██  ██    ████  ██  ██  ██     #
+#     ██  ████      ██      ██    ██    ██  ██  ██████    ██            ██  ██  ██      ██    ██  ██          ██  ██  ██  ██  ██  ██  ████    ██     #
+# ██████    ████    ████    ████  ████  ██  ██      ██  ████            ██████  ██      ████  ██████          ██  ██  ██████  ██████    ████  ██████ #
+#                                               ████                                                                                                 #
+# -------------------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+class SettingsGridModel(QAbstractItemModel):
+    """
+    Two level model: one row per settings tab, with one child row per setting of the tab. Column 0 shows the setting
+    title, column 1 the selected option, edited as the option index. Settings whose enable option is not selected are
+    disabled, as their comboboxes are in the tabbed view.
+    """
+
+    # Global constants creation
+    TITLE_COL: int = 0
+    OPTION_COL: int = 1
+
+    # Role returning the options of a setting row, for the combobox delegate.
+    OPTIONS_ROLE: int = Qt.ItemDataRole.UserRole
+
+    _HEADER_LABELS: tuple = ("Setting", "Option")
+
+    # Internal ID of tab rows; setting rows use their tab's row + 1.
+    _TAB_ID: int = 0
+
+    # Combobox IDs of each tab's settings, and the plain text title of every setting, built by _compile().
+    _TAB_SETTINGS: tuple = ()
+    _TITLES: tuple = ()
+
+    @classmethod
+    def _compile(cls) -> None:
+        cls._TAB_SETTINGS = tuple(tuple(combobox_id for combobox_id, entry in enumerate(SettingsRegistry.ENTRIES) if entry.tab == tab)
+                                  for tab in SettingsRegistry.TABS)
+        # Titles are rich text for QLabel; the grid shows them as plain text without the tooltip marker.
+        titles: list = []
+        for entry in SettingsRegistry.ENTRIES:
+            title: str = html.unescape(re.sub(r"<[^>]+>", "", entry.setting.get_title())).replace("\xa0", " ")
+            titles.append(re.sub(r"^-\s*", "- ", title.replace("❓", "").strip()))
+        cls._TITLES = tuple(titles)
+
+    # ------------------------------------------------------------------------------ #
+    # Model initialisation.                                                          #
+    # ------------------------------------------------------------------------------ #
+    def __init__(self, parent=None) -> None:
+        """
+        Initializes the SettingsGridModel with every setting's default option selected.
+
+        Args:
+            parent (QObject): Optional Qt parent.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> settings_model = SettingsGridModel(self)
+        """
+        super().__init__(parent)
+
+        self._indices: list = [entry.default for entry in SettingsRegistry.ENTRIES]
+
+    # ------------------------------------------------------------------------------ #
+    # Settings state.                                                                #
+    # ------------------------------------------------------------------------------ #
+    def option_indices(self) -> tuple:
+        """
+        Gets the selected option index of every setting.
+
+        Args:
+            None.
+
+        Returns:
+            (tuple): Option indices, in combobox ID order.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> code: int = SettingsCode.from_indices(settings_model.option_indices())
+        """
+        return tuple(self._indices)
+
+    def option_index(self,
+                     combobox_id_input: int) -> int:
+        """
+        Gets the selected option index of one setting.
+
+        Args:
+            combobox_id(int): Combobox ID of the setting.
+
+        Returns:
+            (int): Option index.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> index: int = settings_model.option_index(SettingsRegistry.ID_OF["fxaa_enable"])
+        """
+        return self._indices[combobox_id_input]
+
+    def is_active(self,
+                  combobox_id_input: int) -> bool:
+        """
+        Checks whether a setting is active, i.e. always shown or its enable option is selected.
+
+        Args:
+            combobox_id(int): Combobox ID of the setting.
+
+        Returns:
+            (bool): 'True' if the setting can be edited.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> combobox.setEnabled(settings_model.is_active(combobox_id))
+        """
+        shown_by: tuple = SettingsRegistry.SHOWN_BY_ID[combobox_id_input]
+        return shown_by is None or self._indices[shown_by[0]] == shown_by[1]
+
+    def set_option_index(self,
+                         combobox_id_input: int,
+                         index_input: int) -> bool:
+        """
+        Selects one setting's option. The setting's row and its dependents' rows are reported changed.
+
+        Args:
+            combobox_id(int): Combobox ID of the setting.
+            index(int): Option index.
+
+        Returns:
+            (bool): 'True' if the selection changed.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> settings_model.set_option_index(SettingsRegistry.ID_OF["fxaa_enable"], 1)
+        """
+        # Unpack inputs
+        combobox_id: int = combobox_id_input
+        index: int = index_input
+
+        if self._indices[combobox_id] == index:
+            return False
+        self._indices[combobox_id] = index
+
+        self._setting_changed(combobox_id)
+        for dependent_id, _ in SettingsRegistry.DEPENDENTS[combobox_id]:
+            self._setting_changed(dependent_id)
+        return True
+
+    def set_option_indices(self,
+                           indices_input: tuple) -> None:
+        """
+        Selects every setting's option at once, reporting each tab's rows changed in one signal.
+
+        Args:
+            indices(tuple): Option index of every setting, in combobox ID order.
+
+        Returns:
+            None.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> settings_model.set_option_indices(SettingsCode.indices(code))
+        """
+        # Unpack inputs
+        indices: tuple = indices_input
+
+        self._indices[:] = indices
+        for tab_row, combobox_ids in enumerate(self._TAB_SETTINGS):
+            parent: QModelIndex = self.index(tab_row, self.TITLE_COL)
+            self.dataChanged.emit(self.index(0, self.TITLE_COL, parent), self.index(len(combobox_ids) - 1, self.OPTION_COL, parent))
+
+    def combobox_id(self,
+                    index_input: QModelIndex) -> int:
+        """
+        Gets the combobox ID of a setting row.
+
+        Args:
+            index(QModelIndex): Model index.
+
+        Returns:
+            (int): Combobox ID, or -1 for tab rows.
+
+        Examples:
+            Default Usage:
+                .. code-block:: python
+                >>> combobox_id: int = settings_model.combobox_id(top_left)
+        """
+        # Unpack inputs
+        index: QModelIndex = index_input
+
+        if not index.isValid() or index.internalId() == self._TAB_ID:
+            return -1
+        return self._TAB_SETTINGS[index.internalId() - 1][index.row()]
+
+    def _setting_changed(self, combobox_id: int) -> None:
+        tab_row: int = SettingsRegistry.TABS.index(SettingsRegistry.ENTRIES[combobox_id].tab)
+        row: int = self._TAB_SETTINGS[tab_row].index(combobox_id)
+        self.dataChanged.emit(self.createIndex(row, self.TITLE_COL, tab_row + 1), self.createIndex(row, self.OPTION_COL, tab_row + 1))
+
+    # ------------------------------------------------------------------------------ #
+    # Qt model interface.                                                            #
+    # ------------------------------------------------------------------------------ #
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not 0 <= column < len(self._HEADER_LABELS):
+            return QModelIndex()
+        if not parent.isValid():
+            if 0 <= row < len(self._TAB_SETTINGS):
+                return self.createIndex(row, column, self._TAB_ID)
+        elif parent.internalId() == self._TAB_ID and 0 <= row < len(self._TAB_SETTINGS[parent.row()]):
+            return self.createIndex(row, column, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid() or index.internalId() == self._TAB_ID:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, self.TITLE_COL, self._TAB_ID)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._TAB_SETTINGS)
+        if parent.internalId() == self._TAB_ID and parent.column() == self.TITLE_COL:
+            return len(self._TAB_SETTINGS[parent.row()])
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._HEADER_LABELS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._HEADER_LABELS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        # Tab rows show the tab name.
+        combobox_id: int = self.combobox_id(index)
+        if combobox_id < 0:
+            if role == Qt.ItemDataRole.DisplayRole and index.column() == self.TITLE_COL:
+                return SettingsRegistry.TABS[index.row()].replace("&&", "&")
+            return None
+
+        entry = SettingsRegistry.ENTRIES[combobox_id]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # Rendered only when the row is hovered.
+            return f'<html><body>{entry.setting.get_tooltip_header()}{entry.setting.get_tooltip_body()}</body></html>'
+        if index.column() == self.TITLE_COL:
+            return self._TITLES[combobox_id] if role == Qt.ItemDataRole.DisplayRole else None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry.get_options()[self._indices[combobox_id]]
+        if role == Qt.ItemDataRole.EditRole:
+            return self._indices[combobox_id]
+        if role == self.OPTIONS_ROLE:
+            return entry.get_options()
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        combobox_id: int = self.combobox_id(index)
+        if role != Qt.ItemDataRole.EditRole or index.column() != self.OPTION_COL or combobox_id < 0:
+            return False
+        if not 0 <= value < len(SettingsRegistry.ENTRIES[combobox_id].get_options()):
+            return False
+        self.set_option_index(combobox_id, value)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        combobox_id: int = self.combobox_id(index)
+        if combobox_id < 0:
+            return Qt.ItemFlag.ItemIsEnabled
+        if not self.is_active(combobox_id):
+            return Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.OPTION_COL:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+
+SettingsGridModel._compile()
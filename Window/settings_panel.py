@@ -20,12 +20,16 @@ Also contains methods for loading and saving settings.
 # ██████  ██  ██  ██      ██████  ██        ████  ████   #
 #                                                        #
 # ------------------------------------------------------ #
-import os
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QScrollArea, QPushButton, QTabWidget, QMessageBox
-from Window.Settings import *
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QScrollArea, QPushButton, QTabWidget, QMessageBox, QInputDialog, QStackedWidget, QTreeView, QAbstractItemView, QHeaderView
+from Window.Settings import SettingEntry, SettingsRegistry
+from PyQt6.QtCore import Qt, QEvent
 from Window.json_handler import AppJSONHandler
 from Window.conf_handler import AppConfHandler
+from Window.settings_record import SettingsRecord
+from Window.settings_code import SettingsCode
+from Window.profile_layers import ProfileLayers
+from Window.settings_grid_model import SettingsGridModel
+from Window.settings_grid_delegate import SettingsComboDelegate
 
 
 # ------------------------------------------------------------------------------------------------------------ #
@@ -79,66 +83,49 @@ class SettingsPanel(QWidget):
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.layout().addWidget(self.label)
 
-        # Create a tab widget and add it to the layout
+        # Create a selector of what the settings are loaded from and saved to: the selected applications, the global
+        # profile or the profile of one graphics API
+        self.profile_layer_combobox = QComboBox()
+        self.profile_layer_combobox.addItems(["Selected Applications", "Global Profile"] + [f"{gapi} Profile" for gapi in ProfileLayers.GAPIS])
+        self.profile_layer_combobox.setToolTip('<html><body><p>Settings left on <span style="font-style: italic;">Select Option...</span> are inherited: a game\'s from its graphics API profile, which inherits from the global profile.</p></body></html>')
+        self.layout().addWidget(self.profile_layer_combobox)
+
+        # Create the model holding every setting's selected option, shown by the tabs and the grid view
+        self.settings_model = SettingsGridModel(self)
+        self.settings_model.dataChanged.connect(self.sync_comboboxes)
+
+        # Settings as last loaded or saved, against which dirty_fields() finds the edited settings
+        self._clean_record: SettingsRecord = self.get_combobox_values()
+
+        # Create a tab widget and add it to the layout, stacked with the grid view which is only built when first shown
         self.tab_widget = QTabWidget()
-        self.layout().addWidget(self.tab_widget)
-
-        # Dynamically make and add the tabs to the layout
-        self.create_settings_tab("Anti-Aliasing", "aa_settings_layout")
-        self.create_settings_tab("Anisotropic Filtering", "af_settings_layout")
-        self.create_settings_tab("Sharpening", "sharpness_settings_layout")
-        self.create_settings_tab("VSync && Frame Limits", "vsync_settings_layout")
-        self.create_settings_tab("Misc Settings", "misc_settings_layout")
+        self.settings_grid = None
+        self.settings_view_stack = QStackedWidget()
+        self.settings_view_stack.addWidget(self.tab_widget)
+        self.layout().addWidget(self.settings_view_stack)
+
+        # Dictionary to store each built tab's settings layout by tab name
+        self.tab_layouts: dict = {}
+
+        # Registry entries of each tab, whose widgets are made when the tab is first shown
+        self.tab_entries: dict = {}
+
+        # Setting of each title label whose tooltip is made on first hover
+        self._pending_tooltips: dict = {}
+
+        # Dynamically make and add the (empty) tabs to the layout
+        for tab_name in SettingsRegistry.TABS:
+            self.create_settings_tab(tab_name)
         
-        # Dictionary to store comboboxes and their IDs
+        # Dictionary to store the comboboxes of built tabs by their IDs
         self.comboboxes: dict = {}
 
-        # List of the setting classes
-        setting_classes: list = [
-            # Anti-Aliasing Classes:              ComboBox IDs 0 - 9
-            FXAA_Enable(),                      # ID - 00
-            FXAA_Quality_Subpixel(),            # ID - 01
-            FXAA_Quality_Edge_Threshold(),      # ID - 02
-            FXAA_Edge_Threshold_Bias(),         # ID - 03
-            SMAA_Enable(),                      # ID - 04
-            SMAA_Edge_Detection(),              # ID - 05
-            SMAA_Threshold(),                   # ID - 06
-            SMAA_Search_Steps(),                # ID - 07
-            SMAA_Search_Steps_Diagonal(),       # ID - 08
-            SMAA_Corner_Rounding(),             # ID - 09
-
-            # Anistropic Filtering / LOD Classes: ComboBox IDs 10 - 17
-            Anisotropic_Filtering_Enable(),     # ID - 10
-            Anisotropic_Filtering_Level(),      # ID - 11
-            Anisotropic_Filtering_Level_D3D9(), # ID - 12
-            LOD_Enable(),                       # ID - 13
-            LOD_Bias(),                         # ID - 14
-            LOD_Bias_D3D9(),                    # ID - 15
-            Clamp_Negative_LOD(),               # ID - 16
-            Clamp_Negative_LOD_D3D9(),          # ID - 17
-
-            # Sharpening Classes:                 ComboBox IDs 18 - 22
-            CAS_Enable(),                       # ID - 18
-            CAS_Sharpness(),                    # ID - 19
-            DLS_Enable(),                       # ID - 20
-            DLS_Sharpness(),                    # ID - 21
-            DLS_Denoise(),                      # ID - 22
-
-            # VSync / Frame Limiting Classes:     ComboBox IDs 23 - 28
-            VSync_Enable(),                     # ID - 23
-            VSync_Level(),                      # ID - 24
-            VSync_Level_D3D9(),                 # ID - 25
-            Frame_Limit_Enable(),               # ID - 26
-            Frame_Limit(),                      # ID - 27
-            Frame_Limit_D3D9(),                 # ID - 28
-
-            # Misc Classes:                       ComboBox IDs 29 - 30
-            HighDynamicRange(),                 # ID - 29
-            D3D_Level()                         # ID - 30
-            ]
-
-        # Populate the settings
-        self.populate_settings(setting_classes)
+        # Populate the settings, one registry entry each
+        self.populate_settings(SettingsRegistry.ENTRIES)
+
+        # Build the tab shown first now, the others when first selected
+        self.tab_widget.currentChanged.connect(self.build_settings_tab)
+        self.build_settings_tab(self.tab_widget.currentIndex())
 
         # Create and add a 'Load Settings' button to the layout
         self.load_settings_button = QPushButton("Load Settings")
@@ -154,18 +141,74 @@ class SettingsPanel(QWidget):
         # Connect the save button click signal to handler
         self.save_settings_button.clicked.connect(self.save_settings)
 
+        # Create and add an 'Import Config' button to the layout
+        self.import_config_button = QPushButton("Import Config")
+        self.layout().addWidget(self.import_config_button)
+
+        # Connect the import button click signal to handler
+        self.import_config_button.clicked.connect(self.import_config)
+
+        # Create and add a 'Profile Code' button to the layout
+        self.profile_code_button = QPushButton("Profile Code")
+        self.layout().addWidget(self.profile_code_button)
+
+        # Connect the profile code button click signal to handler
+        self.profile_code_button.clicked.connect(self.share_profile_code)
+
+        # Create and add a toggle between the tabs and the grid view to the layout
+        self.grid_view_button = QPushButton("Grid View")
+        self.grid_view_button.setCheckable(True)
+        self.layout().addWidget(self.grid_view_button)
+
+        # Connect the grid view toggle signal to handler
+        self.grid_view_button.toggled.connect(self.set_grid_view)
+
+    # ------------------------------------------------------------------------------ #
+    # Switch between settings tabs and grid view.                                    #
+    # ------------------------------------------------------------------------------ #
+    def set_grid_view(self, 
+                      grid: bool) -> None:
+        """
+        Shows either the settings tabs or the grid view, one row per setting with a combobox only while editing.
+
+        Args:
+            grid (bool): 'True' to show the grid view, 'False' for the settings tabs.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> set_grid_view(True)
+        """
+        # Build the grid view the first time it is requested
+        if grid and self.settings_grid is None:
+            self.settings_grid = QTreeView()
+            self.settings_grid.setModel(self.settings_model)
+            self.settings_grid.setItemDelegateForColumn(SettingsGridModel.OPTION_COL, SettingsComboDelegate(self.settings_grid))
+            self.settings_grid.setUniformRowHeights(True)
+            self.settings_grid.setEditTriggers(QAbstractItemView.EditTrigger.CurrentChanged | QAbstractItemView.EditTrigger.SelectedClicked | QAbstractItemView.EditTrigger.EditKeyPressed)
+            self.settings_grid.header().setSectionResizeMode(SettingsGridModel.TITLE_COL, QHeaderView.ResizeMode.ResizeToContents)
+            self.settings_grid.expandAll()
+            self.settings_view_stack.addWidget(self.settings_grid)
+
+        self.settings_view_stack.setCurrentWidget(self.settings_grid if grid else self.tab_widget)
+
     # ------------------------------------------------------------------------------ #
     # Create settings tab.                                                           #
     # ------------------------------------------------------------------------------ #
     def create_settings_tab(self, 
-                            tab_name: str, 
-                            layout_name: str) -> None:
+                            tab_name: str) -> None:
         """
-        Creates a settings tab with a scroll area and layout.
+        Creates an empty settings tab, its scroll area and layout are made by build_settings_tab() when it is first
+        shown.
 
         Args:
             tab_name (str): Name of the tab.
-            layout_name (str): Name of the layout variable.
 
         Returns:
             None
@@ -176,11 +219,42 @@ class SettingsPanel(QWidget):
         Examples:
             Create a settings tab:
                 .. code-block:: python
-                >>> create_settings_tab("Tab Name", "layout_name")
+                >>> create_settings_tab("Tab Name")
         """
         # Create a tab
         tab = QWidget()
-        tab_layout = QVBoxLayout(tab)
+        QVBoxLayout(tab)
+
+        self.tab_entries[tab_name] = []
+
+        self.tab_widget.addTab(tab, tab_name)
+
+    # ------------------------------------------------------------------------------ #
+    # Build settings tab on first show.                                              #
+    # ------------------------------------------------------------------------------ #
+    def build_settings_tab(self, 
+                           index: int) -> None:
+        """
+        Builds a settings tab's scroll area and the widgets of its settings, the first time the tab is shown.
+
+        Args:
+            index (int): Index of the tab.
+
+        Returns:
+            None
+        
+        Raises:
+            None
+
+        Examples:
+            Build the current tab:
+                .. code-block:: python
+                >>> build_settings_tab(tab_widget.currentIndex())
+        """
+        tab_name: str = SettingsRegistry.TABS[index]
+        if tab_name in self.tab_layouts:
+            return
+        tab_layout = self.tab_widget.widget(index).layout()
 
         # Create a scroll area and add it to the tab
         tab_scroll_area = QScrollArea()
@@ -194,22 +268,26 @@ class SettingsPanel(QWidget):
         tab_scroll_area.setWidget(tab_settings_widget)
 
         # Set the layout for the tab settings widget
-        setattr(self, layout_name, QVBoxLayout(tab_settings_widget))
-        tab_settings_widget.setLayout(getattr(self, layout_name))
+        self.tab_layouts[tab_name] = QVBoxLayout(tab_settings_widget)
 
-        self.tab_widget.addTab(tab, tab_name)
+        # Keep settings pushed to top of tab
+        self.tab_layouts[tab_name].addStretch()
+
+        for setting_entry in self.tab_entries[tab_name]:
+            self.add_setting_widgets(setting_entry)
 
     # ------------------------------------------------------------------------------ #
     # Populate settings tab.                                                         #
     # ------------------------------------------------------------------------------ #
     def populate_settings(self, 
-                          setting_classes: list) -> None:
+                          setting_entries: tuple) -> None:
         """
-        Populates the settings panel with the provided setting classes.
+        Populates the settings panel with the provided settings registry entries. Their widgets are made when their tab
+        is built.
 
         Args:
-            setting_classes (list): List of setting classes to populate the
-            panel with.
+            setting_entries (tuple): Registry entries to populate the panel
+            with, in combobox ID order.
 
         Returns:
             None
@@ -220,41 +298,49 @@ class SettingsPanel(QWidget):
         Examples:
             Default usage:
                 .. code-block:: python
-                >>> populate_settings(setting_classes)
+                >>> populate_settings(SettingsRegistry.ENTRIES)
         """
-        for setting_class in setting_classes:
-            title = setting_class.get_title()
-            options = setting_class.get_options()
-            tooltip_header = setting_class.get_tooltip_header()
-            tooltip_body = setting_class.get_tooltip_body()
-            rule = setting_class.get_rule()
-            self.add_setting(title, options, tooltip_header, tooltip_body,rule)
-
-        # Keep settings pushed to top of tab
-        self.aa_settings_layout.addStretch()
-        self.af_settings_layout.addStretch()
-        self.sharpness_settings_layout.addStretch()
-        self.vsync_settings_layout.addStretch()
-        self.misc_settings_layout.addStretch()
+        for setting_entry in setting_entries:
+            self.add_setting(setting_entry)
 
     # ------------------------------------------------------------------------------ #
     # Add setting to settings tab.                                                   #
     # ------------------------------------------------------------------------------ #
     def add_setting(self, 
-                    title: str, 
-                    options: list, 
-                    tooltip_header: str, 
-                    tooltip_body: str, 
-                    rule: bool) -> None:
+                    setting_entry: SettingEntry) -> None:
+        """
+        Adds a setting to its registry tab. Its title, combobox and rule are made by add_setting_widgets() when the tab
+        is built; its value is held by the settings model either way.
+
+        Args:
+            setting_entry (SettingEntry): Registry entry of the setting.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> add_setting(SettingsRegistry.BY_KEY["fxaa_enable"])
+        """
+        # Add the widgets now if the tab is already built, otherwise with the tab
+        self.tab_entries[setting_entry.tab].append(setting_entry)
+        if setting_entry.tab in self.tab_layouts:
+            self.add_setting_widgets(setting_entry)
+
+    # ------------------------------------------------------------------------------ #
+    # Add setting widgets to a built settings tab.                                   #
+    # ------------------------------------------------------------------------------ #
+    def add_setting_widgets(self, 
+                            setting_entry: SettingEntry) -> None:
         """
-        Adds a setting to the appropriate settings layout based on combobox ID
-        range.
+        Adds a setting's title, combobox and rule to the settings layout of its built tab.
 
         Args:
-            title (str): Title of the setting.
-            options (list): List of options for the setting.
-            tooltip_header (str): Header text for the tooltip.
-            tooltip_body (str): Body text for the tooltip.
+            setting_entry (SettingEntry): Registry entry of the setting.
 
         Returns:
             None
@@ -265,52 +351,29 @@ class SettingsPanel(QWidget):
         Examples:
             Default usage:
                 .. code-block:: python
-                >>> add_setting(title, options, tooltip_header, tooltip_body, rule)
+                >>> add_setting_widgets(SettingsRegistry.BY_KEY["fxaa_enable"])
         """
+        setting = setting_entry.setting
+
         # Create a container widget for the setting
         container = QWidget()
         container_layout = QVBoxLayout(container)
 
-        # Create a horizontal rule
-        horizontal_rule = QLabel('<html><body><hr /></body></html>')
-
         # Create a QLabel to display the setting title
-        label = QLabel(f'<html><body>{title}</body></html>')
-
-        # Create a QComboBox to select options
-        combobox = QComboBox()
-        combobox.addItems(options)
+        label = QLabel(f'<html><body>{setting.get_title()}</body></html>')
 
-        # Set tooltip for the label
-        label.setToolTip(f'<html><body>{tooltip_header}{tooltip_body}</body></html>')
-        
-        # Add the label and combobox to the container layout
-        container_layout.addWidget(label)
-        container_layout.addWidget(combobox)
+        # Set tooltip for the label when it is first hovered
+        self._pending_tooltips[label] = setting
+        label.installEventFilter(self)
         
-        if rule == (True):
-            container_layout.addWidget(horizontal_rule)
-
-        # Determine the appropriate settings layout based on combobox ID range
-        combobox_id = len(self.comboboxes)
-        if combobox_id in range(10):
-            settings_layout = self.aa_settings_layout
-            disabled_comboboxes = (1, 2, 3, 5, 6, 7, 8, 9)
-        elif combobox_id in range(10, 18):
-            settings_layout = self.af_settings_layout
-            disabled_comboboxes = (11, 12, 14, 15, 16, 17)
-        elif combobox_id in range(18, 23):
-            settings_layout = self.sharpness_settings_layout
-            disabled_comboboxes = (19, 21, 22)
-        elif combobox_id in range(23, 29):
-            settings_layout = self.vsync_settings_layout
-            disabled_comboboxes = (24, 25, 27, 28)
-        else:
-            settings_layout = self.misc_settings_layout
-            disabled_comboboxes = []
+        # Create a QComboBox showing the setting's selected option
+        combobox_id = SettingsRegistry.ID_OF[setting_entry.key]
+        combobox = QComboBox()
+        combobox.addItems(setting_entry.get_options())
+        combobox.setCurrentIndex(self.settings_model.option_index(combobox_id))
 
-        # Add the container to the appropriate settings layout
-        settings_layout.addWidget(container)
+        # Disable dependent comboboxes until their enable option is selected
+        combobox.setEnabled(self.settings_model.is_active(combobox_id))
 
         # Set property ID for the combobox and store it in the dictionary
         combobox.setProperty("id", combobox_id)
@@ -320,9 +383,36 @@ class SettingsPanel(QWidget):
         # other comboboxes
         combobox.currentIndexChanged.connect(self.toggle_comboboxes)
 
-        # Disable specific comboboxes initially
-        if combobox_id in disabled_comboboxes:
-            combobox.setEnabled(False)
+        # Add the label and combobox to the container layout
+        container_layout.addWidget(label)
+        container_layout.addWidget(combobox)
+        
+        if setting.get_rule() == (True):
+            # Create a horizontal rule
+            container_layout.addWidget(QLabel('<html><body><hr /></body></html>'))
+
+        # Add the container to the settings layout of its tab, above the stretch
+        settings_layout = self.tab_layouts[setting_entry.tab]
+        settings_layout.insertWidget(settings_layout.count() - 1, container)
+
+    def eventFilter(self, 
+                    watched, 
+                    event) -> bool:
+        """
+        Sets a setting title's tooltip the first time it is hovered, before the label shows it.
+
+        Args:
+            watched (QObject): Object the event is for.
+            event (QEvent): The event.
+
+        Returns:
+            bool: False, the event is always passed on.
+        """
+        if event.type() == QEvent.Type.ToolTip and watched in self._pending_tooltips:
+            setting = self._pending_tooltips.pop(watched)
+            watched.setToolTip(f'<html><body>{setting.get_tooltip_header()}{setting.get_tooltip_body()}</body></html>')
+            watched.removeEventFilter(self)
+        return super().eventFilter(watched, event)
 
     # ------------------------------------------------------------------------------ #
     # Toggle comboboxes in settings tabs.                                            #
@@ -330,8 +420,8 @@ class SettingsPanel(QWidget):
     def toggle_comboboxes(self, 
                           index: int) -> None:
         """
-        Toggles the state of comboboxes based on the index of the selected
-        item and for initial display.
+        Stores a combobox's selected option in the settings model, which enables or disables the dependent
+        comboboxes through sync_comboboxes().
 
         Args:
             index (int): Index of the selected item in the combobox.
@@ -352,100 +442,112 @@ class SettingsPanel(QWidget):
         # Get the combobox ID
         combobox_id = sender_combobox.property("id")
 
-        # Determine which comboboxes to activate based on the sender_combobox
-
-        # FXAA Enable:
-        if combobox_id == 0 and index == 1: # Set to 'Enabled'
-            for id in range(1, 4):
-                self.comboboxes[id].setEnabled(True) # Activate FXAA options
-        elif combobox_id == 0 and index in [0, 2]: # Not set to 'Enabled' or not selected
-            for id in range(1, 4):
-                self.comboboxes[id].setEnabled(False) # Deactivate FXAA options
-
-        # SMAA Enable:
-        elif combobox_id == 4 and index == 1: # Set to 'Enabled'
-            for id in range(5, 10):
-                self.comboboxes[id].setEnabled(True) # Activate SMAA options
-        elif combobox_id == 4 and index in [0, 2]: # Not set to 'Enabled' or not selected
-            for id in range(5, 10):
-                self.comboboxes[id].setEnabled(False) # Deactivate SMAA options
-
-        # AF Enable:
-        elif combobox_id == 10 and index == 1: # Set to 'Enabled'
-            self.comboboxes[11].setEnabled(True) # Activate AF Level
-            self.comboboxes[12].setEnabled(False) # Deactivate AF Level D3D9
-        elif combobox_id == 10 and index == 2: # Set to 'Enabled D3D9'
-            self.comboboxes[11].setEnabled(False) # Deactivate AF Level
-            self.comboboxes[12].setEnabled(True) # Activate AF Level D3D9
-        elif combobox_id == 10 and index in [0, 3]: # Not set to 'Enabled' or not selected
-            self.comboboxes[11].setEnabled(False) # Deactivate AF Level
-            self.comboboxes[12].setEnabled(False) # Deactivate AF Level D3D9
-
-        # LOD Enable:
-        elif combobox_id == 13 and index == 1: # Set to 'Enabled'
-            self.comboboxes[14].setEnabled(True) # Activate LOD Bias
-            self.comboboxes[15].setEnabled(False) # Deactivate LOD Bias D3D9
-            self.comboboxes[16].setEnabled(True) # Activate Clamp Negative LOD
-            self.comboboxes[17].setEnabled(False) # Deactivate Clamp Negative LOD D3D9
-        elif combobox_id == 13 and index == 2: # Set to 'Enabled D3D9'
-            self.comboboxes[14].setEnabled(False) # Deactivate LOD Bias
-            self.comboboxes[15].setEnabled(True) # Activate LOD Bias D3D9
-            self.comboboxes[16].setEnabled(False) # Deactivate Clamp Negative LOD
-            self.comboboxes[17].setEnabled(True) # Activate Clamp Negative LOD D3D9
-        elif combobox_id == 13 and index in [0, 3]: # Not set to 'Enabled' or not selected
-            self.comboboxes[14].setEnabled(False) # Deactivate LOD Bias
-            self.comboboxes[15].setEnabled(False) # Deactivate LOD Bias D3D9
-            self.comboboxes[16].setEnabled(False) # Deactivate Clamp Negative LOD
-            self.comboboxes[17].setEnabled(False) # Deactivate Clamp Negative LOD D3D9
-
-        # CAS Enable:
-        elif combobox_id == 18 and index == 1: # Set to 'Enabled'
-            self.comboboxes[19].setEnabled(True) # Activate CAS Sharpness
-        elif combobox_id == 18 and index in [0, 2]: # Not set to 'Enabled' or not selected
-            self.comboboxes[19].setEnabled(False) # Deactivate CAS Sharpness
-
-        # DLS Enable:
-        elif combobox_id == 20 and index == 1: # Set to 'Enabled'
-            self.comboboxes[21].setEnabled(True) # Activate DLS Sharpness
-            self.comboboxes[22].setEnabled(True) # Activate DLS Denoise
-        elif combobox_id == 20 and index in [0, 2]: # Not set to 'Enabled' or not selected
-            self.comboboxes[21].setEnabled(False) # Deactivate DLS Sharpness
-            self.comboboxes[22].setEnabled(False) # Deactivate DLS Denoise
-
-        # VSync Enable:
-        elif combobox_id == 23 and index == 1: # Set to 'Enabled'
-            self.comboboxes[24].setEnabled(True) # Activate VSync Level
-            self.comboboxes[25].setEnabled(False) # Deactivate VSync Level D3D9
-        elif combobox_id == 23 and index == 2: # Set to 'Enabled D3D9'
-            self.comboboxes[24].setEnabled(False) # Deactivate VSync Level
-            self.comboboxes[25].setEnabled(True) # Activate VSync Level D3D9
-        elif combobox_id == 23 and index in [0, 3]: # Not set to 'Enabled' or not selected
-            self.comboboxes[24].setEnabled(False) # Deactivate VSync Level
-            self.comboboxes[25].setEnabled(False) # Deactivate VSync Level D3D9
-
-        # Frame Limit Enable
-        elif combobox_id == 26 and index == 1: # Set to 'Enabled'
-            self.comboboxes[27].setEnabled(True) # Activate Frame Limit
-            self.comboboxes[28].setEnabled(False) # Deactivate Frame Limit D3D9
-        elif combobox_id == 26 and index == 2: # Set to 'Enabled D3D9'
-            self.comboboxes[27].setEnabled(False) # Deactivate Frame Limit
-            self.comboboxes[28].setEnabled(True) # Activate Frame Limit D3D9
-        elif combobox_id == 26 and index in [0, 3]: # Not set to 'Enabled' or not selected
-            self.comboboxes[27].setEnabled(False) # Deactivate Frame Limit
-            self.comboboxes[28].setEnabled(False) # Deactivate Frame Limit D3D9
+        self.settings_model.set_option_index(combobox_id, index)
+
+    def sync_comboboxes(self, 
+                        top_left, 
+                        bottom_right, 
+                        roles: list = None) -> None:
+        """
+        Updates the built comboboxes of settings changed in the settings model: their selected option, and whether
+        they are enabled. Comboboxes whose state is unchanged are not touched.
+
+        Args:
+            top_left (QModelIndex): First changed model index.
+            bottom_right (QModelIndex): Last changed model index, under the same tab.
+            roles (list): Changed roles, unused.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> settings_model.dataChanged.connect(sync_comboboxes)
+        """
+        parent = top_left.parent()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            combobox_id: int = self.settings_model.combobox_id(self.settings_model.index(row, SettingsGridModel.OPTION_COL, parent))
+            combobox = self.comboboxes.get(combobox_id)
+            if combobox is None:
+                continue
+
+            # Set the option without feeding it back to the model
+            index: int = self.settings_model.option_index(combobox_id)
+            if combobox.currentIndex() != index:
+                blocked: bool = combobox.blockSignals(True)
+                combobox.setCurrentIndex(index)
+                combobox.blockSignals(blocked)
+
+            enabled: bool = self.settings_model.is_active(combobox_id)
+            if combobox.isEnabled() != enabled:
+                combobox.setEnabled(enabled)
+
+    # ------------------------------------------------------------------------------ #
+    # Apply a whole profile to the settings                                          #
+    # ------------------------------------------------------------------------------ #
+    def apply_option_indices(self,
+                             indices: tuple) -> None:
+        """
+        Selects one option per setting in a single pass; the built comboboxes are updated once per tab.
+
+        Args:
+            indices (tuple): Option index of every setting, in combobox ID order.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> apply_option_indices(SettingsCode.indices(code))
+        """
+        self.settings_model.set_option_indices(indices)
 
     # ------------------------------------------------------------------------------ #
     # Get combobox current values                                                    #
     # ------------------------------------------------------------------------------ #
-    def get_combobox_values(self) -> list:
+    def get_combobox_values(self) -> SettingsRecord:
+        """
+        Gets the current values of all settings in the settings panel.
+
+        Args:
+            None.
+
+        Returns:
+            SettingsRecord: Current combobox values.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> combobox_values: SettingsRecord = get_combobox_values()
+        """
+        # The selected option indices decode to the values stored for them: None for no selection, True / False
+        # for enable settings, the option text otherwise, and None for settings whose enable option is not selected.
+        return SettingsCode.decode(SettingsCode.from_indices(self.settings_model.option_indices()))
+
+    # ------------------------------------------------------------------------------ #
+    # Track edited settings                                                          #
+    # ------------------------------------------------------------------------------ #
+    def dirty_fields(self) -> tuple:
         """
-        Gets the current values of all comboboxes in the settings panel.
+        Names the settings changed since the panel's settings were last loaded or saved. A setting changed and then
+        changed back is not dirty.
 
         Args:
             None.
 
         Returns:
-            list: List of current combobox values.
+            tuple: Changed field names, in FIELDS order.
 
         Raises:
             None.
@@ -453,207 +555,39 @@ class SettingsPanel(QWidget):
         Examples:
             Default usage:
                 .. code-block:: python
-                >>> combobox_values: list = get_combobox_values()
+                >>> dirty_fields() # e.g. ("cas_enable", "cas_level")
         """
-        # Check each sectional combobox and get its value based on its index
-        # FXAA Settings
-        if self.comboboxes[0].currentIndex() == 1: # If FXAA is enabled
-            fxaa_enable: bool = True
-            fxaa_quality_subpixel: str = self.comboboxes[1].currentText()
-            fxaa_quality_edge: str = self.comboboxes[2].currentText()
-            fxaa_edge_threshold: str = self.comboboxes[3].currentText()
-        elif self.comboboxes[0].currentIndex() == 2: # If FXAA is disabled
-            fxaa_enable: bool = False
-            fxaa_quality_subpixel: str = None
-            fxaa_quality_edge: str = None
-            fxaa_edge_threshold: str = None
-        else: # If FXAA is not selected
-            fxaa_enable: bool = None
-            fxaa_quality_subpixel: str = None
-            fxaa_quality_edge: str = None
-            fxaa_edge_threshold: str = None
-
-        # SMAA Settings
-        if self.comboboxes[4].currentIndex() == 1: # If SMAA is enabled
-            smaa_enable: bool = True
-            smaa_edge_detection: str = self.comboboxes[5].currentText()
-            smaa_threshold: str = self.comboboxes[6].currentText()
-            smaa_search_steps: str = self.comboboxes[7].currentText()
-            smaa_search_steps_diagonal: str = self.comboboxes[8].currentText()
-            smaa_corner_rounding: str = self.comboboxes[9].currentText()
-        elif self.comboboxes[4].currentIndex() == 2: # If SMAA is disabled
-            smaa_enable: bool = False
-            smaa_edge_detection: str = None
-            smaa_threshold: str = None
-            smaa_search_steps: str = None
-            smaa_search_steps_diagonal: str = None
-            smaa_corner_rounding: str = None
-        else: # If SMAA is not selected
-            smaa_enable: bool = None
-            smaa_edge_detection: str = None
-            smaa_threshold: str = None
-            smaa_search_steps: str = None
-            smaa_search_steps_diagonal: str = None
-            smaa_corner_rounding: str = None
-
-        # Anistropic Filtering Settings
-        if self.comboboxes[10].currentText() == "Enable": # If AF is enabled
-            anistropic_enable: str = self.comboboxes[10].currentText()
-            anistropic_level: str = self.comboboxes[11].currentText()
-            anistropic_level_d3d9: str = None
-        elif self.comboboxes[10].currentText() == "Enable (D3D9)": # If AF is enabled D3D9
-            anistropic_enable: str = self.comboboxes[10].currentText()
-            anistropic_level: str = None
-            anistropic_level_d3d9: str = self.comboboxes[12].currentText()
-        elif self.comboboxes[10].currentText() == "Disable": # If AF is disabled
-            anistropic_enable: str = self.comboboxes[10].currentText()
-            anistropic_level: str = None
-            anistropic_level_d3d9: str = None
-        else: # If AF is not selected
-            anistropic_enable: str = None
-            anistropic_level: str = None
-            anistropic_level_d3d9: str = None
-
-        # LOD Settings
-        if self.comboboxes[13].currentText() == "Enable": # If LOD is enabled
-            lod_enable: str = self.comboboxes[13].currentText()
-            lod_bias: str = self.comboboxes[14].currentText()
-            lod_bias_d3d9: str = None
-            clamp_negative_lod: str = self.comboboxes[16].currentText()
-            clamp_negative_lod_d3d9: str = None
-        elif self.comboboxes[13].currentText() == "Enable (D3D9)": # If LOD is enabled D3D9
-            lod_enable: str = self.comboboxes[13].currentText()
-            lod_bias: str = None
-            lod_bias_d3d9: str = self.comboboxes[15].currentText()
-            clamp_negative_lod: str = None
-            clamp_negative_lod_d3d9: str = self.comboboxes[17].currentText()
-        elif self.comboboxes[13].currentText() == "Disable": # If LOD is disabled
-            lod_enable: str = self.comboboxes[13].currentText()
-            lod_bias: str = None
-            lod_bias_d3d9: str = None
-            clamp_negative_lod: str = None
-            clamp_negative_lod_d3d9: str = None
-        else: # If LOD is not selected
-            lod_enable: bool = None
-            lod_bias: str = None
-            lod_bias_d3d9: str = None
-            clamp_negative_lod: str = None
-            clamp_negative_lod_d3d9: str = None
-
-        # Contrast Adaptive Sharpening (CAS) Settings
-        if self.comboboxes[18].currentIndex() == 1: # If CAS is enabled
-            cas_enable: bool = True
-            cas_sharpness: str = self.comboboxes[19].currentText()
-        elif self.comboboxes[18].currentIndex() == 2: # If CAS is disabled
-            cas_enable: bool = False
-            cas_sharpness: str = None
-        else: # If CAS is not selected
-            cas_enable: bool = None
-            cas_sharpness: str = None
-
-        # Denoised Luma Sharpening (DLS) Settings
-        if self.comboboxes[20].currentIndex() == 1: # If DLS is enabled
-            dls_enable: bool = True
-            dls_sharpness: str = self.comboboxes[21].currentText()
-            dls_denoise: str = self.comboboxes[22].currentText()
-        elif self.comboboxes[20].currentIndex() == 2: # If DLS is disabled
-            dls_enable: bool = False
-            dls_sharpness: str = None
-            dls_denoise: str = None
-        else: # If DLS is not selected
-            dls_enable: bool = None
-            dls_sharpness: str = None
-            dls_denoise: str = None
-
-        # VSync Settings
-        if self.comboboxes[23].currentText() == "Enable": # If VSync is enabled
-            vsync_enable: str = self.comboboxes[23].currentText()
-            vsync_level: str = self.comboboxes[24].currentText()
-            vsync_level_d3d9: str = None
-        elif self.comboboxes[23].currentText() == "Enable (D3D9)": # If VSync is enabled D3D9
-            vsync_enable: str = self.comboboxes[23].currentText()
-            vsync_level: str = None
-            vsync_level_d3d9: str = self.comboboxes[25].currentText()
-        elif self.comboboxes[23].currentText() == "Disable": # If VSync is disabled
-            vsync_enable: bool = self.comboboxes[23].currentText()
-            vsync_level: str = None
-            vsync_level_d3d9: str = None
-        else: # If VSync is not selected
-            vsync_enable: bool = None
-            vsync_level: str = None
-            vsync_level_d3d9: str = None
-
-        # Frame Limit Settings
-        if self.comboboxes[26].currentText() == "Enable": # If Frame Limit is enabled
-            frame_limit_enable: str = self.comboboxes[23].currentText()
-            frame_limit_level: str = self.comboboxes[27].currentText()
-            frame_limit_level_d3d9: str = None
-        elif self.comboboxes[26].currentText() == "Enable (D3D9)": # If Frame Limit is enabled D3D9
-            frame_limit_enable: str = self.comboboxes[23].currentText()
-            frame_limit_level: str = None
-            frame_limit_level_d3d9: str = self.comboboxes[28].currentText()
-        elif self.comboboxes[26].currentText() == "Disable": # If Frame Limit is disabled
-            frame_limit_enable: str = self.comboboxes[23].currentText()
-            frame_limit_level: str = None
-            frame_limit_level_d3d9: str = None
-        else: # If Frame Limit is not selected
-            frame_limit_enable: bool = None
-            frame_limit_level: str = None
-            frame_limit_level_d3d9: str = None
-
-        # Misc Settings
-        if self.comboboxes[29].currentIndex() == 1: # If HDR is enabled
-            hdr_enable: bool = True
-        elif self.comboboxes[29].currentIndex() == 2: # If HDR is disabled
-            hdr_enable: bool = False
-        else: # If HDR is not selected
-            hdr_enable: bool = None
-
-        if self.comboboxes[30].currentIndex() != 0: # If D3D Level is selected
-            d3d_level: str = self.comboboxes[30].currentText()
-        else: # If D3D Level is not selected
-            d3d_level: str = None
-
-
-        return [
-            fxaa_enable,
-            fxaa_quality_subpixel,
-            fxaa_quality_edge,
-            fxaa_edge_threshold,
-            smaa_enable,
-            smaa_edge_detection,
-            smaa_threshold,
-            smaa_search_steps,
-            smaa_search_steps_diagonal,
-            smaa_corner_rounding,
-            anistropic_enable,
-            anistropic_level,
-            anistropic_level_d3d9,
-            lod_enable,
-            lod_bias,
-            lod_bias_d3d9,
-            clamp_negative_lod,
-            clamp_negative_lod_d3d9,
-            cas_enable,
-            cas_sharpness,
-            dls_enable,
-            dls_sharpness,
-            dls_denoise,
-            vsync_enable,
-            vsync_level,
-            vsync_level_d3d9,
-            frame_limit_enable,
-            frame_limit_level,
-            frame_limit_level_d3d9,
-            hdr_enable,
-            d3d_level
-        ]
+        return self._clean_record.diff(self.get_combobox_values())
+
+    def mark_clean(self) -> None:
+        """
+        Records the current settings as loaded or saved, so no field is dirty.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> mark_clean()
+        """
+        self._clean_record = self.get_combobox_values()
+
     # ------------------------------------------------------------------------------ #
     # Save settings values                                                           #
     # ------------------------------------------------------------------------------ #
     def save_settings(self):
         """
-        Saves the current settings to the JSON database and configuration files (dxvk.conf | vkBasalt.conf).
+        Saves the current settings to the JSON database and configuration files (dxvk.conf | vkBasalt.conf) of every
+        selected application. Only the fields which change are stored, and only the configuration files generated
+        from them are rewritten. The JSON database is written once and the configuration files in parallel, followed
+        by a single summary.
         
         Args: 
             None
@@ -669,36 +603,133 @@ class SettingsPanel(QWidget):
                 .. code-block:: python
                 >>> save_settings()
         """
+        # Save to a profile layer instead of the selected applications
+        if self.profile_layer_combobox.currentIndex() > 0:
+            self.save_profile_layer(self.selected_layer_gapi())
+            return
+
+        selected_apps: list = self.app_list_panel_ref.get_selected_applications()
+        if not selected_apps:
+            return
+
+        gui_data: SettingsRecord = self.get_combobox_values()
+        dirty_fields: tuple = self.dirty_fields()
+
+        # Fields each application's save changes: the panel's edits for an application holding the settings last
+        # loaded or saved, every field differing from the panel for any other, and all of them if never saved.
+        changes: list = []
+        for app in selected_apps:
+            if not app["settings"].get("settings_set"):
+                changes.append(SettingsRecord.FIELDS)
+                continue
+            stored_record: SettingsRecord = SettingsCode.record_of(app["settings"])
+            changes.append(dirty_fields if stored_record == self._clean_record else stored_record.diff(gui_data))
+
+        # Save every changed application's fields in one JSON transaction.
+        with self._json_handler.transaction():
+            for app, changed in zip(selected_apps, changes):
+                if changed:
+                    self._json_handler.add_app_settings(app["app_path"], app["app_name"], app["app_gapi"], gui_data, changed)
+
+        # Keep the app list's copy of the settings in step, so library queries see the saved values.
+        layers: ProfileLayers = self._json_handler.get_profile_layers()
+        deploy: list = []
+        for app, changed in zip(selected_apps, changes):
+            if not changed:
+                continue
+            saved_settings: dict = dict(app["settings"], **{field: getattr(gui_data, field) for field in changed}, settings_set=True)
+            try:
+                saved_settings["profile_code"] = SettingsCode.to_text(SettingsCode.encode(SettingsRecord.from_dict(saved_settings)))
+            except ValueError:
+                saved_settings["profile_code"] = None
+            self.app_list_panel_ref.app_model.set_app_settings(app["app_path"], saved_settings)
+
+            # Each application's effective settings, its own over its profile layers, regenerating only the
+            # configuration files of the tools whose fields changed.
+            deploy.append((app["app_path"], layers.resolve_settings(saved_settings, app["app_gapi"]), changed))
+
+        self.mark_clean()
+
+        if not deploy:
+            QMessageBox.information(self, "No Changes To Save", "The selected applications already have these settings saved.")
+            return
+
+        report: dict = {}
+        failures: dict = self._conf_handler.save_conf_many(deploy, report)
+        files_note: str = f'<p>Configuration files: {AppConfHandler.summarise_report(report)}.</p>'
+
+        launch_note: str = '<p>Add the following line to your steam launch arguments (<span style="font-style: italic;">if not already present</span>):</p>\n\n<p style="font-weight: bold; color: CornflowerBlue;">ENABLE_VKBASALT=1 &lt;<span style="font-style: italic;">your existing launch arguments</span>&gt; %command%'
+        if failures:
+            failed: str = "<br>".join(f"{path}: {error}" for path, error in failures.items())
+            QMessageBox.warning(self, "Application Settings Saved With Errors", f'<p>Application settings have been saved to the internal database, but configuration files could not be written for {len(failures)} of {len(selected_apps)} applications:</p>\n\n<p style="font-style: italic; color: red;">{failed}</p>\n\n{files_note}')
+        elif len(deploy) == 1:
+            deployed_files: str = "<br>".join(report)
+            QMessageBox.information(self, "Application Settings Saved!", f'<p>Application settings have been saved successfully, to both the internal database and configuration files;</p>\n\n<p style="font-style: italic; color: green;">{deployed_files}</p>\n\n{files_note}\n\n{launch_note}')
+        else:
+            QMessageBox.information(self, "Application Settings Saved!", f'<p>Application settings have been saved successfully for {len(deploy)} of {len(selected_apps)} applications, to both the internal database and the configuration files generated from the changed settings.</p>\n\n{files_note}\n\n{launch_note}')
+
+    # ------------------------------------------------------------------------------ #
+    # Load settings values                                                           #
+    # ------------------------------------------------------------------------------ #
+    def load_settings(self):
+        """
+        Loads the settings from the JSON database and updates the GUI comboboxes accordingly. Saved values which are not
+        options of their setting are reported and left unselected.
+
+        Args:
+            None
+        
+        Returns:
+            None
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> load_settings()
+        """
+        # Load a profile layer instead of the selected application
+        if self.profile_layer_combobox.currentIndex() > 0:
+            self.load_profile_layer(self.selected_layer_gapi())
+            return
+
         settings_list: list = self.app_list_panel_ref.get_selected_application()
 
         selection_check: bool = settings_list[0]
         if selection_check == False:
             return
-
+        
         app_path: str = settings_list[1]
         app_name: str = settings_list[2]
         app_gapi: str = settings_list[3]
 
-        gui_data: list = self.get_combobox_values()
+        settings: SettingsRecord = self._json_handler.get_app_settings(app_path, app_name, app_gapi)
 
-        self._json_handler.add_app_settings(app_path, app_name, app_gapi, gui_data)
-        
-        self._conf_handler.save_conf_vkbasalt(app_path, gui_data)
-        self._conf_handler.save_conf_dxvk(app_path, gui_data)
+        # Look up each stored value's option, reporting values that are not options of their setting
+        indices, unknown = SettingsRegistry.option_indices(settings.as_tuple())
+        if unknown:
+            unknown_values: str = "<br>".join(f"{SettingsRegistry.BY_KEY[key].setting.get_title()}: {value!r}" for key, value in unknown)
+            QMessageBox.warning(self, "Unknown Settings Values", f'<p>These saved values are not options of their settings and have been left unselected;</p>\n\n<p style="font-style: italic; color: red;">{unknown_values}</p>')
 
-        converted_path = os.path.dirname(app_path) + "/"
-        QMessageBox.information(self, "Application Settings Saved!", f'<p>Application settings have been saved successfully, to both the internal database and configuration files;</p>\n\n<p style="font-style: italic; color: green;">{converted_path}dxvk.conf<br>{converted_path}vkBasalt.conf</p>\n\n<p>Add the following line to your steam launch arguments (<span style="font-style: italic;">if not already present</span>):</p>\n\n<p style="font-weight: bold; color: CornflowerBlue;">ENABLE_VKBASALT=1 &lt;<span style="font-style: italic;">your existing launch arguments</span>&gt; %command%')
+        # Select every option, then set the dependent comboboxes' enabled states once
+        self.apply_option_indices(indices)
+        self.mark_clean()
+            
+        QMessageBox.information(self, "Application Settings Loaded!", f'Application settings have been loaded successfully from the internal database for <span style="font-weight: bold; color: CornflowerBlue;">{app_name}</span>.')
 
     # ------------------------------------------------------------------------------ #
-    # Load settings values                                                           #
+    # Import existing config files                                                   #
     # ------------------------------------------------------------------------------ #
-    def load_settings(self):
+    def import_config(self) -> None:
         """
-        Loads the settings from the JSON database and updates the GUI comboboxes accordingly.
+        Selects the options of the selected application's existing vkBasalt.conf and dxvk.conf. The imported settings
+        are left unsaved, so saving them stores them and merges any changes back into the files.
 
         Args:
             None
-        
+
         Returns:
             None
 
@@ -708,445 +739,149 @@ class SettingsPanel(QWidget):
         Examples:
             Default usage:
                 .. code-block:: python
-                >>> load_settings()
+                >>> import_config()
         """
         settings_list: list = self.app_list_panel_ref.get_selected_application()
 
         selection_check: bool = settings_list[0]
         if selection_check == False:
             return
-        
+
         app_path: str = settings_list[1]
         app_name: str = settings_list[2]
-        app_gapi: str = settings_list[3]
 
-        gui_data: list = self._json_handler.get_app_settings(app_path, app_name, app_gapi)
-        
-        fxaa_enable: bool = gui_data[0]
-        fxaa_quality_subpixel: str = gui_data[1]
-        fxaa_quality_edge: str = gui_data[2]
-        fxaa_edge_threshold: str = gui_data[3]
-        smaa_enable: bool = gui_data[4]
-        smaa_edge_detection: str = gui_data[5]
-        smaa_threshold: str = gui_data[6]
-        smaa_search_steps: str = gui_data[7]
-        smaa_search_steps_diagonal: str = gui_data[8]
-        smaa_corner_rounding: str = gui_data[9]
-        anisotropic_enable: str = gui_data[10]
-        anisotropic_level: str = gui_data[11]
-        anisotropic_level_d3d9: str = gui_data[12]
-        lod_enable: str = gui_data[13]
-        lod_bias: str = gui_data[14]
-        lod_bias_d3d9: str = gui_data[15]
-        clamp_negative_lod: str = gui_data[16]
-        clamp_negative_lod_d3d9: str = gui_data[17]
-        cas_enable: bool = gui_data[18]
-        cas_sharpness: str = gui_data[19]
-        dls_enable: bool = gui_data[20]
-        dls_sharpness: str = gui_data[21]
-        dls_denoise: str = gui_data[22]
-        vsync_enable: str = gui_data[23]
-        vsync_level: str = gui_data[24]
-        vsync_level_d3d9: str = gui_data[25]
-        frame_limit_enable: str = gui_data[26]
-        frame_limit_level: str = gui_data[27]
-        frame_limit_level_d3d9: str = gui_data[28]
-        hdr_enable: bool = gui_data[29]
-        d3d_level: str = gui_data[30]
-
-        # Set each sectional combobox based on the retrieved values
-        # FXAA Settings
-        if fxaa_enable == True:
-            self.comboboxes[0].setCurrentIndex(1) # Enable
-            # Set FXAA Quality Subpixel
-            if fxaa_quality_subpixel == None:
-                self.comboboxes[1].setCurrentIndex(0)
-            elif fxaa_quality_subpixel == "1.00":
-                self.comboboxes[1].setCurrentIndex(1)
-            elif fxaa_quality_subpixel == "0.75":
-                self.comboboxes[1].setCurrentIndex(2)
-            elif fxaa_quality_subpixel == "0.50":
-                self.comboboxes[1].setCurrentIndex(3)
-            elif fxaa_quality_subpixel == "0.25":
-                self.comboboxes[1].setCurrentIndex(4)
-            elif fxaa_quality_subpixel == "0.00":
-                self.comboboxes[1].setCurrentIndex(5)
-            # Set FXAA Quality Edge
-            if fxaa_quality_edge == None:
-                self.comboboxes[2].setCurrentIndex(0)
-            elif fxaa_quality_edge == "Highest Quality":
-                self.comboboxes[2].setCurrentIndex(1)
-            elif fxaa_quality_edge == "High Quality":
-                self.comboboxes[2].setCurrentIndex(2)
-            elif fxaa_quality_edge == "Default":
-                self.comboboxes[2].setCurrentIndex(3)
-            elif fxaa_quality_edge == "Low Quality  ":
-                self.comboboxes[2].setCurrentIndex(4)
-            elif fxaa_quality_edge == "Lowest Quality":
-                self.comboboxes[2].setCurrentIndex(5)
-            # Set FXAA Edge Threshold
-            if fxaa_edge_threshold == None:
-                self.comboboxes[3].setCurrentIndex(0)
-            elif fxaa_edge_threshold == "Upper Limit":
-                self.comboboxes[3].setCurrentIndex(1)
-            elif fxaa_edge_threshold == "High Quality":
-                self.comboboxes[3].setCurrentIndex(2)
-            elif fxaa_edge_threshold == "Visible Limit":
-                self.comboboxes[3].setCurrentIndex(3)
-            elif fxaa_edge_threshold == "Zero":
-                self.comboboxes[3].setCurrentIndex(4)
-        elif fxaa_enable == False:
-            self.comboboxes[0].setCurrentIndex(2) # Disable
-            self.comboboxes[1].setCurrentIndex(0)
-            self.comboboxes[2].setCurrentIndex(0)
-            self.comboboxes[3].setCurrentIndex(0)
-        else:
-            self.comboboxes[0].setCurrentIndex(0) # Not Selected
-            self.comboboxes[1].setCurrentIndex(0)
-            self.comboboxes[2].setCurrentIndex(0)
-            self.comboboxes[3].setCurrentIndex(0)
-
-        # SMAA Settings
-        if smaa_enable == True:
-            self.comboboxes[4].setCurrentIndex(1) # Enable
-            # Set SMAA Edge Detection
-            if smaa_edge_detection == None:
-                self.comboboxes[5].setCurrentIndex(0)
-            elif smaa_edge_detection == "Luma":
-                self.comboboxes[5].setCurrentIndex(1)
-            elif smaa_edge_detection == "Color":
-                self.comboboxes[5].setCurrentIndex(2)
-            # Set SMAA Threshold
-            if smaa_threshold == None:
-                self.comboboxes[6].setCurrentIndex(0)
-            elif smaa_threshold == "Highest Quality":
-                self.comboboxes[6].setCurrentIndex(1)
-            elif smaa_threshold == "Quality":
-                self.comboboxes[6].setCurrentIndex(2)
-            elif smaa_threshold == "Balanced":
-                self.comboboxes[6].setCurrentIndex(3)
-            elif smaa_threshold == "Low Quality":
-                self.comboboxes[6].setCurrentIndex(4)
-            elif smaa_threshold == "Lowest Quality":
-                self.comboboxes[6].setCurrentIndex(5)
-            # Set SMAA Search Steps
-            if smaa_search_steps == None:
-                self.comboboxes[7].setCurrentIndex(0)
-            elif smaa_search_steps == "x32":
-                self.comboboxes[7].setCurrentIndex(1)
-            elif smaa_search_steps == "x16":
-                self.comboboxes[7].setCurrentIndex(2)
-            elif smaa_search_steps == "x8":
-                self.comboboxes[7].setCurrentIndex(3)
-            elif smaa_search_steps == "x4":
-                self.comboboxes[7].setCurrentIndex(4)
-            elif smaa_search_steps == "x2":
-                self.comboboxes[7].setCurrentIndex(5)
-            # Set SMAA Search Steps Diagonal
-            if smaa_search_steps_diagonal == None:
-                self.comboboxes[8].setCurrentIndex(0)
-            elif smaa_search_steps_diagonal == "x16":
-                self.comboboxes[8].setCurrentIndex(1)
-            elif smaa_search_steps_diagonal == "x8":
-                self.comboboxes[8].setCurrentIndex(2)
-            elif smaa_search_steps_diagonal == "x4":
-                self.comboboxes[8].setCurrentIndex(3)
-            elif smaa_search_steps_diagonal == "x2":
-                self.comboboxes[8].setCurrentIndex(4)
-            elif smaa_search_steps_diagonal == "x0":
-                self.comboboxes[8].setCurrentIndex(5)
-            # Set SMAA Corner Rounding
-            if smaa_corner_rounding == None:
-                self.comboboxes[9].setCurrentIndex(0)
-            elif smaa_corner_rounding == "100":
-                self.comboboxes[9].setCurrentIndex(1)
-            elif smaa_corner_rounding == "75":
-                self.comboboxes[9].setCurrentIndex(2)
-            elif smaa_corner_rounding == "50":
-                self.comboboxes[9].setCurrentIndex(3)
-            elif smaa_corner_rounding == "25":
-                self.comboboxes[9].setCurrentIndex(4)
-            elif smaa_corner_rounding == "0":
-                self.comboboxes[9].setCurrentIndex(5)
-        elif smaa_enable == False:
-            self.comboboxes[4].setCurrentIndex(2) # Disable
-            self.comboboxes[5].setCurrentIndex(0)
-            self.comboboxes[6].setCurrentIndex(0)
-            self.comboboxes[7].setCurrentIndex(0)
-            self.comboboxes[8].setCurrentIndex(0)
-            self.comboboxes[9].setCurrentIndex(0)
-        else:
-            self.comboboxes[4].setCurrentIndex(0) # Not Selected
-            self.comboboxes[5].setCurrentIndex(0)
-            self.comboboxes[6].setCurrentIndex(0)
-            self.comboboxes[7].setCurrentIndex(0)
-            self.comboboxes[8].setCurrentIndex(0)
-            self.comboboxes[9].setCurrentIndex(0)
-
-        # Anisotropic Filtering Settings
-        if anisotropic_enable == "Enable":
-            self.comboboxes[10].setCurrentIndex(1) # Enable
-            # Set Anisotropic Level
-            if anisotropic_level == None:
-                self.comboboxes[11].setCurrentIndex(0)
-            elif anisotropic_level == "x16":
-                self.comboboxes[11].setCurrentIndex(1)
-            elif anisotropic_level == "x8":
-                self.comboboxes[11].setCurrentIndex(2)
-            elif anisotropic_level == "x4":
-                self.comboboxes[11].setCurrentIndex(3)
-            elif anisotropic_level == "x2":
-                self.comboboxes[11].setCurrentIndex(4)
-            elif anisotropic_level == "x1":
-                self.comboboxes[11].setCurrentIndex(5)
-        elif anisotropic_enable == "Enable (D3D9)":
-            self.comboboxes[10].setCurrentIndex(2) # Enable (D3D9)
-            # Set Anisotropic Level D3D9
-            if anisotropic_level_d3d9 == None:
-                self.comboboxes[12].setCurrentIndex(0)
-            elif anisotropic_level_d3d9 == "x16":
-                self.comboboxes[12].setCurrentIndex(1)
-            elif anisotropic_level_d3d9 == "x8":
-                self.comboboxes[12].setCurrentIndex(2)
-            elif anisotropic_level_d3d9 == "x4":
-                self.comboboxes[12].setCurrentIndex(3)
-            elif anisotropic_level_d3d9 == "x2":
-                self.comboboxes[12].setCurrentIndex(4)
-            elif anisotropic_level_d3d9 == "x1":
-                self.comboboxes[12].setCurrentIndex(5)
-        elif anisotropic_enable == "Disable":
-            self.comboboxes[10].setCurrentIndex(3) # Disable
-            self.comboboxes[11].setCurrentIndex(0)
-            self.comboboxes[12].setCurrentIndex(0)
-        else:
-            self.comboboxes[10].setCurrentIndex(0) # Not Selected
-            self.comboboxes[11].setCurrentIndex(0)
-            self.comboboxes[12].setCurrentIndex(0)
-
-        # LOD Settings
-        if lod_enable == "Enable":
-            self.comboboxes[13].setCurrentIndex(1) # Enable
-            # Set LOD Bias
-            if lod_bias == None:
-                self.comboboxes[14].setCurrentIndex(0)
-            elif lod_bias == "-2.0":
-                self.comboboxes[14].setCurrentIndex(1)
-            elif lod_bias == "-1.0":
-                self.comboboxes[14].setCurrentIndex(2)
-            elif lod_bias == "0.0":
-                self.comboboxes[14].setCurrentIndex(3)
-            elif lod_bias == "0.5":
-                self.comboboxes[14].setCurrentIndex(4)
-            elif lod_bias == "1.0":
-                self.comboboxes[14].setCurrentIndex(5)
-            # Set Clamp Negative LOD
-            if clamp_negative_lod == None:
-                self.comboboxes[16].setCurrentIndex(0)
-            elif clamp_negative_lod == "Enabled":
-                self.comboboxes[16].setCurrentIndex(1)
-            elif clamp_negative_lod == "Disabled":
-                self.comboboxes[16].setCurrentIndex(2)
-        elif lod_enable == "Enable (D3D9)":
-            self.comboboxes[13].setCurrentIndex(2) # Enable (D3D9)
-            # Set LOD Bias D3D9
-            if lod_bias_d3d9 == None:
-                self.comboboxes[15].setCurrentIndex(0)
-            elif lod_bias_d3d9 == "-2.0":
-                self.comboboxes[15].setCurrentIndex(1)
-            elif lod_bias_d3d9 == "-1.0":
-                self.comboboxes[15].setCurrentIndex(2)
-            elif lod_bias_d3d9 == "0.0":
-                self.comboboxes[15].setCurrentIndex(3)
-            elif lod_bias_d3d9 == "0.5":
-                self.comboboxes[15].setCurrentIndex(4)
-            elif lod_bias_d3d9 == "1.0":
-                self.comboboxes[15].setCurrentIndex(5)
-            # Set Clamp Negative LOD D3D9
-            if clamp_negative_lod_d3d9 == None:
-                self.comboboxes[17].setCurrentIndex(0)
-            elif clamp_negative_lod_d3d9 == "Enabled":
-                self.comboboxes[17].setCurrentIndex(1)
-            elif clamp_negative_lod_d3d9 == "Disabled":
-                self.comboboxes[17].setCurrentIndex(2)
-        elif lod_enable == "Disable":
-            self.comboboxes[13].setCurrentIndex(3) # Disable
-            self.comboboxes[14].setCurrentIndex(0)
-            self.comboboxes[15].setCurrentIndex(0)
-            self.comboboxes[16].setCurrentIndex(0)
-            self.comboboxes[17].setCurrentIndex(0)
-        else:
-            self.comboboxes[13].setCurrentIndex(0) # Not Selected
-            self.comboboxes[14].setCurrentIndex(0)
-            self.comboboxes[15].setCurrentIndex(0)
-            self.comboboxes[16].setCurrentIndex(0)
-            self.comboboxes[17].setCurrentIndex(0)
-
-        # CAS Settings
-        if cas_enable == True:
-            self.comboboxes[18].setCurrentIndex(1) # Enable
-            # Set CAS Sharpness
-            if cas_sharpness == None:
-                self.comboboxes[19].setCurrentIndex(0)
-            elif cas_sharpness == "1.00":
-                self.comboboxes[19].setCurrentIndex(1)
-            elif cas_sharpness == "0.75":
-                self.comboboxes[19].setCurrentIndex(2)
-            elif cas_sharpness == "0.50":
-                self.comboboxes[19].setCurrentIndex(3)
-            elif cas_sharpness == "0.25":
-                self.comboboxes[19].setCurrentIndex(4)
-            elif cas_sharpness == "0.00":
-                self.comboboxes[19].setCurrentIndex(5)
-            elif cas_sharpness == "Off":
-                self.comboboxes[19].setCurrentIndex(6)
-        elif cas_enable == False:
-            self.comboboxes[18].setCurrentIndex(2) # Disable
-            self.comboboxes[19].setCurrentIndex(0)
-        else:
-            self.comboboxes[18].setCurrentIndex(0) # Not Selected
-            self.comboboxes[19].setCurrentIndex(0)
-
-        # DLS Settings
-        if dls_enable == True:
-            self.comboboxes[20].setCurrentIndex(1) # Enable
-            # Set DLS Sharpness
-            if dls_sharpness == None:
-                self.comboboxes[21].setCurrentIndex(0)
-            elif dls_sharpness == "1.00":
-                self.comboboxes[21].setCurrentIndex(1)
-            elif dls_sharpness == "0.75":
-                self.comboboxes[21].setCurrentIndex(2)
-            elif dls_sharpness == "0.50":
-                self.comboboxes[21].setCurrentIndex(3)
-            elif dls_sharpness == "0.25":
-                self.comboboxes[21].setCurrentIndex(4)
-            elif dls_sharpness == "0.00":
-                self.comboboxes[21].setCurrentIndex(5)
-            # Set DLS Denoise
-            if dls_denoise == None:
-                self.comboboxes[22].setCurrentIndex(0)
-            elif dls_denoise == "1.00":
-                self.comboboxes[22].setCurrentIndex(1)
-            elif dls_denoise == "0.75":
-                self.comboboxes[22].setCurrentIndex(2)
-            elif dls_denoise == "0.50":
-                self.comboboxes[22].setCurrentIndex(3)
-            elif dls_denoise == "0.25":
-                self.comboboxes[22].setCurrentIndex(4)
-        elif dls_enable == False:
-            self.comboboxes[20].setCurrentIndex(2) # Disable
-            self.comboboxes[21].setCurrentIndex(0)
-            self.comboboxes[22].setCurrentIndex(0)
-        else:
-            self.comboboxes[20].setCurrentIndex(0) # Not Selected
-            self.comboboxes[21].setCurrentIndex(0)
-            self.comboboxes[22].setCurrentIndex(0)
-
-        # VSync Settings
-        if vsync_enable == "Enable":
-            self.comboboxes[23].setCurrentIndex(1) # Enable
-            # Set VSync Level
-            if vsync_level == None:
-                self.comboboxes[24].setCurrentIndex(0)
-            elif vsync_level == "1 Frame":
-                self.comboboxes[24].setCurrentIndex(1)
-            elif vsync_level == "2 Frames":
-                self.comboboxes[24].setCurrentIndex(2)
-            elif vsync_level == "Off":
-                self.comboboxes[24].setCurrentIndex(3)
-        elif vsync_enable == "Enable (D3D9)":
-            self.comboboxes[23].setCurrentIndex(2) # Enable (D3D9)
-            # Set VSync Level D3D9
-            if vsync_level_d3d9 == None:
-                self.comboboxes[25].setCurrentIndex(0)
-            elif vsync_level_d3d9 == "1 Frame":
-                self.comboboxes[25].setCurrentIndex(1)
-            elif vsync_level_d3d9 == "2 Frames":
-                self.comboboxes[25].setCurrentIndex(2)
-            elif vsync_level_d3d9 == "Off":
-                self.comboboxes[25].setCurrentIndex(3)
-        elif vsync_enable == "Disable":
-            self.comboboxes[23].setCurrentIndex(3) # Disable
-            self.comboboxes[24].setCurrentIndex(0)
-            self.comboboxes[25].setCurrentIndex(0)
-        else:            
-            self.comboboxes[23].setCurrentIndex(0) # Not Selected
-            self.comboboxes[24].setCurrentIndex(0)
-            self.comboboxes[25].setCurrentIndex(0)
-
-        # Frame Limit Settings
-        if frame_limit_enable == "Enable":
-            self.comboboxes[26].setCurrentIndex(1) # Enable
-            # Set Frame Limit Level
-            if frame_limit_level == None:
-                self.comboboxes[27].setCurrentIndex(0)
-            elif frame_limit_level == "30":
-                self.comboboxes[27].setCurrentIndex(1)
-            elif frame_limit_level == "60":
-                self.comboboxes[27].setCurrentIndex(2)
-            elif frame_limit_level == "75":
-                self.comboboxes[27].setCurrentIndex(3)
-            elif frame_limit_level == "120":
-                self.comboboxes[27].setCurrentIndex(4)
-            elif frame_limit_level == "144":
-                self.comboboxes[27].setCurrentIndex(5)
-            elif frame_limit_level == "240":
-                self.comboboxes[27].setCurrentIndex(6)
-        elif frame_limit_enable == "Enable (D3D9)":
-            self.comboboxes[26].setCurrentIndex(2) # Enable (D3D9)
-            # Set Frame Limit Level D3D9
-            if frame_limit_level_d3d9 == None:
-                self.comboboxes[28].setCurrentIndex(0)
-            elif frame_limit_level_d3d9 == "30":
-                self.comboboxes[28].setCurrentIndex(1)
-            elif frame_limit_level_d3d9 == "60":
-                self.comboboxes[28].setCurrentIndex(2)
-            elif frame_limit_level_d3d9 == "75":
-                self.comboboxes[28].setCurrentIndex(3)
-            elif frame_limit_level_d3d9 == "120":
-                self.comboboxes[28].setCurrentIndex(4)
-            elif frame_limit_level_d3d9 == "144":
-                self.comboboxes[28].setCurrentIndex(5)
-            elif frame_limit_level_d3d9 == "240":
-                self.comboboxes[28].setCurrentIndex(6)
-        elif frame_limit_enable == "Disable":
-            self.comboboxes[26].setCurrentIndex(3) # Disable
-            self.comboboxes[27].setCurrentIndex(0)
-            self.comboboxes[28].setCurrentIndex(0)
-        else:         
-            self.comboboxes[26].setCurrentIndex(0) # Not Selected
-            self.comboboxes[27].setCurrentIndex(0)
-            self.comboboxes[28].setCurrentIndex(0)
-
-        # Misc Settings
-        if hdr_enable == True:
-            self.comboboxes[29].setCurrentIndex(1) # Enable
-        elif hdr_enable == False:
-            self.comboboxes[29].setCurrentIndex(2) # Disable
-        else:
-            self.comboboxes[29].setCurrentIndex(0) # Not Selected
-
-        if d3d_level != None:
-            # Set D3D Level
-            if d3d_level == "Direct X 9.1":
-                self.comboboxes[30].setCurrentIndex(1)
-            elif d3d_level == "Direct X 9.2":
-                self.comboboxes[30].setCurrentIndex(2)
-            elif d3d_level == "Direct X 9.3":
-                self.comboboxes[30].setCurrentIndex(3)
-            elif d3d_level == "Direct X 10.0":
-                self.comboboxes[30].setCurrentIndex(4)
-            elif d3d_level == "Direct X 10.1":
-                self.comboboxes[30].setCurrentIndex(5)
-            elif d3d_level == "Direct X 11.0":
-                self.comboboxes[30].setCurrentIndex(6)
-            elif d3d_level == "Direct X 11.1":
-                self.comboboxes[30].setCurrentIndex(7)
-            elif d3d_level == "Direct X 12.0":
-                self.comboboxes[30].setCurrentIndex(8)
-            elif d3d_level == "Direct X 12.1":
-                self.comboboxes[30].setCurrentIndex(9)
+        try:
+            indices, unknown = self._conf_handler.import_conf(app_path)
+        except OSError as error:
+            QMessageBox.warning(self, "Config Files Not Imported", f'<p>The configuration files could not be read:</p>\n\n<p style="font-style: italic; color: red;">{error}</p>')
+            return
+        if indices is None:
+            QMessageBox.warning(self, "No Config Files Found", f'No vkBasalt.conf or dxvk.conf was found next to <span style="font-weight: bold; color: CornflowerBlue;">{app_name}</span>.')
+            return
+
+        if unknown:
+            unknown_values: str = "<br>".join(f"{key}: {value!r}" for key, value in unknown)
+            QMessageBox.warning(self, "Unknown Config Values", f'<p>These config file values cannot be represented by the settings and have not been imported;</p>\n\n<p style="font-style: italic; color: red;">{unknown_values}</p>')
+
+        # Not marked clean, so saving stores every imported setting
+        self.apply_option_indices(indices)
+
+        QMessageBox.information(self, "Config Files Imported!", f'The existing configuration files of <span style="font-weight: bold; color: CornflowerBlue;">{app_name}</span> have been imported. Save the settings to keep them.')
+
+    # ------------------------------------------------------------------------------ #
+    # Profile layers                                                                 #
+    # ------------------------------------------------------------------------------ #
+    def selected_layer_gapi(self) -> str:
+        """
+        Gets the graphics API of the profile layer selected in the profile layer combobox.
+
+        Args:
+            None
+
+        Returns:
+            str: Graphics API, None for the global profile.
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> gapi: str = selected_layer_gapi()
+        """
+        layer_index: int = self.profile_layer_combobox.currentIndex()
+        return ProfileLayers.GAPIS[layer_index - 2] if layer_index > 1 else None
+
+    def load_profile_layer(self, 
+                           gapi: str) -> None:
+        """
+        Loads a profile layer into the settings panel.
+
+        Args:
+            gapi (str): Graphics API of the layer, None for the global profile.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> load_profile_layer("DirectX 9")
+        """
+        layers: ProfileLayers = self._json_handler.get_profile_layers()
+        self.apply_option_indices(SettingsCode.indices(layers.layer_code(gapi)))
+        self.mark_clean()
+
+        QMessageBox.information(self, "Profile Loaded!", f'The <span style="font-weight: bold; color: CornflowerBlue;">{self.profile_layer_combobox.currentText()}</span> has been loaded.')
+
+    def save_profile_layer(self, 
+                           gapi: str) -> None:
+        """
+        Saves the current settings as a profile layer, then rewrites the configuration files of only the saved
+        applications whose effective settings changed.
+
+        Args:
+            gapi (str): Graphics API of the layer, None for the global profile.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> save_profile_layer(None)
+        """
+        affected: list = self._json_handler.set_profile_layer(gapi, self.get_combobox_values())
+        self.mark_clean()
+        report: dict = {}
+        failures: dict = self._conf_handler.save_conf_many(affected, report)
+        files_note: str = f'<p>Configuration files: {AppConfHandler.summarise_report(report)}.</p>'
+
+        layer_name: str = self.profile_layer_combobox.currentText()
+        if failures:
+            failed: str = "<br>".join(f"{path}: {error}" for path, error in failures.items())
+            QMessageBox.warning(self, "Profile Saved With Errors", f'<p>The {layer_name} has been saved, but configuration files could not be written for {len(failures)} of {len(affected)} affected applications:</p>\n\n<p style="font-style: italic; color: red;">{failed}</p>\n\n{files_note}')
         else:
-            self.comboboxes[30].setCurrentIndex(0) # Not Selected
-            
-        QMessageBox.information(self, "Application Settings Loaded!", f'Application settings have been loaded successfully from the internal database for <span style="font-weight: bold; color: CornflowerBlue;">{app_name}</span>.')
\ No newline at end of file
+            QMessageBox.information(self, "Profile Saved!", f'<p>The {layer_name} has been saved. Configuration files were deployed for the {len(affected)} applications whose settings it changed.</p>\n\n{files_note}')
+
+    # ------------------------------------------------------------------------------ #
+    # Share settings as a profile code                                               #
+    # ------------------------------------------------------------------------------ #
+    def share_profile_code(self) -> None:
+        """
+        Shows the profile code of the current combobox values for copying, and applies a code pasted in its place.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> share_profile_code()
+        """
+        current_code: str = SettingsCode.to_text(SettingsCode.encode(self.get_combobox_values()))
+
+        text, accepted = QInputDialog.getText(self, "Profile Code", "Copy this code to share the current settings, or paste a code to apply it:", text=current_code)
+        if not accepted or text.strip() == current_code:
+            return
+
+        try:
+            indices: tuple = SettingsCode.indices(SettingsCode.from_text(text))
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Profile Code", f'<p>The profile code could not be read:</p>\n\n<p style="font-style: italic; color: red;">{text}</p>')
+            return
+
+        # Select each setting's option from the code.
+        self.apply_option_indices(indices)
@@ -0,0 +1,215 @@
+"""
+File       : settings_record.py
+Author     : Fluffy Flower (Martin Wylde)
+Contact    :
+    Email   - martincw1989@gmail.com
+    Telegram- @FluffyFlower
+    Discord - fluffy_flower
+Date       : 18/10/2026
+Version    : 0.0.1
+Description: Immutable, slotted record of one application's graphics settings, shared by the settings panel, the JSON
+             database and the config file writer in place of the old 31 value positional list.
+"""
+
+# ------------------------------------------------------ #
+#                                                        #
+# ██████                                                 #
+#   ██    ██  ██  ████    ██████    ████    ██      ████ #
+#   ██    ██████  ██  ██  ██  ██  ██      ██████    ██   #
+#   ██    ██████  ██████  ██  ██  ██        ██      ██   #
+# ██████  ██  ██  ██      ██████  ██        ████  ████   #
+#                                                        #
+# ------------------------------------------------------ #
+from operator import attrgetter
+from Window.Settings.registry import SettingsRegistry
+
+
+# -------------------------------------------------------------------------------------------------------------------- #
+#                                                                                                                      #
+# ██████                          ██                                    ██████                                      ██ #
+# ██        ████    ██      ██          ██████    ████    ████          ██  ██    ████    ████  ██████    ████      ██ #
+# ██████  ██  ██  ██████  ██████  ██    ██  ██  ██  ██    ██            ████    ██  ██  ██      ██  ██  ██        ████ #
+#     ██  ████      ██      ██    ██    ██  ██  ██████    ██            ██  ██  ████    ██      ██  ██  ██      ██  ██ #
+# ██████    ████    ████    ████  ████  ██  ██      ██  ████            ██  ██    ████    ████  ██████  ██      ██████ #
+#                                               ████                                                                   #
+# -------------------------------------------------------------------------------------------------------------------- #
+
+
+class SettingsRecord:
+    """
+    Settings of one application, one named slot per settings key of user_apps.json. Records are immutable, so they
+    can be compared, hashed, used as dictionary keys and shared between the GUI, the database and the config writer
+    without copying. Unsaved values are None.
+    """
+
+    # Settings keys of an app entry, in settings panel order. The slot names are the user_apps.json keys.
+    FIELDS: tuple = SettingsRegistry.KEYS
+
+    __slots__ = FIELDS + ("_hash",)
+
+    # Reads every field in one C level call, in FIELDS order.
+    _get_values = attrgetter(*FIELDS)
+
+    # --------------------------------------------------------------------------- #
+    # Class initialisation                                                        #
+    # --------------------------------------------------------------------------- #
+    def __init__(self, **values_input) -> None:
+        # Unpack inputs
+        values: dict = values_input
+
+        unknown: set = values.keys() - set(self.FIELDS)
+        if unknown:
+            raise TypeError(f"SettingsRecord got unknown settings keys: {', '.join(sorted(unknown))}")
+
+        for field in self.FIELDS:
+            object.__setattr__(self, field, values.get(field))
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"SettingsRecord is immutable, use replace({name}=...) instead")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("SettingsRecord is immutable")
+
+    # --------------------------------------------------------------------------- #
+    # Conversion                                                                  #
+    # --------------------------------------------------------------------------- #
+    @classmethod
+    def from_dict(cls,
+                  settings_input: dict) -> "SettingsRecord":
+        """
+        Builds a record from an app entry's settings dict, ignoring keys which are not settings (e.g. settings_set).
+
+        Args:
+            settings(dict): Settings dict of an app entry in user_apps.json.
+
+        Returns:
+            (SettingsRecord): Record holding the dict's settings values, missing keys as None.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> record: SettingsRecord = SettingsRecord.from_dict(app["settings"][0])
+        """
+        # Unpack inputs
+        settings: dict = settings_input
+
+        record: SettingsRecord = cls.__new__(cls)
+        for field in cls.FIELDS:
+            object.__setattr__(record, field, settings.get(field))
+        object.__setattr__(record, "_hash", None)
+        return record
+
+    def as_tuple(self) -> tuple:
+        """
+        Returns the settings values in FIELDS order.
+
+        Args:
+            None.
+
+        Returns:
+            (tuple): Settings values, one per field.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> values: tuple = record.as_tuple()
+        """
+        return self._get_values(self)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the record as a settings dict keyed as in user_apps.json.
+
+        Args:
+            None.
+
+        Returns:
+            (dict): Settings key -> value, for every field.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> settings.update(record.to_dict())
+        """
+        return dict(zip(self.FIELDS, self._get_values(self)))
+
+    def replace(self, **changes_input) -> "SettingsRecord":
+        """
+        Returns a copy of the record with the given fields changed.
+
+        Args:
+            **changes: Settings key -> new value.
+
+        Returns:
+            (SettingsRecord): New record, this one is left unchanged.
+
+        Raises:
+            TypeError: If a key is not a settings field.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> no_hdr: SettingsRecord = record.replace(hdr_enable=False)
+        """
+        # Unpack inputs
+        changes: dict = changes_input
+
+        return SettingsRecord(**dict(self.to_dict(), **changes))
+
+    # --------------------------------------------------------------------------- #
+    # Comparison                                                                  #
+    # --------------------------------------------------------------------------- #
+    def diff(self,
+             other_input: "SettingsRecord") -> tuple:
+        """
+        Names the fields whose values differ between this record and another.
+
+        Args:
+            other(SettingsRecord): Record to compare against.
+
+        Returns:
+            (tuple): Differing field names, in FIELDS order. Empty if the records are equal.
+
+        Raises:
+            None.
+
+        Examples:
+            Default usage:
+                .. code-block:: python
+                >>> changed: tuple = saved_record.diff(gui_record) # e.g. ("cas_enable", "cas_level")
+        """
+        # Unpack inputs
+        other: SettingsRecord = other_input
+
+        if self is other:
+            return ()
+        return tuple(field for field, mine, theirs in zip(self.FIELDS, self._get_values(self), self._get_values(other)) if mine != theirs)
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, SettingsRecord):
+            return NotImplemented
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return self._get_values(self) == self._get_values(other)
+
+    def __hash__(self) -> int:
+        # Computed on first use; the record cannot change afterwards.
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash(self._get_values(self)))
+        return self._hash
+
+    def __repr__(self) -> str:
+        values: str = ", ".join(f"{field}={value!r}" for field, value in zip(self.FIELDS, self._get_values(self)) if value is not None)
+        return f"SettingsRecord({values})"